@@ -1,3 +1,3 @@
-from .settings import Config
+from .settings import Config, get_settings
 
-__all__ = ["Config"]
+__all__ = ["Config", "get_settings"]
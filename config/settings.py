@@ -1,11 +1,19 @@
+from functools import lru_cache
 from typing import List, Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
 
 class Config(BaseSettings):
     """Application configuration settings."""
 
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
+
     # LLM Settings
     openai_api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
     anthropic_api_key: Optional[str] = Field(default=None, alias="ANTHROPIC_API_KEY")
@@ -27,7 +35,12 @@ class Config(BaseSettings):
     log_level: str = Field(default="INFO", description="Logging level")
     log_judge_reasoning: bool = Field(default=True, description="Log Judge reasoning process")
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        extra = "ignore"
+
+@lru_cache(maxsize=1)
+def get_settings() -> Config:
+    """프로세스 전체에서 공유하는 Config 인스턴스를 반환.
+
+    `.env` 파싱과 검증은 최초 호출 시 한 번만 수행됩니다.
+    설정을 다시 읽어야 하는 경우(테스트 등) `get_settings.cache_clear()`를 호출합니다.
+    """
+    return Config()
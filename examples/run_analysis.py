@@ -5,21 +5,12 @@
 
 import sys
 import os
-from src.logging_config import setup_logging
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src import TextAnalyzer
-
-
-# 로깅 설정
-setup_logging(                                                                                             
-      level="DEBUG",           # or "INFO" for less verbose                                                  
-      debug_mode=True,         # Enables detailed format with file:line                                      
-      enable_color=True,       # Colored output                                                              
-      log_file="logs/analysis.log"  # Optional: also save to file                                            
-  )    
+from src.logging_config import setup_logging
 
 
 def example_1_normal_text(analyzer: TextAnalyzer):
@@ -147,6 +138,15 @@ def example_6_save_report(analyzer: TextAnalyzer):
 
 
 if __name__ == "__main__":
+    # 로깅 설정 (import 시에는 핸들러/로그 파일을 만들지 않도록 실행 시점에만 구성)
+    os.makedirs("logs", exist_ok=True)
+    setup_logging(
+        level="INFO",                 # 상세 로그가 필요하면 "DEBUG"
+        debug_mode=False,             # True면 file:line 포함 상세 포맷
+        enable_color=True,            # 컬러 출력
+        log_file="logs/analysis.log"  # 선택: 파일에도 저장
+    )
+
     print("텍스트 분석 에이전트 예제")
     print("=" * 60)
 
@@ -166,9 +166,8 @@ if __name__ == "__main__":
     example_2_short_text(analyzer)
     # example_3_forbidden_keywords(analyzer)
     #
-    # # Example 4는 early_exit_on_critical=True가 필요한 경우 별도 analyzer 사용
-    # analyzer_with_early_exit = TextAnalyzer(use_llm_judge=True, early_exit_on_critical=True)
-    # example_4_early_exit(analyzer_with_early_exit)
+    # # Example 4는 early_exit_on_critical=True(기본값)인 위 analyzer를 그대로 재사용
+    # example_4_early_exit(analyzer)
     #
     # example_5_custom_settings(analyzer)
     # example_6_save_report(analyzer)
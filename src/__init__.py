@@ -1,43 +1,101 @@
 """Text Analysis Agent System."""
 
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 __version__ = "0.1.0"
 
-from .main import TextAnalyzer
-from .models import (
-    PlanStep,
-    Plan,
-    StepResult,
-    JudgmentResult,
-    ExecutionResult,
-    AnalysisReport,
-)
-from .algorithms import BaseAlgorithm, LengthCheckAlgorithm, KeywordCheckAlgorithm
-from .registry import AlgorithmRegistry
-from .planner import Planner
-from .judge import ReactJudge, MockReactJudge
-from .executor import Executor
-from .reporter import Reporter
-from .exceptions import (
-    TextAnalyzerError,
-    AlgorithmError,
-    AlgorithmNotFoundError,
-    AlgorithmExecutionError,
-    AlgorithmRegistrationError,
-    JudgeError,
-    JudgeEvaluationError,
-    JudgeResponseParseError,
-    LLMError,
-    LLMConnectionError,
-    LLMTimeoutError,
-    LLMRateLimitError,
-    CriteriaError,
-    CriteriaNotFoundError,
-    PlanError,
-    InvalidPlanError,
-    ExecutionError,
-    StepExecutionError,
-    InputValidationError,
-)
+# 공개 이름 -> 정의된 하위 모듈. 실제 import는 최초 접근 시점에 수행 (PEP 562)
+_LAZY_ATTRS: Dict[str, str] = {
+    "TextAnalyzer": ".main",
+    "PlanStep": ".models",
+    "Plan": ".models",
+    "StepResult": ".models",
+    "JudgmentResult": ".models",
+    "ExecutionResult": ".models",
+    "AnalysisReport": ".models",
+    "BaseAlgorithm": ".algorithms",
+    "LengthCheckAlgorithm": ".algorithms",
+    "KeywordCheckAlgorithm": ".algorithms",
+    "AlgorithmRegistry": ".registry",
+    "Planner": ".planner",
+    "ReactJudge": ".judge",
+    "MockReactJudge": ".judge",
+    "Executor": ".executor",
+    "Reporter": ".reporter",
+    # Exceptions
+    "TextAnalyzerError": ".exceptions",
+    "AlgorithmError": ".exceptions",
+    "AlgorithmNotFoundError": ".exceptions",
+    "AlgorithmExecutionError": ".exceptions",
+    "AlgorithmRegistrationError": ".exceptions",
+    "JudgeError": ".exceptions",
+    "JudgeEvaluationError": ".exceptions",
+    "JudgeResponseParseError": ".exceptions",
+    "LLMError": ".exceptions",
+    "LLMConnectionError": ".exceptions",
+    "LLMTimeoutError": ".exceptions",
+    "LLMRateLimitError": ".exceptions",
+    "CriteriaError": ".exceptions",
+    "CriteriaNotFoundError": ".exceptions",
+    "PlanError": ".exceptions",
+    "InvalidPlanError": ".exceptions",
+    "ExecutionError": ".exceptions",
+    "StepExecutionError": ".exceptions",
+    "InputValidationError": ".exceptions",
+}
+
+if TYPE_CHECKING:
+    from .main import TextAnalyzer
+    from .models import (
+        PlanStep,
+        Plan,
+        StepResult,
+        JudgmentResult,
+        ExecutionResult,
+        AnalysisReport,
+    )
+    from .algorithms import BaseAlgorithm, LengthCheckAlgorithm, KeywordCheckAlgorithm
+    from .registry import AlgorithmRegistry
+    from .planner import Planner
+    from .judge import ReactJudge, MockReactJudge
+    from .executor import Executor
+    from .reporter import Reporter
+    from .exceptions import (
+        TextAnalyzerError,
+        AlgorithmError,
+        AlgorithmNotFoundError,
+        AlgorithmExecutionError,
+        AlgorithmRegistrationError,
+        JudgeError,
+        JudgeEvaluationError,
+        JudgeResponseParseError,
+        LLMError,
+        LLMConnectionError,
+        LLMTimeoutError,
+        LLMRateLimitError,
+        CriteriaError,
+        CriteriaNotFoundError,
+        PlanError,
+        InvalidPlanError,
+        ExecutionError,
+        StepExecutionError,
+        InputValidationError,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # 이후 접근은 일반 모듈 속성 조회
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
+
 
 __all__ = [
     "TextAnalyzer",
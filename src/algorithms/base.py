@@ -8,6 +8,17 @@ class BaseAlgorithm(ABC):
     모든 분석 알고리즘은 이 클래스를 상속받아 구현해야 합니다.
     """
 
+    # 하위 클래스가 __slots__를 선언하면 인스턴스 __dict__ 없이 동작하도록 비워 둠
+    __slots__ = ()
+
+    # True이면 Judge가 통과/실패(APPROVE/REJECT)만 판단하는 단일 호출 경로를 사용
+    binary_verdict = False
+
+    # 상대적인 실행 비용 (작을수록 먼저 실행). 알고리즘 순서를 지정하지 않으면
+    # 비용이 낮은 알고리즘부터 실행해, 조기 종료 시 비싼 검사를 건너뛸 수 있게 함.
+    # 부수 효과가 없는 알고리즘만 순서를 바꿔도 결과가 같으므로 이 전제를 지켜야 함
+    cost_hint = 100
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -35,7 +46,8 @@ class BaseAlgorithm(ABC):
         """
         pass
 
-    def validate_input(self, text: str) -> bool:
+    @staticmethod
+    def validate_input(text: str) -> bool:
         """입력 텍스트의 유효성을 검증.
 
         Args:
@@ -44,4 +56,4 @@ class BaseAlgorithm(ABC):
         Returns:
             bool: 유효한 경우 True
         """
-        return text is not None and isinstance(text, str)
+        return isinstance(text, str)
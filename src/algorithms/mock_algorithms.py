@@ -1,13 +1,70 @@
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, FrozenSet, List, Tuple, Union
 from .base import BaseAlgorithm
 
 
+# UTF-8 연속 바이트(0b10xxxxxx). 이를 제외한 바이트 수가 곧 코드 포인트 수
+_UTF8_CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+
+
+# 불변 튜플로 두어 기본 목록이 실수로 변경되거나 인스턴스 간에 오염되지 않도록 함
+_DEFAULT_FORBIDDEN_KEYWORDS: Tuple[str, ...] = (
+    "욕설",
+    "비속어",
+    "금지어",
+    "스팸",
+    "광고",
+)
+
+
+@lru_cache(maxsize=32)
+def _prepare_keywords(
+    keywords: Tuple[str, ...], case_sensitive: bool
+) -> Tuple[Tuple[Tuple[str, str], ...], FrozenSet[str], bool]:
+    """키워드 목록으로부터 검색에 필요한 값을 계산.
+
+    같은 키워드 구성으로 생성되는 인스턴스끼리 결과를 공유합니다.
+
+    Returns:
+        (search_keywords, distinct_keywords, fold_case) 튜플
+            - search_keywords: (원본 키워드, 검색용 키워드) 쌍
+            - distinct_keywords: 중복을 제거한 검색용 키워드
+            - fold_case: 텍스트를 lower()로 변환해야 하는지 여부
+    """
+    search_keywords = tuple(
+        (keyword, keyword if case_sensitive else keyword.lower())
+        for keyword in keywords
+    )
+    distinct_keywords = frozenset(k for _, k in search_keywords)
+    # 한글처럼 대소문자가 없는 키워드만 있으면 텍스트 전체를 lower()로 복사할 필요가 없음
+    fold_case = not case_sensitive and any(
+        keyword.lower() != keyword.upper() for keyword in distinct_keywords
+    )
+    return search_keywords, distinct_keywords, fold_case
+
+
+def _folded_offsets(text: str) -> List[int]:
+    """text.lower()의 각 위치가 원문의 몇 번째 문자에서 왔는지 반환.
+
+    lower()는 일부 문자를 여러 문자로 바꾸므로(예: 'İ' -> 'i̇') 길이가 달라진
+    경우에만 사용합니다.
+    """
+    offsets: List[int] = []
+    for index, char in enumerate(text):
+        offsets.extend([index] * len(char.lower()))
+    return offsets
+
+
 class LengthCheckAlgorithm(BaseAlgorithm):
     """텍스트 길이를 체크하는 알고리즘.
 
     텍스트의 길이가 지정된 범위 내에 있는지 검사합니다.
     """
 
+    __slots__ = ("min_length", "max_length", "_description")
+
+    cost_hint = 1  # len() 한 번
+
     def __init__(self, min_length: int = 10, max_length: int = 10000):
         """
         Args:
@@ -16,6 +73,8 @@ class LengthCheckAlgorithm(BaseAlgorithm):
         """
         self.min_length = min_length
         self.max_length = max_length
+        # 설명은 생성 시점에 한 번만 만들어 둠
+        self._description = f"텍스트 길이가 {min_length}~{max_length}자 범위 내에 있는지 검사"
 
     @property
     def name(self) -> str:
@@ -23,11 +82,17 @@ class LengthCheckAlgorithm(BaseAlgorithm):
 
     @property
     def description(self) -> str:
-        return f"텍스트 길이가 {self.min_length}~{self.max_length}자 범위 내에 있는지 검사"
+        return self._description
 
-    def execute(self, text: str, **kwargs) -> Dict[str, Any]:
+    def execute(self, text: Union[str, bytes], **kwargs) -> Dict[str, Any]:
         """텍스트 길이를 검사.
 
+        UTF-8로 인코딩된 bytes도 받으며, 디코딩 없이 문자 수를 계산합니다.
+
+        Args:
+            text: 검사할 텍스트
+            **kwargs: min_length, max_length를 전달하면 인스턴스 설정 대신 사용
+
         Returns:
             Dict containing:
                 - raw_result: 텍스트 길이
@@ -36,27 +101,39 @@ class LengthCheckAlgorithm(BaseAlgorithm):
                 - max_length: 설정된 최대 길이
                 - length_diff: 범위와의 차이 (범위 내면 0)
         """
-        if not self.validate_input(text):
+        if isinstance(text, str):
+            length = len(text)
+        elif isinstance(text, (bytes, bytearray)):
+            length = len(text.translate(None, _UTF8_CONTINUATION_BYTES))
+        else:
             return {
                 "raw_result": 0,
                 "is_within_range": False,
                 "error": "Invalid input text"
             }
 
-        length = len(text)
-        is_within_range = self.min_length <= length <= self.max_length
-
-        length_diff = 0
-        if length < self.min_length:
-            length_diff = self.min_length - length
-        elif length > self.max_length:
-            length_diff = length - self.max_length
+        if kwargs:
+            min_length = kwargs.get("min_length", self.min_length)
+            max_length = kwargs.get("max_length", self.max_length)
+        else:
+            min_length = self.min_length
+            max_length = self.max_length
+
+        if length < min_length:
+            is_within_range = False
+            length_diff = min_length - length
+        elif length > max_length:
+            is_within_range = False
+            length_diff = length - max_length
+        else:
+            is_within_range = True
+            length_diff = 0
 
         return {
             "raw_result": length,
             "is_within_range": is_within_range,
-            "min_length": self.min_length,
-            "max_length": self.max_length,
+            "min_length": min_length,
+            "max_length": max_length,
             "length_diff": length_diff
         }
 
@@ -67,13 +144,17 @@ class KeywordCheckAlgorithm(BaseAlgorithm):
     텍스트에 금지된 키워드가 포함되어 있는지 검사합니다.
     """
 
-    DEFAULT_FORBIDDEN_KEYWORDS: List[str] = [
-        "욕설",
-        "비속어",
-        "금지어",
-        "스팸",
-        "광고",
-    ]
+    __slots__ = (
+        "forbidden_keywords",
+        "case_sensitive",
+        "_search_keywords",
+        "_distinct_keywords",
+        "_fold_case",
+    )
+
+    cost_hint = 10  # 텍스트 전체 스캔
+
+    DEFAULT_FORBIDDEN_KEYWORDS: ClassVar[Tuple[str, ...]] = _DEFAULT_FORBIDDEN_KEYWORDS
 
     def __init__(self, forbidden_keywords: List[str] = None, case_sensitive: bool = False):
         """
@@ -81,8 +162,13 @@ class KeywordCheckAlgorithm(BaseAlgorithm):
             forbidden_keywords: 금지 키워드 목록 (None이면 기본 목록 사용)
             case_sensitive: 대소문자 구분 여부 (기본값: False)
         """
-        self.forbidden_keywords = forbidden_keywords or self.DEFAULT_FORBIDDEN_KEYWORDS
+        self.forbidden_keywords = (
+            tuple(forbidden_keywords) if forbidden_keywords else _DEFAULT_FORBIDDEN_KEYWORDS
+        )
         self.case_sensitive = case_sensitive
+        self._search_keywords, self._distinct_keywords, self._fold_case = _prepare_keywords(
+            self.forbidden_keywords, case_sensitive
+        )
 
     @property
     def name(self) -> str:
@@ -102,33 +188,49 @@ class KeywordCheckAlgorithm(BaseAlgorithm):
                 - keyword_count: 발견된 키워드 수
                 - keyword_positions: 각 키워드의 발견 위치
         """
-        if not self.validate_input(text):
+        if not isinstance(text, str):
             return {
                 "raw_result": [],
                 "has_forbidden_keywords": False,
                 "error": "Invalid input text"
             }
 
-        search_text = text if self.case_sensitive else text.lower()
-        found_keywords = []
-        keyword_positions = {}
+        search_text = text.lower() if self._fold_case else text
+        positions: Dict[str, List[int]] = {}
+        for search_keyword in self._distinct_keywords:
+            # str.find의 C 레벨 탐색이 정규식 alternation보다 빠르므로 키워드별로 스캔
+            pos = search_text.find(search_keyword)
+            if pos == -1:
+                continue
+            found = positions[search_keyword] = []
+            while pos != -1:
+                found.append(pos)
+                pos = search_text.find(search_keyword, pos + 1)
+
+        if positions and len(search_text) != len(text):
+            # 위치는 lower()한 텍스트 기준이므로 원문 기준으로 변환
+            offsets = _folded_offsets(text)
+            positions = {
+                keyword: [offsets[pos] for pos in found]
+                for keyword, found in positions.items()
+            }
 
-        for keyword in self.forbidden_keywords:
-            search_keyword = keyword if self.case_sensitive else keyword.lower()
-            position = search_text.find(search_keyword)
+        if not positions:
+            # 호출자가 결과를 수정해도 다른 결과에 영향이 없도록 빈 컨테이너는 매번 새로 생성
+            return {
+                "raw_result": [],
+                "has_forbidden_keywords": False,
+                "keyword_count": 0,
+                "keyword_positions": {},
+                "checked_keywords": self.forbidden_keywords
+            }
 
-            if position != -1:
+        found_keywords = []
+        keyword_positions = {}
+        for keyword, search_keyword in self._search_keywords:
+            if search_keyword in positions:
                 found_keywords.append(keyword)
-                # 모든 출현 위치 찾기
-                positions = []
-                start = 0
-                while True:
-                    pos = search_text.find(search_keyword, start)
-                    if pos == -1:
-                        break
-                    positions.append(pos)
-                    start = pos + 1
-                keyword_positions[keyword] = positions
+                keyword_positions[keyword] = positions[search_keyword]
 
         return {
             "raw_result": found_keywords,
@@ -4,7 +4,8 @@ import sys
 import click
 from pathlib import Path
 
-from .main import TextAnalyzer
+from .criteria_index import get_criteria, list_criteria
+from .exceptions import CriteriaNotFoundError
 from .logging_config import setup_logging, create_log_file_path
 
 
@@ -117,7 +118,9 @@ def analyze(text, file, output, use_llm, provider, model, no_early_exit, verbose
         click.echo(f"조기 종료: {'비활성화' if no_early_exit else '활성화'}")
         click.echo("-" * 40)
 
-    # TextAnalyzer 초기화
+    # TextAnalyzer 초기화 (LLM 스택 import 비용은 analyze/algorithms 명령에서만 지불)
+    from .main import TextAnalyzer
+
     try:
         analyzer = TextAnalyzer(
             use_llm_judge=use_llm,
@@ -152,6 +155,8 @@ def analyze(text, file, output, use_llm, provider, model, no_early_exit, verbose
 @cli.command()
 def algorithms():
     """등록된 알고리즘 목록을 출력합니다."""
+    from .main import TextAnalyzer
+
     analyzer = TextAnalyzer()
     algos = analyzer.get_registered_algorithms()
 
@@ -168,14 +173,12 @@ def criteria(algorithm_name):
 
     ALGORITHM_NAME: 알고리즘 이름 (예: length_check, keyword_check)
     """
-    analyzer = TextAnalyzer()
-
     try:
-        doc = analyzer.registry.get_criteria_document(algorithm_name)
+        doc = get_criteria(algorithm_name)
         click.echo(doc)
-    except FileNotFoundError:
+    except CriteriaNotFoundError:
         click.echo(f"오류: '{algorithm_name}' 알고리즘의 판단 기준 문서를 찾을 수 없습니다.", err=True)
-        click.echo(f"사용 가능한 알고리즘: {', '.join(analyzer.get_registered_algorithms())}", err=True)
+        click.echo(f"사용 가능한 알고리즘: {', '.join(list_criteria())}", err=True)
         sys.exit(1)
 
 
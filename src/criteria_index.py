@@ -0,0 +1,70 @@
+"""판단 기준 문서 인덱스.
+
+문서 목록은 디렉토리 스캔만으로 만들고, 문서 내용은 요청 시점에 읽어
+프로세스 단위로 캐싱합니다. 캐시는 조회할 때마다 파일 mtime으로 재검증하므로
+문서를 수정하면 다음 조회부터 새 내용이 반영됩니다.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .exceptions import CriteriaNotFoundError
+
+
+DEFAULT_CRITERIA_PATH = "src/criteria"
+CRITERIA_SUFFIX = ".md"
+
+# 절대 경로 -> (mtime_ns, 문서 내용)
+_documents: Dict[str, Tuple[int, str]] = {}
+
+
+def list_criteria(criteria_path: str = DEFAULT_CRITERIA_PATH) -> List[str]:
+    """판단 기준 문서가 존재하는 알고리즘 이름 목록을 반환.
+
+    Args:
+        criteria_path: 판단 기준 문서 디렉토리
+
+    Returns:
+        알고리즘 이름 목록 (정렬됨)
+    """
+    directory = Path(criteria_path)
+    if not directory.is_dir():
+        return []
+    return sorted(p.stem for p in directory.glob(f"*{CRITERIA_SUFFIX}"))
+
+
+def get_criteria(algorithm_name: str, criteria_path: str = DEFAULT_CRITERIA_PATH) -> str:
+    """알고리즘의 판단 기준 문서를 반환.
+
+    Args:
+        algorithm_name: 알고리즘 이름
+        criteria_path: 판단 기준 문서 디렉토리
+
+    Returns:
+        판단 기준 문서 내용 (Markdown)
+
+    Raises:
+        CriteriaNotFoundError: 판단 기준 문서가 없는 경우
+    """
+    criteria_file = Path(criteria_path) / f"{algorithm_name}{CRITERIA_SUFFIX}"
+    key = os.path.abspath(criteria_file)
+
+    try:
+        mtime = os.stat(key).st_mtime_ns
+    except OSError:
+        _documents.pop(key, None)
+        raise CriteriaNotFoundError(algorithm_name, str(criteria_file))
+
+    cached = _documents.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    content = criteria_file.read_text(encoding="utf-8")
+    _documents[key] = (mtime, content)
+    return content
+
+
+def clear_cache() -> None:
+    """캐시된 문서 내용을 모두 제거합니다 (테스트용)."""
+    _documents.clear()
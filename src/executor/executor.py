@@ -1,5 +1,7 @@
+import asyncio
 import logging
-from typing import Union, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, Optional, List, Set
 
 from ..models import Plan, PlanStep, StepResult, ExecutionResult, JudgmentResult
 from ..registry import AlgorithmRegistry
@@ -22,14 +24,27 @@ from ..logging_config import (
 
 logger = get_logger("executor")
 
+# Judge에 전달할 오류 메시지의 최대 길이
+_ERROR_SUMMARY_LIMIT = 200
+
+
+def _error_summary(error: Exception) -> str:
+    """예외 메시지의 첫 줄을 최대 _ERROR_SUMMARY_LIMIT자로 잘라 반환."""
+    lines = str(error).splitlines()
+    return lines[0][:_ERROR_SUMMARY_LIMIT] if lines else ""
+
 
 class Executor:
     """Plan에 따라 알고리즘을 순차 실행하는 Executor.
 
     각 알고리즘 실행 후 Judge를 호출하여 결과를 판단하고,
-    심각한 문제 발견 시 조기 종료합니다.
+    심각한 문제 발견 시 조기 종료합니다. 조기 종료를 끄면 서로 의존하지 않는
+    스텝들을 동시에 실행합니다.
     """
 
+    # 조기 종료가 꺼져 있을 때 동시에 실행할 최대 스텝 수
+    MAX_CONCURRENT_STEPS = 4
+
     def __init__(
         self,
         registry: AlgorithmRegistry,
@@ -63,6 +78,9 @@ class Executor:
         text_length = plan.metadata.get("text_length", 0)
         log_execution_start(text_length, len(execution_order))
 
+        if not self.early_exit_on_critical and len(execution_order) > 1:
+            return self._execute_all(plan, execution_order)
+
         for step in execution_order:
             log_step_start(step.step_id, step.algorithm_name)
 
@@ -70,34 +88,161 @@ class Executor:
             step_result = self._execute_step(step)
             step_results.append(step_result)
 
-            # 판단 결과 확인
-            judgment = step_result.judgment
+            if self._log_step_result(step_result):
+                stopped_at = step
+                status = "problem_found"
+                break
 
-            # Judge reasoning 로그
-            log_judge_reasoning(
-                step.algorithm_name,
-                judgment.reasoning,
-                judgment.summary
-            )
+        return self._finish(plan, step_results, status, stopped_at, len(execution_order))
 
-            log_step_end(
-                step.step_id,
-                step.algorithm_name,
-                judgment.has_problem,
-                judgment.severity
-            )
+    def _execute_all(self, plan: Plan, execution_order: List[PlanStep]) -> ExecutionResult:
+        """조기 종료 없이 모든 스텝을 실행하되, 서로 의존하지 않는 스텝은 동시에 실행.
+
+        execute_async와 같이 _layer_steps로 depends_on을 지키는 단계를 나누고,
+        같은 단계의 스텝은 스레드 풀에서 동시에 실행해 Judge의 LLM 호출 대기
+        시간을 겹칩니다. 결과와 로그는 단계 순서대로 정리합니다.
+
+        Args:
+            plan: 실행할 계획
+            execution_order: 실행 순서로 정렬된 스텝 목록
+
+        Returns:
+            ExecutionResult: 실행 결과
+        """
+        step_results: List[StepResult] = []
+        layers = self._layer_steps(execution_order)
+        max_workers = min(max(len(layer) for layer in layers), self.MAX_CONCURRENT_STEPS)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for layer in layers:
+                for step in layer:
+                    log_step_start(step.step_id, step.algorithm_name)
+
+                layer_results = list(pool.map(self._execute_step, layer))
+
+                for step_result in layer_results:
+                    step_results.append(step_result)
+                    self._log_step_result(step_result)
+
+        return self._finish(plan, step_results, "all_passed", None, len(execution_order))
+
+    async def execute_async(self, plan: Plan) -> ExecutionResult:
+        """Plan을 실행하되, 서로 의존하지 않는 스텝은 동시에 실행.
+
+        depends_on으로 스텝을 위상 정렬된 단계(layer)로 나누고, 같은 단계의
+        스텝은 스레드 풀에서 동시에 실행해 Judge의 LLM 호출 대기 시간을 겹칩니다.
+        조기 종료 여부는 각 단계가 끝난 뒤 확인합니다.
+
+        Args:
+            plan: 실행할 계획
+
+        Returns:
+            ExecutionResult: 실행 결과
+        """
+        step_results: List[StepResult] = []
+        stopped_at: Optional[PlanStep] = None
+        status = "all_passed"
 
-            if judgment.has_problem:
-                if judgment.severity == "critical" and self.early_exit_on_critical:
-                    log_early_exit(
-                        step.step_id,
-                        step.algorithm_name,
-                        judgment.summary
-                    )
-                    stopped_at = step
+        execution_order = plan.get_execution_order()
+        text_length = plan.metadata.get("text_length", 0)
+        log_execution_start(text_length, len(execution_order))
+
+        loop = asyncio.get_running_loop()
+        for layer in self._layer_steps(execution_order):
+            for step in layer:
+                log_step_start(step.step_id, step.algorithm_name)
+
+            layer_results = await asyncio.gather(*(
+                loop.run_in_executor(None, self._execute_step, step) for step in layer
+            ))
+
+            for step_result in layer_results:
+                step_results.append(step_result)
+                if self._log_step_result(step_result) and stopped_at is None:
+                    stopped_at = step_result.step
                     status = "problem_found"
-                    break
 
+            if stopped_at is not None:
+                break
+
+        return self._finish(plan, step_results, status, stopped_at, len(execution_order))
+
+    @staticmethod
+    def _layer_steps(steps: List[PlanStep]) -> List[List[PlanStep]]:
+        """의존성에 따라 스텝을 동시에 실행 가능한 단계로 나눔.
+
+        계획에 없는 step_id에 대한 의존성은 무시합니다. 순환 의존이 있으면
+        남은 스텝 중 첫 번째를 단독 단계로 실행해 진행을 보장합니다.
+
+        Args:
+            steps: 실행 순서로 정렬된 스텝 목록
+
+        Returns:
+            단계별 스텝 목록 (각 단계 내부는 입력 순서 유지)
+        """
+        step_ids = {step.step_id for step in steps}
+        done: Set[int] = set()
+        remaining = list(steps)
+        layers: List[List[PlanStep]] = []
+
+        while remaining:
+            layer = [
+                step for step in remaining
+                if all(dep in done or dep not in step_ids for dep in step.depends_on)
+            ]
+            if not layer:
+                layer = [remaining[0]]
+            layers.append(layer)
+            done.update(step.step_id for step in layer)
+            remaining = [step for step in remaining if step.step_id not in done]
+
+        return layers
+
+    def _log_step_result(self, step_result: StepResult) -> bool:
+        """스텝 결과를 로그로 남기고 조기 종료 여부를 반환.
+
+        Args:
+            step_result: 스텝 실행 결과
+
+        Returns:
+            critical 판정으로 조기 종료해야 하면 True
+        """
+        step = step_result.step
+        judgment = step_result.judgment
+
+        # Judge reasoning 로그
+        log_judge_reasoning(
+            step.algorithm_name,
+            judgment.reasoning,
+            judgment.summary
+        )
+
+        log_step_end(
+            step.step_id,
+            step.algorithm_name,
+            judgment.has_problem,
+            judgment.severity
+        )
+
+        if judgment.has_problem:
+            if judgment.severity == "critical" and self.early_exit_on_critical:
+                log_early_exit(
+                    step.step_id,
+                    step.algorithm_name,
+                    judgment.summary
+                )
+                return True
+        return False
+
+    @staticmethod
+    def _finish(
+        plan: Plan,
+        step_results: List[StepResult],
+        status: str,
+        stopped_at: Optional[PlanStep],
+        total_steps: int
+    ) -> ExecutionResult:
+        """최종 상태를 확정하고 ExecutionResult를 생성."""
         # 모든 스텝 완료 후 문제 발견 여부 최종 확인
         if status == "all_passed":
             for result in step_results:
@@ -105,7 +250,7 @@ class Executor:
                     status = "problem_found"
                     break
 
-        log_execution_end(status, len(step_results), len(execution_order))
+        log_execution_end(status, len(step_results), total_steps)
 
         return ExecutionResult(
             plan=plan,
@@ -139,16 +284,34 @@ class Executor:
         except Exception as e:
             algorithm_error = AlgorithmExecutionError(step.algorithm_name, e)
             logger.error(f"Algorithm execution failed: {algorithm_error}")
+            # 전체 메시지는 위 로그에 남기고 Judge에는 첫 줄만 전달
             execution_result = {
                 "raw_result": None,
-                "error": str(e),
+                "error": _error_summary(e),
                 "error_type": type(e).__name__,
                 "success": False
             }
 
-        # Judge 호출
+        # 판단 기준 문서가 Judge 생략을 명시하면 호출하지 않음 (실행 오류는 Judge에 전달)
+        if algorithm_error is None and self.registry.is_judge_trivial(step.algorithm_name):
+            return StepResult(
+                step=step,
+                execution_result=execution_result,
+                judgment=JudgmentResult(
+                    algorithm_name=step.algorithm_name,
+                    has_problem=False,
+                    severity="none",
+                    reasoning="Criteria mark this algorithm as judge-skipped; evaluation skipped.",
+                    summary="No issues detected"
+                )
+            )
+
+        # Judge 호출 (이진 판단 알고리즘은 Judge가 지원하면 단일 호출 경로 사용)
+        evaluate = self.judge.evaluate
+        if getattr(algorithm, "binary_verdict", False) and hasattr(self.judge, "evaluate_binary"):
+            evaluate = self.judge.evaluate_binary
         try:
-            judgment = self.judge.evaluate(
+            judgment = evaluate(
                 algorithm_name=step.algorithm_name,
                 execution_result=execution_result
             )
@@ -0,0 +1,147 @@
+"""JSON 직렬화 헬퍼.
+
+orjson이 설치되어 있으면 C 구현을 사용하고, 없으면 표준 json 모듈로 동작합니다.
+두 경로 모두 공백 없는 구분자와 이스케이프하지 않은 UTF-8 문자로 출력합니다.
+"""
+
+import ast
+import json
+from typing import Any, Callable, List, Optional
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 (pip install .[speed])
+    orjson = None  # type: ignore[assignment]
+
+
+# orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스이므로 하나로 처리 가능
+JSONDecodeError = json.JSONDecodeError
+
+_COMPACT_SEPARATORS = (",", ":")
+
+
+
+def dumps_compact(
+    obj: Any,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None
+) -> str:
+    """객체를 공백 없는 JSON 문자열로 직렬화.
+
+    Args:
+        obj: 직렬화할 객체
+        sort_keys: 키 정렬 여부
+        default: 직렬화할 수 없는 객체 변환 함수
+
+    Returns:
+        JSON 문자열
+    """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_SORT_KEYS if sort_keys else 0
+            return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+        except TypeError:
+            # 문자열이 아닌 키, 64비트를 넘는 정수 등은 표준 json으로 처리
+            pass
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        separators=_COMPACT_SEPARATORS,
+        sort_keys=sort_keys,
+        default=default,
+    )
+
+
+def dumps_pretty(obj: Any) -> str:
+    """객체를 2칸 들여쓰기한 JSON 문자열로 직렬화 (리포트 출력용).
+
+    표준 json의 indent=2, ensure_ascii=False 출력과 같은 형식입니다.
+
+    Args:
+        obj: 직렬화할 객체
+
+    Returns:
+        JSON 문자열
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # 문자열이 아닌 키, 64비트를 넘는 정수 등은 표준 json으로 처리
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def loads(data: Any) -> Any:
+    """JSON 문자열을 파싱.
+
+    Raises:
+        JSONDecodeError: 유효한 JSON이 아닌 경우
+        TypeError: 문자열/바이트가 아닌 입력 (표준 json 경로)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _strip_trailing_commas(text: str) -> str:
+    """닫는 괄호 바로 앞의 쉼표를 제거 (문자열 리터럴 안의 내용은 그대로 둠).
+
+    큰따옴표/작은따옴표 문자열과 이스케이프를 건너뛰며 한 번만 훑습니다.
+    """
+    out: List[str] = []
+    quote = ""
+    escaped = False
+    n = len(text)
+    for i, ch in enumerate(text):
+        if quote:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == quote:
+                quote = ""
+        elif ch in "\"'":
+            quote = ch
+        elif ch == ",":
+            j = i + 1
+            while j < n and text[j].isspace():
+                j += 1
+            if j < n and text[j] in "}]":
+                continue
+        out.append(ch)
+    return "".join(out)
+
+
+def loads_lenient(text: str) -> Optional[Any]:
+    """LLM이 흔히 만드는 형식 오류를 보정해 JSON 객체/배열을 파싱.
+
+    코드 펜스(```json ... ```), 앞에 반복된 "Action Input:", 닫는 괄호 앞의
+    쉼표를 제거한 뒤 JSON으로, 실패하면 Python 리터럴(작은따옴표 등)로 파싱합니다.
+
+    Args:
+        text: 파싱할 문자열
+
+    Returns:
+        dict 또는 list (파싱할 수 없으면 None)
+    """
+    candidate = text.strip()
+    if candidate.startswith("```"):
+        candidate = candidate[3:]
+        if candidate.startswith("json"):
+            candidate = candidate[4:]
+        if candidate.rstrip().endswith("```"):
+            candidate = candidate.rstrip()[:-3]
+        candidate = candidate.strip()
+    if candidate.startswith("Action Input:"):
+        candidate = candidate[len("Action Input:"):].strip()
+    candidate = _strip_trailing_commas(candidate)
+
+    try:
+        value = loads(candidate)
+    except (JSONDecodeError, TypeError):
+        try:
+            value = ast.literal_eval(candidate)
+        except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+            return None
+    return value if isinstance(value, (dict, list)) else None
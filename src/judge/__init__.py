@@ -1,5 +1,7 @@
 from .react_judge import ReactJudge, MockReactJudge
 from .tools import JudgeTools, Tool, TOOLS_DESCRIPTION
+from .verdict_cache import JudgeCache
+from .ensemble import EnsembleJudge
 
 __all__ = [
     "ReactJudge",
@@ -7,4 +9,6 @@ __all__ = [
     "JudgeTools",
     "Tool",
     "TOOLS_DESCRIPTION",
+    "JudgeCache",
+    "EnsembleJudge",
 ]
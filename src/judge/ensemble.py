@@ -0,0 +1,119 @@
+"""여러 Judge의 판단을 다수결로 합치는 Ensemble Judge."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..models import JudgmentResult
+from ..registry import AlgorithmRegistry
+from ..logging_config import get_logger
+from .react_judge import ReactJudge
+from .verdict_cache import JudgeCache
+
+
+logger = get_logger("judge")
+
+_SEVERITY_RANK = {"none": 0, "warning": 1, "critical": 2}
+
+
+class EnsembleJudge:
+    """여러 Judge를 동시에 호출하고 다수결로 최종 판단을 내리는 Judge.
+
+    각 Judge는 스레드 풀에서 동시에 평가하므로 전체 대기 시간은 가장 느린
+    Judge의 응답 시간 수준입니다.
+    """
+
+    def __init__(self, judges: Sequence[Any]):
+        """
+        Args:
+            judges: evaluate(algorithm_name, execution_result)를 제공하는 Judge 목록
+        """
+        if not judges:
+            raise ValueError("EnsembleJudge requires at least one judge")
+        self.judges = list(judges)
+
+    @classmethod
+    def from_models(
+        cls,
+        registry: AlgorithmRegistry,
+        judge_models: Sequence[Tuple[str, str]],
+        verdict_cache: Optional[JudgeCache] = None,
+        **judge_kwargs: Any
+    ) -> "EnsembleJudge":
+        """(provider, model) 목록으로 ReactJudge들을 생성.
+
+        Args:
+            registry: 알고리즘 레지스트리
+            judge_models: (llm_provider, model_name) 튜플 목록
+            verdict_cache: 모든 Judge가 공유할 판단 결과 캐시 (키에 모델이 포함됨)
+            **judge_kwargs: ReactJudge에 전달할 추가 인자
+
+        Returns:
+            EnsembleJudge 인스턴스
+        """
+        return cls([
+            ReactJudge(
+                registry=registry,
+                llm_provider=provider,
+                model_name=model_name,
+                verdict_cache=verdict_cache,
+                **judge_kwargs
+            )
+            for provider, model_name in judge_models
+        ])
+
+    def evaluate(
+        self,
+        algorithm_name: str,
+        execution_result: Dict[str, Any]
+    ) -> JudgmentResult:
+        """모든 Judge로 평가한 뒤 다수결로 판단을 합침.
+
+        Args:
+            algorithm_name: 평가할 알고리즘 이름
+            execution_result: 알고리즘 실행 결과
+
+        Returns:
+            JudgmentResult: 합쳐진 판단 결과
+        """
+        if len(self.judges) == 1:
+            judgment: JudgmentResult = self.judges[0].evaluate(algorithm_name, execution_result)
+            return judgment
+
+        with ThreadPoolExecutor(max_workers=len(self.judges)) as pool:
+            judgments = list(pool.map(
+                lambda judge: judge.evaluate(algorithm_name, execution_result),
+                self.judges
+            ))
+
+        return self._aggregate(algorithm_name, judgments)
+
+    @staticmethod
+    def _aggregate(algorithm_name: str, judgments: List[JudgmentResult]) -> JudgmentResult:
+        """판단 목록을 다수결로 합침.
+
+        문제 여부는 과반수로 정하며, 동수이면 문제가 있는 것으로 봅니다.
+        심각도는 다수 의견에 속한 판단 중 가장 높은 것을 사용합니다.
+        """
+        problem_votes = sum(1 for judgment in judgments if judgment.has_problem)
+        has_problem = problem_votes * 2 >= len(judgments)
+        agreeing = [judgment for judgment in judgments if judgment.has_problem == has_problem]
+        decisive = max(agreeing, key=lambda judgment: _SEVERITY_RANK.get(judgment.severity, 0))
+
+        logger.info(
+            f"Ensemble verdict for {algorithm_name}: "
+            f"{problem_votes}/{len(judgments)} judges found a problem"
+        )
+
+        votes = "\n".join([
+            f"- Judge {idx}: has_problem={judgment.has_problem}, "
+            f"severity={judgment.severity}, summary={judgment.summary}"
+            for idx, judgment in enumerate(judgments, start=1)
+        ])
+        return JudgmentResult(
+            algorithm_name=algorithm_name,
+            has_problem=has_problem,
+            severity=decisive.severity if has_problem else "none",
+            reasoning=f"{decisive.reasoning}\n\n[Ensemble Votes: {problem_votes}/{len(judgments)} found a problem]\n{votes}",
+            summary=decisive.summary,
+            detailed_trace=decisive.detailed_trace
+        )
@@ -1,5 +1,11 @@
 """Judge Agent용 프롬프트 정의."""
 
+from typing import List, Optional
+
+
+# 프롬프트 문구를 바꾸면 올려서 이전 프롬프트로 얻은 캐시된 판단을 무효화
+PROMPT_VERSION = "v4"
+
 
 def get_react_system_prompt(tools_description: str, use_structured_output: bool = True) -> str:
     """ReAct Judge Agent의 시스템 프롬프트를 생성.
@@ -44,7 +50,7 @@ After receiving an observation, continue with another Thought/Action/Action Inpu
 When you have enough information, use submit_judgment to provide your final verdict.
 
 ## Important Rules
-1. Always start by getting the criteria document
+1. Base your judgment on the criteria document (call get_criteria unless it is already provided in the prompt)
 2. Analyze the execution result against the criteria
 3. Use check_threshold and calculate_percentage to verify conditions
 4. Base your judgment on specific criteria from the document
@@ -52,17 +58,19 @@ When you have enough information, use submit_judgment to provide your final verd
 """
 
 
-def get_evaluation_prompt(algorithm_name: str, result_json: str) -> str:
+def get_evaluation_prompt(algorithm_name: str, result_json: str, criteria: Optional[str] = None) -> str:
     """평가 시작을 위한 초기 프롬프트를 생성.
 
     Args:
         algorithm_name: 평가할 알고리즘 이름
         result_json: JSON 형식의 실행 결과 문자열
+        criteria: 미리 포함할 판단 기준 문서 (None이면 get_criteria로 조회하도록 안내)
 
     Returns:
         초기 평가 프롬프트 문자열
     """
-    return f"""Evaluate the following algorithm result:
+    if criteria is None:
+        return f"""Evaluate the following algorithm result:
 
 ## Algorithm: {algorithm_name}
 
@@ -72,3 +80,92 @@ def get_evaluation_prompt(algorithm_name: str, result_json: str) -> str:
 ```
 
 Start by getting the criteria document, then analyze the result and submit your judgment."""
+
+    return f"""Evaluate the following algorithm result:
+
+## Algorithm: {algorithm_name}
+
+## Criteria Document:
+{criteria}
+
+## Execution Result:
+```json
+{result_json}
+```
+
+The criteria document is already provided above, so do not call get_criteria. Analyze the result and submit your judgment."""
+
+
+def get_delta_evaluation_prompt(
+    algorithm_name: str,
+    previous_severity: str,
+    previous_summary: str,
+    changed_json: str,
+    unchanged_json: str,
+    removed_fields: List[str]
+) -> str:
+    """직전 판단과 거의 같은 결과를 재평가하기 위한 증분 프롬프트를 생성.
+
+    바뀐 필드를 따로 보여 주고 직전 판단 요약을 함께 전달합니다.
+    판단 기준 문서가 직전 판단 때와 같을 때만 사용합니다.
+
+    Args:
+        algorithm_name: 평가할 알고리즘 이름
+        previous_severity: 직전 판단의 심각도
+        previous_summary: 직전 판단의 요약
+        changed_json: JSON 형식의 변경된 필드 (점으로 구분된 경로 -> 새 값)
+        unchanged_json: JSON 형식의 변경되지 않은 필드 (점으로 구분된 경로 -> 값)
+        removed_fields: 새 결과에서 사라진 필드 경로 목록
+
+    Returns:
+        증분 평가 프롬프트 문자열
+    """
+    removed = ", ".join(removed_fields) if removed_fields else "(none)"
+    return f"""Re-evaluate the algorithm result below. It is nearly identical to one you already judged.
+
+## Algorithm: {algorithm_name}
+
+## Previous Verdict
+- severity: {previous_severity}
+- summary: {previous_summary}
+
+## Changed Fields:
+```json
+{changed_json}
+```
+
+## Unchanged Fields:
+```json
+{unchanged_json}
+```
+
+## Removed Fields: {removed}
+
+The criteria document is the same one the previous verdict was based on.
+Call get_criteria if you need to re-check a condition, then submit your judgment."""
+
+
+def get_binary_evaluation_prompt(algorithm_name: str, criteria: str, result_json: str) -> str:
+    """APPROVE/REJECT 한 단어로 답하는 단일 호출 평가 프롬프트를 생성.
+
+    Args:
+        algorithm_name: 평가할 알고리즘 이름
+        criteria: 판단 기준 문서 내용
+        result_json: JSON 형식의 실행 결과 문자열
+
+    Returns:
+        이진 평가 프롬프트 문자열
+    """
+    return f"""Decide whether the algorithm result below passes its criteria.
+
+## Algorithm: {algorithm_name}
+
+## Criteria:
+{criteria}
+
+## Execution Result:
+```json
+{result_json}
+```
+
+Answer with exactly one word: APPROVE if the result has no problem, REJECT if it has a problem."""
@@ -1,28 +1,37 @@
 """ReAct 패턴을 구현한 Judge Agent."""
 
-import json
+import asyncio
+import hashlib
+import logging
 import re
-from typing import Dict, Any, Optional, List, Tuple
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Deque, Dict, Any, Optional, List, Sequence, Set, Tuple
 
 from pydantic import BaseModel, Field, ValidationError
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_community.chat_models import ChatLiteLLM
-from openai import APITimeoutError as OpenAITimeoutError, RateLimitError as OpenAIRateLimitError
-from anthropic import APITimeoutError as AnthropicTimeoutError, RateLimitError as AnthropicRateLimitError
-import litellm
+from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage, AIMessage
 
 from ..models import JudgmentResult
 from ..registry import AlgorithmRegistry
 from ..exceptions import (
+    CriteriaNotFoundError,
     LLMConnectionError,
     LLMTimeoutError,
     LLMRateLimitError,
 )
 from ..logging_config import get_logger
-from .tools import JudgeTools, TOOLS_DESCRIPTION
-from .prompts import get_react_system_prompt, get_evaluation_prompt
+from ..json_utils import JSONDecodeError, dumps_compact, loads as json_loads, loads_lenient
+from .tools import JudgeTools, TOOL_NAMES, TOOLS_DESCRIPTION, cap_tool_output
+from .prompts import (
+    PROMPT_VERSION,
+    get_react_system_prompt,
+    get_evaluation_prompt,
+    get_delta_evaluation_prompt,
+    get_binary_evaluation_prompt,
+)
+from .verdict_cache import JudgeCache
 
 
 # ===== Structured Output Models =====
@@ -39,8 +48,7 @@ class ReActStep(BaseModel):
                     "Explain your thinking process clearly."
     )
     action: str = Field(
-        description="The action/tool to use. Must be one of: get_criteria, get_result_field, "
-                    "check_threshold, calculate_percentage, submit_judgment"
+        description=f"The action/tool to use. Must be one of: {', '.join(TOOL_NAMES)}"
     )
     action_input: str = Field(
         description="The input parameters for the action. "
@@ -51,6 +59,192 @@ class ReActStep(BaseModel):
 
 logger = get_logger("judge")
 
+# ReAct 응답 텍스트의 필드 접두사
+_THOUGHT_PREFIX = "Thought:"
+_ACTION_PREFIX = "Action:"
+_ACTION_INPUT_PREFIX = "Action Input:"
+_OBSERVATION_PREFIX = "Observation:"
+
+# 이진 판단 응답에서 찾을 판정 단어 ("**REJECT**", "Reject.", "I reject", "REJECTED" 등)
+_BINARY_VERDICT_PATTERN = re.compile(r"\b(APPROVE|REJECT)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _system_message(use_structured_output: bool, cache_control: bool) -> SystemMessage:
+    """ReAct 시스템 메시지를 생성 (조합별로 한 번만 생성해 모든 Judge가 공유).
+
+    Anthropic은 cache_control을 명시해야 프롬프트 캐시를 사용하므로,
+    cache_control=True이면 시스템 프롬프트 블록에 표시합니다.
+    """
+    system_prompt = get_react_system_prompt(TOOLS_DESCRIPTION, use_structured_output)
+    if cache_control:
+        return SystemMessage(content=[{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }])
+    return SystemMessage(content=system_prompt)
+
+
+class _ReActHistory:
+    """ReAct 대화 기록.
+
+    window가 설정되면 최근 window개의 턴(AI 응답 + 관찰)만 그대로 전송하고,
+    그보다 오래된 턴은 한 줄 요약으로 접어 초기 프롬프트 뒤에 붙입니다.
+    매 호출마다 전체 대화를 다시 보내 토큰이 반복 횟수의 제곱으로 늘어나는 것을
+    막습니다. get_criteria 결과처럼 고정(pinned)된 턴은 접지 않고 원래 순서대로 둡니다.
+
+    cache_control이 True이면(Anthropic) 가장 최근 고정 턴의 관찰에 캐시 지점을 표시해
+    이후 반복에서 판단 기준 문서까지의 접두부를 provider 캐시로 재사용합니다.
+    Anthropic은 요청당 캐시 지점을 4개까지 허용하므로 시스템 블록 외에 하나만 씁니다.
+    """
+
+    SUMMARY_OBSERVATION_CHARS = 200
+
+    def __init__(
+        self,
+        prefix: List[BaseMessage],
+        initial_prompt: str,
+        window: Optional[int] = None,
+        cache_control: bool = False
+    ):
+        self._prefix = prefix
+        self._cache_control = cache_control
+        self._initial_prompt = initial_prompt
+        self._window = max(1, window) if window is not None else None
+        # (AI 응답, 피드백, 고정 여부)를 대화 순서대로 보관
+        self._turns: List[Tuple[str, str, bool]] = []
+        self._foldable_count = 0
+        self._summary: List[str] = []
+
+    def add_turn(self, response_text: str, feedback: str, pinned: bool = False) -> None:
+        """AI 응답과 그에 대한 피드백(관찰 또는 오류 안내)을 추가."""
+        if not pinned:
+            if self._window is not None and self._foldable_count >= self._window:
+                self._fold_oldest()
+            self._foldable_count += 1
+        self._turns.append((response_text, feedback, pinned))
+
+    def _fold_oldest(self) -> None:
+        """가장 오래된 고정되지 않은 턴을 요약으로 접음."""
+        for idx, (response_text, feedback, pinned) in enumerate(self._turns):
+            if not pinned:
+                del self._turns[idx]
+                self._foldable_count -= 1
+                self._summary.append(self._summarize(response_text, feedback))
+                return
+
+    def _summarize(self, response_text: str, feedback: str) -> str:
+        actions = "; ".join([
+            line.strip() for line in response_text.splitlines()
+            if line.lstrip().startswith("Action")
+        ])
+        observation = feedback[:self.SUMMARY_OBSERVATION_CHARS]
+        if len(feedback) > self.SUMMARY_OBSERVATION_CHARS:
+            observation += "..."
+        return f"- {actions or '(no action)'} -> {observation}"
+
+    def messages(self) -> List[BaseMessage]:
+        """LLM에 전송할 메시지 목록을 구성."""
+        initial = self._initial_prompt
+        if self._summary:
+            initial += "\n\n## Earlier Steps (summarized)\n" + "\n".join(self._summary)
+        cache_index = -1
+        if self._cache_control:
+            for idx, (_, _, pinned) in enumerate(self._turns):
+                if pinned:
+                    cache_index = idx
+        messages = self._prefix + [HumanMessage(content=initial)]
+        for idx, (response_text, feedback, _) in enumerate(self._turns):
+            messages.append(AIMessage(content=response_text))
+            if idx == cache_index:
+                messages.append(HumanMessage(content=[{
+                    "type": "text",
+                    "text": feedback,
+                    "cache_control": {"type": "ephemeral"},
+                }]))
+            else:
+                messages.append(HumanMessage(content=feedback))
+        return messages
+
+
+# (provider, model, temperature, timeout, api_key, base_url) -> chat model
+# 같은 설정의 Judge들이 클라이언트(HTTP 연결 풀)를 공유하도록 프로세스 단위로 보관
+_LLM_CACHE: Dict[Tuple[Any, ...], Any] = {}
+_LLM_CACHE_LOCK = threading.Lock()
+
+
+def _load_provider_errors(llm_provider: str) -> Tuple[Tuple[type, ...], Tuple[type, ...]]:
+    """provider SDK의 (타임아웃, 레이트 리밋) 예외 클래스를 반환.
+
+    예외 분류에만 쓰이는 SDK(특히 litellm)는 import 비용이 크므로
+    사용 중인 provider의 SDK만 필요한 시점에 import합니다.
+    """
+    if llm_provider == "openai":
+        import openai
+        return (openai.APITimeoutError,), (openai.RateLimitError,)
+    if llm_provider == "anthropic":
+        import anthropic
+        return (anthropic.APITimeoutError,), (anthropic.RateLimitError,)
+    if llm_provider == "litellm":
+        import litellm
+        return (litellm.Timeout,), (litellm.RateLimitError,)
+    return (), ()
+
+
+def _flatten_result(result: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """중첩된 실행 결과를 점으로 구분된 경로 -> 값 형태로 평탄화."""
+    flat: Dict[str, Any] = {}
+    for key, value in result.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(_flatten_result(value, f"{path}."))
+        else:
+            flat[path] = value
+    return flat
+
+
+# 프롬프트에 넣을 실행 결과의 문자열 최대 길이와 리스트 최대 항목 수
+_PROMPT_MAX_STR_CHARS = 4096
+_PROMPT_MAX_LIST_ITEMS = 100
+
+
+def _truncate_for_prompt(
+    value: Any,
+    max_chars: int = _PROMPT_MAX_STR_CHARS,
+    max_items: int = _PROMPT_MAX_LIST_ITEMS
+) -> Any:
+    """실행 결과에서 너무 긴 문자열과 리스트를 잘라 프롬프트 길이를 제한.
+
+    Args:
+        value: 실행 결과 (중첩된 dict/list 포함)
+        max_chars: 문자열 최대 길이
+        max_items: 리스트/튜플 최대 항목 수
+
+    Returns:
+        잘린 값 (원본은 변경하지 않음)
+    """
+    if isinstance(value, str):
+        return value[:max_chars] + "...[truncated]" if len(value) > max_chars else value
+    if isinstance(value, dict):
+        return {k: _truncate_for_prompt(v, max_chars, max_items) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [_truncate_for_prompt(v, max_chars, max_items) for v in value[:max_items]]
+        if len(value) > max_items:
+            items.append("...truncated...")
+        return items
+    return value
+
+
+def _block_hashes(flat_result: Dict[str, Any]) -> Set[str]:
+    """필드 단위 블록(경로=값)의 해시 집합을 계산."""
+    return {
+        hashlib.sha256(
+            f"{path}={dumps_compact(value, sort_keys=True, default=str)}".encode("utf-8")
+        ).hexdigest()
+        for path, value in flat_result.items()
+    }
+
 
 class ReactJudge:
     """ReAct (Reasoning + Acting) 패턴을 구현한 Judge Agent.
@@ -60,6 +254,11 @@ class ReactJudge:
     """
 
     MAX_ITERATIONS = 10  # 무한 루프 방지
+    DELTA_OVERLAP_THRESHOLD = 0.8  # 증분 프롬프트를 사용할 최소 필드 중복률 (Jaccard)
+    BINARY_MAX_TOKENS = 3  # APPROVE/REJECT 응답에 충분한 출력 토큰 수
+    DEFAULT_MAX_CONCURRENCY = 4  # evaluate_many의 기본 동시 평가 수 (provider rate limit 고려)
+    DEFAULT_HISTORY_WINDOW = 2  # 요약하지 않고 그대로 전송할 최근 ReAct 턴 수
+    INCOMPLETE_TRACE_LINES = 10  # 최대 반복 초과 시 reasoning에 포함할 최근 추론 기록 수
 
     def __init__(
         self,
@@ -71,7 +270,13 @@ class ReactJudge:
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         max_iterations: int = 10,
-        use_structured_output: bool = True
+        use_structured_output: bool = True,
+        verdict_cache: Optional[JudgeCache] = None,
+        delta_prompting: bool = False,
+        history_window: Optional[int] = DEFAULT_HISTORY_WINDOW,
+        stream_responses: bool = False,
+        enable_deterministic_fastpath: bool = False,
+        preload_criteria: bool = False
     ):
         """
         Args:
@@ -84,6 +289,16 @@ class ReactJudge:
             base_url: API 베이스 URL (litellm 사용 시 필수, 다른 provider는 선택사항)
             max_iterations: 최대 반복 횟수
             use_structured_output: 구조화된 출력 사용 여부 (True 권장)
+            verdict_cache: 판단 결과 캐시 (None이거나 temperature가 0이 아니면 캐시 사용 안 함)
+            delta_prompting: 같은 알고리즘의 직전 결과와 거의 같으면 변경된 필드만 전달할지 여부
+            history_window: 그대로 전송할 최근 ReAct 턴 수 (더 오래된 턴은 한 줄씩 요약,
+                None이면 전체 대화 전송)
+            stream_responses: 텍스트 파싱 모드에서 응답을 스트리밍으로 받고, Action Input이
+                완성되면 나머지 생성을 기다리지 않고 스트림을 닫을지 여부
+            enable_deterministic_fastpath: 규칙만으로 판단 가능한 알고리즘(length_check,
+                keyword_check)은 LLM 없이 MockReactJudge 규칙으로 판단할지 여부
+            preload_criteria: 판단 기준 문서를 초기 프롬프트에 포함해 get_criteria 호출
+                한 번(LLM 왕복 한 번)을 생략할지 여부
         """
         self.registry = registry
         self.llm_provider = llm_provider
@@ -93,8 +308,30 @@ class ReactJudge:
         self.base_url = base_url
         self.max_iterations = max_iterations
         self.use_structured_output = use_structured_output
+        self.verdict_cache = verdict_cache
+        self.delta_prompting = delta_prompting
+        self.history_window = history_window
+        self.stream_responses = stream_responses
+        self.preload_criteria = preload_criteria
+        # 알고리즘 이름 -> 직전 평가의 필드 블록, 평탄화된 결과, 판단, 판단 기준 해시
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+        # 모든 평가가 공유하는 메시지 접두부 (최초 평가 시 생성)
+        self._shared_messages: Optional[List[BaseMessage]] = None
+        # Executor가 여러 스레드에서 같은 Judge로 평가하므로 위 두 상태의 접근을 직렬화
+        self._state_lock = threading.Lock()
+        # 알고리즘 이름 -> 규칙 기반 판단 함수 (LLM 호출 생략)
+        self._fast_path_judges: Dict[str, Callable[[Dict[str, Any]], JudgmentResult]] = {}
+        if enable_deterministic_fastpath:
+            rules = MockReactJudge(registry)
+            self._fast_path_judges = {
+                "length_check": rules._evaluate_length_check,
+                "keyword_check": rules._evaluate_keyword_check,
+            }
 
         base_llm = self._create_llm(api_key)
+        # 이진 판단은 구조화된 출력 없이 짧은 텍스트 응답만 받음
+        self._binary_llm = base_llm.bind(max_tokens=self.BINARY_MAX_TOKENS)
+        self._timeout_errors, self._rate_limit_errors = _load_provider_errors(llm_provider)
         self.tools = JudgeTools(registry)
 
         # 구조화된 출력을 위한 LLM 설정
@@ -104,7 +341,7 @@ class ReactJudge:
             except AttributeError:
                 logger.warning(
                     f"Structured output not supported for {llm_provider}/{model_name}. "
-                    "Falling back to regex parsing."
+                    "Falling back to text parsing."
                 )
                 self.use_structured_output = False
                 self.llm = base_llm
@@ -112,7 +349,23 @@ class ReactJudge:
             self.llm = base_llm
 
     def _create_llm(self, api_key: Optional[str] = None):
-        """LLM 인스턴스를 생성."""
+        """LLM 인스턴스를 반환.
+
+        같은 설정으로 이미 생성한 인스턴스가 있으면 재사용해 여러 Judge가
+        하나의 HTTP 연결 풀을 공유합니다.
+        """
+        key = (self.llm_provider, self.model_name, self.temperature, self.timeout, api_key, self.base_url)
+        with _LLM_CACHE_LOCK:
+            llm = _LLM_CACHE.get(key)
+            if llm is None:
+                llm = _LLM_CACHE[key] = self._build_llm(api_key)
+        return llm
+
+    def _build_llm(self, api_key: Optional[str] = None):
+        """LLM 인스턴스를 생성.
+
+        Provider 패키지는 import 비용이 크므로 선택된 provider만 여기서 import합니다.
+        """
         if self.llm_provider == "openai":
             kwargs = {
                 "model": self.model_name,
@@ -123,6 +376,7 @@ class ReactJudge:
                 kwargs["api_key"] = api_key
             if self.base_url is not None:
                 kwargs["base_url"] = self.base_url
+            from langchain_openai import ChatOpenAI
             return ChatOpenAI(**kwargs)
         elif self.llm_provider == "anthropic":
             kwargs = {
@@ -134,6 +388,7 @@ class ReactJudge:
                 kwargs["api_key"] = api_key
             if self.base_url is not None:
                 kwargs["base_url"] = self.base_url
+            from langchain_anthropic import ChatAnthropic
             return ChatAnthropic(**kwargs)
         elif self.llm_provider == "litellm":
             kwargs = {
@@ -145,6 +400,7 @@ class ReactJudge:
                 kwargs["api_key"] = api_key
             if self.base_url is not None:
                 kwargs["base_url"] = self.base_url
+            from langchain_community.chat_models import ChatLiteLLM
             return ChatLiteLLM(**kwargs)
         else:
             raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
@@ -162,13 +418,16 @@ class ReactJudge:
             # action_input을 파싱 (JSON이면 dict로, 아니면 문자열로)
             parsed_input = react_step.action_input
             try:
-                parsed_input = json.loads(react_step.action_input)
-            except (json.JSONDecodeError, TypeError):
-                # JSON이 아니면 문자열 그대로 사용
-                pass
+                parsed_input = json_loads(react_step.action_input)
+            except (JSONDecodeError, TypeError):
+                # 형식 오류를 보정해 다시 시도하고, 그래도 아니면 문자열 그대로 사용
+                if isinstance(react_step.action_input, str):
+                    coerced = loads_lenient(react_step.action_input)
+                    if coerced is not None:
+                        parsed_input = coerced
 
             # 표시용 문자열 생성
-            input_display = json.dumps(parsed_input, ensure_ascii=False) if isinstance(parsed_input, dict) else parsed_input
+            input_display = dumps_compact(parsed_input, default=str) if isinstance(parsed_input, dict) else parsed_input
 
             return (
                 react_step.thought,
@@ -184,39 +443,153 @@ class ReactJudge:
             logger.error(f"Structured output parsing failed: {e}")
             return None, None, None, f"Parsing Error: {str(e)}"
 
-    def _parse_action_regex(self, response_text: str) -> Tuple[Optional[str], Optional[str], Optional[Any]]:
-        """정규식을 사용하여 LLM 응답에서 Thought, Action, Action Input을 파싱 (fallback).
+    def _parse_action_text(self, response_text: str) -> Tuple[Optional[str], Optional[str], Optional[Any]]:
+        """LLM 응답 텍스트에서 Thought, Action, Action Input을 파싱 (fallback).
+
+        응답을 한 줄씩 한 번만 훑으며 줄 머리의 필드 접두사로 구분합니다.
+        Thought와 Action Input은 다음 필드가 나올 때까지 이어지는 줄을 포함하며,
+        각 필드는 처음 나온 것만 사용합니다.
 
         Returns:
             (thought, action_name, action_input) 튜플
         """
-        thought = None
         action = None
-        action_input = None
-
-        # Thought 추출
-        thought_match = re.search(r"Thought:\s*(.+?)(?=Action:|$)", response_text, re.DOTALL)
-        if thought_match:
-            thought = thought_match.group(1).strip()
-
-        # Action 추출
-        action_match = re.search(r"Action:\s*(\w+)", response_text)
-        if action_match:
-            action = action_match.group(1).strip()
+        thought_lines: Optional[List[str]] = None
+        input_lines: Optional[List[str]] = None
+        current: Optional[List[str]] = None  # 이어지는 줄을 모을 필드
+
+        for line in response_text.splitlines():
+            stripped = line.lstrip()
+            if stripped.startswith(_THOUGHT_PREFIX):
+                current = None
+                if thought_lines is None:
+                    thought_lines = current = [stripped[len(_THOUGHT_PREFIX):]]
+            elif stripped.startswith(_ACTION_INPUT_PREFIX):
+                current = None
+                if input_lines is None:
+                    input_lines = current = [stripped[len(_ACTION_INPUT_PREFIX):]]
+            elif stripped.startswith(_ACTION_PREFIX):
+                current = None
+                if action is None:
+                    name = stripped[len(_ACTION_PREFIX):].strip()
+                    end = 0
+                    while end < len(name) and (name[end].isalnum() or name[end] == "_"):
+                        end += 1
+                    action = name[:end] or None
+            elif stripped.startswith(_OBSERVATION_PREFIX):
+                current = None
+            elif current is not None:
+                current.append(line)
+
+        thought = "\n".join(thought_lines).strip() if thought_lines is not None else None
 
-        # Action Input 추출
-        input_match = re.search(r"Action Input:\s*(.+?)(?=Thought:|Observation:|$)", response_text, re.DOTALL)
-        if input_match:
-            raw_input = input_match.group(1).strip()
+        action_input = None
+        if input_lines is not None:
+            raw_input = "\n".join(input_lines).strip()
             # JSON 파싱 시도
             try:
-                action_input = json.loads(raw_input)
-            except json.JSONDecodeError:
-                # JSON이 아니면 문자열로 사용
-                action_input = raw_input
+                action_input = json_loads(raw_input)
+            except JSONDecodeError:
+                # 객체 뒤에 덧붙은 설명이 있으면 객체 부분만 사용하고, 형식 오류는
+                # 보정해 다시 시도하며, 그래도 아니면 문자열로 사용
+                coerced = None
+                if raw_input.startswith("{"):
+                    object_end = _balanced_object_end(raw_input, 0)
+                    if object_end is not None and object_end < len(raw_input):
+                        coerced = loads_lenient(raw_input[:object_end])
+                if coerced is None:
+                    coerced = loads_lenient(raw_input)
+                action_input = raw_input if coerced is None else coerced
 
         return thought, action, action_input
 
+    def _get_shared_messages(self) -> List[BaseMessage]:
+        """모든 평가에 공통인 메시지 접두부(시스템 프롬프트)를 반환.
+
+        매 평가마다 동일한 SystemMessage를 앞에 두어 provider 측 프롬프트 캐시가
+        접두부를 재사용할 수 있게 합니다.
+        """
+        with self._state_lock:
+            if self._shared_messages is None:
+                self._shared_messages = [
+                    _system_message(self.use_structured_output, self.llm_provider == "anthropic")
+                ]
+            return self._shared_messages
+
+    def _verdict_cache_key(self, algorithm_name: str, execution_result: Dict[str, Any]) -> str:
+        """판단 결과 캐시 키를 생성.
+
+        모델 설정, 프롬프트 버전, 판단 기준 문서를 키에 포함해 설정이나 기준이
+        바뀌면 이전 판단을 재사용하지 않습니다.
+        """
+        try:
+            criteria = self.registry.get_criteria_document(algorithm_name)
+        except CriteriaNotFoundError:
+            criteria = ""
+        namespace = (
+            f"{self.llm_provider}/{self.model_name}/{self.temperature}/"
+            f"{self.use_structured_output}/{PROMPT_VERSION}\0{criteria}"
+        )
+        return JudgeCache.make_key(namespace, algorithm_name, execution_result)
+
+    def _criteria_hash(self, algorithm_name: str) -> str:
+        """판단 기준 문서의 SHA-256 hex digest (문서가 없으면 빈 문자열)."""
+        try:
+            criteria = self.registry.get_criteria_document(algorithm_name)
+        except CriteriaNotFoundError:
+            return ""
+        return hashlib.sha256(criteria.encode("utf-8")).hexdigest()
+
+    def _build_delta_prompt(
+        self,
+        algorithm_name: str,
+        flat_result: Dict[str, Any],
+        blocks: Set[str],
+        criteria_hash: str
+    ) -> Optional[str]:
+        """직전 평가와 필드 중복률이 임계값 이상이면 증분 프롬프트를 생성.
+
+        Args:
+            algorithm_name: 평가할 알고리즘 이름
+            flat_result: 평탄화된 실행 결과
+            blocks: flat_result의 필드 블록 해시
+            criteria_hash: 현재 판단 기준 문서의 해시
+
+        Returns:
+            증분 프롬프트 (직전 평가가 없거나, 판단 기준이 바뀌었거나, 중복률이 낮으면 None)
+        """
+        with self._state_lock:
+            session = self._sessions.get(algorithm_name)
+        if session is None or session["criteria_hash"] != criteria_hash:
+            return None
+
+        union = blocks | session["blocks"]
+        overlap = len(blocks & session["blocks"]) / len(union) if union else 1.0
+        if overlap < self.DELTA_OVERLAP_THRESHOLD:
+            return None
+
+        previous_fields = session["fields"]
+        changed = {}
+        unchanged = {}
+        for path, value in flat_result.items():
+            if path in previous_fields and previous_fields[path] == value:
+                unchanged[path] = value
+            else:
+                changed[path] = value
+        removed = [path for path in previous_fields if path not in flat_result]
+        previous: JudgmentResult = session["verdict"]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Using delta prompt for {algorithm_name} (overlap {overlap:.2f})")
+        return get_delta_evaluation_prompt(
+            algorithm_name,
+            previous.severity,
+            previous.summary,
+            dumps_compact(changed, default=str),
+            dumps_compact(unchanged, default=str),
+            removed
+        )
+
     def evaluate(
         self,
         algorithm_name: str,
@@ -224,6 +597,9 @@ class ReactJudge:
     ) -> JudgmentResult:
         """ReAct 루프를 통해 알고리즘 실행 결과를 평가.
 
+        verdict_cache가 설정되어 있고 temperature가 0이면 동일한 입력에 대한
+        이전 판단을 재사용합니다.
+
         Args:
             algorithm_name: 평가할 알고리즘 이름
             execution_result: 알고리즘 실행 결과
@@ -231,14 +607,46 @@ class ReactJudge:
         Returns:
             JudgmentResult: 판단 결과
         """
-        # 초기 프롬프트 구성
-        result_json = json.dumps(execution_result, ensure_ascii=False, indent=2)
-        initial_prompt = get_evaluation_prompt(algorithm_name, result_json)
+        fast_path = self._fast_path_judges.get(algorithm_name)
+        if fast_path is not None:
+            logger.info(f"Using rule-based judgment for {algorithm_name}")
+            return fast_path(execution_result)
+
+        cache_key = None
+        # 0이 아닌 temperature의 판단은 재현되지 않으므로 캐시하지 않음
+        if self.verdict_cache is not None and self.temperature == 0:
+            cache_key = self._verdict_cache_key(algorithm_name, execution_result)
+            cached = self.verdict_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached judgment for {algorithm_name}")
+                return cached
 
-        messages = [
-            SystemMessage(content=get_react_system_prompt(TOOLS_DESCRIPTION, self.use_structured_output)),
-            HumanMessage(content=initial_prompt)
-        ]
+        # 초기 프롬프트 구성
+        prompt_result = _truncate_for_prompt(execution_result)
+        initial_prompt = None
+        if self.delta_prompting:
+            flat_result = _flatten_result(prompt_result)
+            blocks = _block_hashes(flat_result)
+            criteria_hash = self._criteria_hash(algorithm_name)
+            initial_prompt = self._build_delta_prompt(algorithm_name, flat_result, blocks, criteria_hash)
+        if initial_prompt is None:
+            result_json = dumps_compact(prompt_result, sort_keys=True)
+            criteria = None
+            if self.preload_criteria:
+                try:
+                    criteria = cap_tool_output(self.registry.get_criteria_document(algorithm_name))
+                except CriteriaNotFoundError:
+                    # 문서가 없으면 기존처럼 LLM이 get_criteria로 확인하게 둠
+                    pass
+            initial_prompt = get_evaluation_prompt(algorithm_name, result_json, criteria)
+
+        # 공유 접두부는 복사해서 사용 (평가별 대화는 접두부에 남기지 않음)
+        history = _ReActHistory(
+            self._get_shared_messages(),
+            initial_prompt,
+            self.history_window,
+            cache_control=self.llm_provider == "anthropic"
+        )
 
         context = {
             "algorithm_name": algorithm_name,
@@ -247,14 +655,18 @@ class ReactJudge:
 
         judgment_data = None
         iterations = 0
-        reasoning_trace = []  # 간단한 추론 과정 기록
+        # 간단한 추론 과정 기록 (미완료 시 마지막 항목만 보고하므로 최근 것만 보관)
+        reasoning_trace: Deque[str] = deque(maxlen=self.INCOMPLETE_TRACE_LINES)
         detailed_trace = []   # 상세 추론 과정 기록 (전체 정보)
 
         logger.info(f"Starting ReAct evaluation for {algorithm_name}")
+        # 디버그 로그가 꺼져 있으면 로그 메시지 문자열도 만들지 않음
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         while iterations < self.max_iterations:
             iterations += 1
-            logger.debug(f"ReAct iteration {iterations}")
+            if debug:
+                logger.debug(f"ReAct iteration {iterations}")
 
             iteration_trace = {
                 "iteration": iterations,
@@ -269,12 +681,14 @@ class ReactJudge:
             try:
                 if self.use_structured_output:
                     # 구조화된 출력 사용
-                    thought, action, action_input, response_text = self._parse_action_structured(messages)
+                    thought, action, action_input, response_text = self._parse_action_structured(history.messages())
                 else:
-                    # 기존 regex 파싱 사용
-                    response = self._call_llm(messages)
-                    response_text = response.content
-                    thought, action, action_input = self._parse_action_regex(response_text)
+                    # 텍스트 응답 파싱 사용
+                    if self.stream_responses:
+                        response_text = self._stream_llm_text(history.messages())
+                    else:
+                        response_text = self._call_llm(history.messages()).content
+                    thought, action, action_input = self._parse_action_text(response_text)
             except Exception as e:
                 logger.error(f"LLM call or parsing failed: {e}")
                 raise
@@ -283,21 +697,23 @@ class ReactJudge:
             iteration_trace["thought"] = thought
             iteration_trace["action"] = action
             iteration_trace["action_input"] = action_input
-            logger.debug(f"LLM response:\n{response_text}")
+            if debug:
+                logger.debug(f"LLM response:\n{response_text}")
 
             if thought:
                 reasoning_trace.append(f"Thought: {thought}")
-                logger.debug(f"Thought: {thought}")
+                if debug:
+                    logger.debug(f"Thought: {thought}")
 
             if not action:
                 logger.warning("No action found in response, prompting for action")
-                messages.append(AIMessage(content=response_text))
-                messages.append(HumanMessage(content="Please provide an Action. Use submit_judgment when ready to provide your final verdict."))
+                history.add_turn(response_text, "Please provide an Action. Use submit_judgment when ready to provide your final verdict.")
                 iteration_trace["observation"] = "Error: No action found"
                 detailed_trace.append(iteration_trace)
                 continue
 
-            logger.debug(f"Action: {action}, Input: {action_input}")
+            if debug:
+                logger.debug(f"Action: {action}, Input: {action_input}")
             reasoning_trace.append(f"Action: {action}")
 
             # submit_judgment 처리
@@ -309,10 +725,10 @@ class ReactJudge:
                     logger.info(f"Judgment submitted after {iterations} iterations")
                     break
                 else:
-                    messages.append(AIMessage(content=response_text))
-                    messages.append(HumanMessage(
-                        content="Error: submit_judgment requires JSON input with has_problem, severity, reasoning, and summary fields."
-                    ))
+                    history.add_turn(
+                        response_text,
+                        "Error: submit_judgment requires JSON input with has_problem, severity, reasoning, and summary fields."
+                    )
                     iteration_trace["observation"] = "Error: Invalid submit_judgment input"
                     detailed_trace.append(iteration_trace)
                     continue
@@ -322,17 +738,17 @@ class ReactJudge:
             iteration_trace["observation"] = observation
             detailed_trace.append(iteration_trace)
 
-            reasoning_trace.append(f"Observation: {observation[:200]}...")
+            observation_preview = f"Observation: {observation[:200]}..."
+            reasoning_trace.append(observation_preview)
+            if debug:
+                logger.debug(observation_preview)
 
-            logger.debug(f"Observation: {observation[:200]}...")
-
-            # 대화에 추가
-            messages.append(AIMessage(content=response_text))
-            messages.append(HumanMessage(content=f"Observation: {observation}"))
+            # 대화에 추가 (판단 기준 문서는 요약하지 않고 유지)
+            history.add_turn(response_text, f"Observation: {observation}", pinned=action == "get_criteria")
 
         # 판단 결과 생성
         if judgment_data:
-            return JudgmentResult(
+            judgment = JudgmentResult(
                 algorithm_name=algorithm_name,
                 has_problem=judgment_data.get("has_problem", False),
                 severity=judgment_data.get("severity", "none"),
@@ -340,6 +756,18 @@ class ReactJudge:
                 summary=judgment_data.get("summary", ""),
                 detailed_trace=detailed_trace
             )
+            # 완료된 판단만 캐시 (최대 반복 초과 결과는 저장하지 않음)
+            if cache_key is not None and self.verdict_cache is not None:
+                self.verdict_cache.put(cache_key, judgment)
+            if self.delta_prompting:
+                with self._state_lock:
+                    self._sessions[algorithm_name] = {
+                        "blocks": blocks,
+                        "fields": flat_result,
+                        "verdict": judgment,
+                        "criteria_hash": criteria_hash,
+                    }
+            return judgment
         else:
             # 최대 반복 횟수 초과
             logger.warning(f"Max iterations ({self.max_iterations}) reached without judgment")
@@ -347,28 +775,332 @@ class ReactJudge:
                 algorithm_name=algorithm_name,
                 has_problem=False,
                 severity="none",
-                reasoning=f"ReAct loop did not complete. Trace:\n" + "\n".join(reasoning_trace[-10:]),
+                reasoning=f"ReAct loop did not complete. Trace:\n" + "\n".join(reasoning_trace),
                 summary="Evaluation incomplete - max iterations reached",
                 detailed_trace=detailed_trace
             )
 
-    def _call_llm(self, messages: List) -> Any:
+    async def aevaluate(
+        self,
+        algorithm_name: str,
+        execution_result: Dict[str, Any]
+    ) -> JudgmentResult:
+        """evaluate를 스레드 풀에서 실행하는 비동기 버전.
+
+        Args:
+            algorithm_name: 평가할 알고리즘 이름
+            execution_result: 알고리즘 실행 결과
+
+        Returns:
+            JudgmentResult: 판단 결과
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.evaluate, algorithm_name, execution_result)
+
+    async def evaluate_many(
+        self,
+        items: Sequence[Tuple[str, Dict[str, Any]]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[JudgmentResult]:
+        """서로 독립적인 여러 실행 결과를 동시에 평가.
+
+        LLM 응답 대기 시간을 겹쳐 전체 소요 시간을 줄이며, 동시에 진행되는
+        평가 수는 max_concurrency로 제한합니다.
+
+        Args:
+            items: (algorithm_name, execution_result) 튜플 목록
+            max_concurrency: 최대 동시 평가 수
+
+        Returns:
+            items와 같은 순서의 판단 결과 목록
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(algorithm_name: str, execution_result: Dict[str, Any]) -> JudgmentResult:
+            async with semaphore:
+                return await self.aevaluate(algorithm_name, execution_result)
+
+        return list(await asyncio.gather(*(
+            _bounded(algorithm_name, execution_result)
+            for algorithm_name, execution_result in items
+        )))
+
+    def evaluate_binary(
+        self,
+        algorithm_name: str,
+        execution_result: Dict[str, Any]
+    ) -> JudgmentResult:
+        """ReAct 루프 없이 한 번의 호출로 APPROVE/REJECT를 판단.
+
+        통과/실패만 구분하면 되는 알고리즘용 빠른 경로입니다. 판단 기준 문서를
+        프롬프트에 직접 넣고 출력 토큰을 몇 개로 제한합니다. REJECT는 critical로
+        처리하고, 응답에서 판정 단어를 하나로 정할 수 없으면 evaluate로 다시 평가합니다.
+
+        Args:
+            algorithm_name: 평가할 알고리즘 이름
+            execution_result: 알고리즘 실행 결과
+
+        Returns:
+            JudgmentResult: 판단 결과
+        """
+        try:
+            criteria = self.registry.get_criteria_document(algorithm_name)
+        except CriteriaNotFoundError:
+            criteria = "(no criteria document)"
+        result_json = dumps_compact(_truncate_for_prompt(execution_result), sort_keys=True)
+        prompt = get_binary_evaluation_prompt(algorithm_name, criteria, result_json)
+
+        response = self._call_llm([HumanMessage(content=prompt)], llm=self._binary_llm)
+        verdict = _message_text(response.content).strip()
+        keywords = {match.upper() for match in _BINARY_VERDICT_PATTERN.findall(verdict)}
+        if len(keywords) != 1:
+            # 판정 단어가 없거나 둘 다 있으면 통과로 간주하지 않고 ReAct 루프로 다시 평가
+            logger.warning(
+                f"Unrecognised binary verdict for {algorithm_name}: {verdict!r}; "
+                "falling back to ReAct evaluation"
+            )
+            return self.evaluate(algorithm_name, execution_result)
+        rejected = keywords == {"REJECT"}
+
+        return JudgmentResult(
+            algorithm_name=algorithm_name,
+            has_problem=rejected,
+            severity="critical" if rejected else "none",
+            reasoning=f"Binary verdict: {verdict or '(empty)'}",
+            summary="Result rejected by criteria." if rejected else "Result approved by criteria."
+        )
+
+    def _call_llm(self, messages: List, llm: Any = None) -> Any:
         """LLM을 호출하고 에러를 처리.
 
+        Args:
+            messages: 전송할 메시지 목록
+            llm: 호출할 LLM (None이면 self.llm)
+
         Returns:
             ReActStep if use_structured_output=True, AIMessage otherwise
         """
         try:
-            return self.llm.invoke(messages)
-        except (OpenAITimeoutError, AnthropicTimeoutError, litellm.Timeout) as e:
-            logger.error(f"LLM timeout: {e}")
-            raise LLMTimeoutError(self.llm_provider, self.timeout) from e
-        except (OpenAIRateLimitError, AnthropicRateLimitError, litellm.RateLimitError) as e:
-            logger.error(f"LLM rate limit: {e}")
-            raise LLMRateLimitError(self.llm_provider) from e
+            return (llm or self.llm).invoke(messages)
         except Exception as e:
-            logger.error(f"LLM connection error: {e}")
-            raise LLMConnectionError(self.llm_provider, e) from e
+            raise self._llm_error(e) from e
+
+    def _stream_llm_text(self, messages: List) -> str:
+        """LLM 응답을 스트리밍으로 받아 텍스트로 반환.
+
+        Action Input이 완성되면(JSON 객체는 닫는 중괄호, 그 외 값은 줄바꿈) 그
+        위치까지만 사용하고 스트림을 닫아, 이후 생성될 부연 설명이나 모델이 지어낸
+        Observation을 기다리지 않습니다.
+
+        Args:
+            messages: 전송할 메시지 목록
+
+        Returns:
+            응답 텍스트
+        """
+        chunks = None
+        text = ""
+        try:
+            chunks = self.llm.stream(messages)
+            for chunk in chunks:
+                content: str = chunk.content
+                text += content
+                if "}" in content or "\n" in content:
+                    end = _action_input_end(text)
+                    if end is not None:
+                        logger.debug("Action Input completed, closing LLM stream")
+                        return text[:end]
+            return text
+        except Exception as e:
+            raise self._llm_error(e) from e
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    def _llm_error(self, error: Exception) -> Exception:
+        """LLM 호출 중 발생한 예외를 프로젝트 예외로 변환."""
+        if isinstance(error, self._timeout_errors):
+            logger.error(f"LLM timeout: {error}")
+            return LLMTimeoutError(self.llm_provider, self.timeout)
+        if isinstance(error, self._rate_limit_errors):
+            logger.error(f"LLM rate limit: {error}")
+            return LLMRateLimitError(self.llm_provider)
+        logger.error(f"LLM connection error: {error}")
+        return LLMConnectionError(self.llm_provider, error)
+
+
+def _message_text(content: Any) -> str:
+    """메시지 content를 문자열로 변환 (Anthropic의 블록 리스트는 텍스트 블록만 연결)."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join([
+            block if isinstance(block, str) else str(block.get("text", ""))
+            for block in content
+            if isinstance(block, (str, dict))
+        ])
+    return str(content)
+
+
+def _action_input_end(text: str) -> Optional[int]:
+    """응답에서 첫 Action Input 값이 끝나는 위치를 반환.
+
+    JSON 객체는 문자열 안의 중괄호를 무시하고 깊이를 세어 최상위 객체가 닫혔는지
+    확인하고, 그 외 값은 값 뒤의 첫 줄바꿈을 끝으로 봅니다.
+
+    Returns:
+        값 끝 다음 인덱스 (아직 완성되지 않았으면 None)
+    """
+    input_pos = text.find(_ACTION_INPUT_PREFIX)
+    if input_pos < 0:
+        return None
+
+    start = input_pos + len(_ACTION_INPUT_PREFIX)
+    while start < len(text) and text[start].isspace():
+        start += 1
+    if start == len(text):
+        return None
+
+    if text[start] != "{":
+        newline = text.find("\n", start)
+        return newline if newline >= 0 else None
+    return _balanced_object_end(text, start)
+
+
+def _balanced_object_end(text: str, start: int) -> Optional[int]:
+    """text[start]의 "{"로 시작하는 JSON 객체가 끝나는 위치를 반환.
+
+    문자열 안의 중괄호와 이스케이프는 건너뛰고 깊이를 셉니다.
+
+    Returns:
+        객체 끝 다음 인덱스 (닫히지 않았으면 None)
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return None
+
+
+def _length_severity(length_diff: int, min_length: int) -> Tuple[str, float]:
+    """범위를 벗어난 길이의 심각도와 최소 길이 대비 차이 비율(%)을 계산.
+
+    차이가 최소 길이의 10% 이하이면 warning, 초과하면 critical입니다.
+    """
+    diff_percentage = (length_diff / min_length) * 100 if min_length > 0 else 0
+    severity = "warning" if length_diff <= min_length * 0.1 else "critical"
+    return severity, diff_percentage
+
+
+def _keyword_severity(keyword_count: int) -> str:
+    """발견된 금지 키워드 수에 따른 심각도 (1개면 warning, 여러 개면 critical)."""
+    return "warning" if keyword_count == 1 else "critical"
+
+
+# reasoning에 나열할 최대 키워드 수
+_KEYWORD_PREVIEW_LIMIT = 10
+
+
+def _keyword_preview(found_keywords: List[str], limit: int = _KEYWORD_PREVIEW_LIMIT) -> str:
+    """발견된 키워드를 중복 없이 최대 limit개까지 repr로 나열.
+
+    나머지가 있으면 "(+N more)"로 생략합니다.
+    """
+    unique = list(dict.fromkeys(found_keywords))
+    preview = ", ".join(map(repr, unique[:limit]))
+    if len(unique) > limit:
+        preview += f", ... (+{len(unique) - limit} more)"
+    return preview
+
+
+# ===== MockReactJudge 추론 과정 템플릿 =====
+# 필드를 모두 계산한 뒤 한 번의 format으로 reasoning 문자열을 만듦
+
+_CRITERIA_TRACE = (
+    "Thought: I need to evaluate {algorithm_name} result\n"
+    "Action: get_criteria\n"
+    "Observation: Loaded criteria for {algorithm_name}"
+)
+
+_LENGTH_CHECK_TRACE = (
+    "Thought: Check if text length {raw_result} is within range\n"
+    "Action: check_threshold\n"
+    "Observation: is_within_range = {is_within_range}"
+)
+
+_LENGTH_OK_TEMPLATE = (
+    "Text length ({raw_result}) is within the allowed range ({min_length}-{max_length}).\n\n"
+    "[ReAct Trace: 3 iterations]\n"
+    + _CRITERIA_TRACE + "\n"
+    + _LENGTH_CHECK_TRACE + "\n"
+    "Thought: Text length is acceptable, submitting judgment\n"
+    "Action: submit_judgment"
+)
+
+_LENGTH_PROBLEM_HEADLINES = {
+    "warning": (
+        "Text length ({raw_result}) is slightly below minimum ({min_length}). "
+        "Difference: {length_diff} characters ({diff_percentage:.1f}%)."
+    ),
+    "critical": (
+        "Text length ({raw_result}) is significantly below minimum ({min_length}). "
+        "Difference: {length_diff} characters ({diff_percentage:.1f}% > 10% threshold)."
+    ),
+}
+
+_LENGTH_PROBLEM_TRACE = (
+    "\n\n[ReAct Trace: 4 iterations]\n"
+    + _CRITERIA_TRACE + "\n"
+    + _LENGTH_CHECK_TRACE + "\n"
+    "Thought: Length is outside range, calculating severity\n"
+    "Action: calculate_percentage\n"
+    "Observation: Difference is {diff_percentage:.1f}% of minimum\n"
+    "Thought: Severity determined as {severity}\n"
+    "Action: submit_judgment"
+)
+
+_KEYWORD_CHECK_TRACE = (
+    "Thought: Check if any forbidden keywords were found\n"
+    "Action: check_threshold\n"
+    "Observation: has_forbidden_keywords = {has_forbidden}, count = {keyword_count}"
+)
+
+_KEYWORD_OK_TEMPLATE = (
+    "No forbidden keywords were found in the text.\n\n"
+    "[ReAct Trace: 3 iterations]\n"
+    + _CRITERIA_TRACE + "\n"
+    + _KEYWORD_CHECK_TRACE + "\n"
+    "Thought: No forbidden keywords, submitting clean judgment\n"
+    "Action: submit_judgment"
+)
+
+_KEYWORD_PROBLEM_TRACE = (
+    "\n\n[ReAct Trace: 4 iterations]\n"
+    + _CRITERIA_TRACE + "\n"
+    + _KEYWORD_CHECK_TRACE + "\n"
+    "Thought: Found {keyword_count} forbidden keywords, determining severity\n"
+    "Thought: Severity is {severity} based on keyword count\n"
+    "Action: submit_judgment"
+)
+
+_UNKNOWN_TEMPLATE = "Unknown algorithm, assuming no problem\n\n" + _CRITERIA_TRACE
 
 
 class MockReactJudge:
@@ -378,9 +1110,38 @@ class MockReactJudge:
     ReAct 패턴을 시뮬레이션합니다.
     """
 
-    def __init__(self, registry: AlgorithmRegistry):
+    PARALLEL_BATCH_MIN = 1000  # 프로세스 풀 시작 비용을 감수할 최소 배치 크기
+    BATCH_CHUNKSIZE = 256  # 워커 프로세스에 한 번에 넘길 항목 수
+
+    def __init__(self, registry: Optional[AlgorithmRegistry] = None):
+        """
+        Args:
+            registry: 알고리즘 레지스트리 (규칙 판단만 할 때는 None)
+        """
         self.registry = registry
-        self.tools = JudgeTools(registry)
+        self.tools = JudgeTools(registry) if registry is not None else None
+
+    def evaluate_batch(
+        self,
+        items: Sequence[Tuple[str, Dict[str, Any]]],
+        max_workers: Optional[int] = None
+    ) -> List[JudgmentResult]:
+        """여러 실행 결과를 평가.
+
+        규칙 기반 판단은 CPU만 사용하므로 항목이 PARALLEL_BATCH_MIN개 이상이면
+        프로세스 풀에 나누어 여러 코어에서 평가합니다.
+
+        Args:
+            items: (algorithm_name, execution_result) 튜플 목록
+            max_workers: 최대 워커 프로세스 수 (None이면 CPU 수)
+
+        Returns:
+            items와 같은 순서의 판단 결과 목록
+        """
+        if len(items) < self.PARALLEL_BATCH_MIN:
+            return [self.evaluate(algorithm_name, result) for algorithm_name, result in items]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_evaluate_mock_item, items, chunksize=self.BATCH_CHUNKSIZE))
 
     def evaluate(
         self,
@@ -388,115 +1149,106 @@ class MockReactJudge:
         execution_result: Dict[str, Any]
     ) -> JudgmentResult:
         """규칙 기반으로 실행 결과를 평가 (ReAct 시뮬레이션)."""
-        reasoning_trace = []
-
-        # Step 1: Get criteria (simulated)
-        reasoning_trace.append(f"Thought: I need to evaluate {algorithm_name} result")
-        reasoning_trace.append("Action: get_criteria")
-        reasoning_trace.append(f"Observation: Loaded criteria for {algorithm_name}")
-
         if algorithm_name == "length_check":
-            return self._evaluate_length_check(execution_result, reasoning_trace)
+            return self._evaluate_length_check(execution_result)
         elif algorithm_name == "keyword_check":
-            return self._evaluate_keyword_check(execution_result, reasoning_trace)
+            return self._evaluate_keyword_check(execution_result)
         else:
             return JudgmentResult(
                 algorithm_name=algorithm_name,
                 has_problem=False,
                 severity="none",
-                reasoning="Unknown algorithm, assuming no problem\n\n" + "\n".join(reasoning_trace),
+                reasoning=_UNKNOWN_TEMPLATE.format(algorithm_name=algorithm_name),
                 summary="No issues detected"
             )
 
-    def _evaluate_length_check(self, result: Dict[str, Any], trace: List[str]) -> JudgmentResult:
+    def _evaluate_length_check(self, result: Dict[str, Any]) -> JudgmentResult:
         """길이 체크 결과 평가."""
         is_within_range = result.get("is_within_range", True)
         length_diff = result.get("length_diff", 0)
         min_length = result.get("min_length", 10)
         raw_result = result.get("raw_result", 0)
 
-        # Step 2: Check if within range
-        trace.append(f"Thought: Check if text length {raw_result} is within range")
-        trace.append("Action: check_threshold")
-        trace.append(f"Observation: is_within_range = {is_within_range}")
-
         if is_within_range:
-            trace.append("Thought: Text length is acceptable, submitting judgment")
-            trace.append("Action: submit_judgment")
-
             return JudgmentResult(
                 algorithm_name="length_check",
                 has_problem=False,
                 severity="none",
-                reasoning=f"Text length ({raw_result}) is within the allowed range ({min_length}-{result.get('max_length', 10000)}).\n\n[ReAct Trace: 3 iterations]\n" + "\n".join(trace),
+                reasoning=_LENGTH_OK_TEMPLATE.format(
+                    algorithm_name="length_check",
+                    raw_result=raw_result,
+                    is_within_range=is_within_range,
+                    min_length=min_length,
+                    max_length=result.get("max_length", 10000),
+                ),
                 summary="Text length is acceptable."
             )
 
-        # Step 3: Calculate percentage difference
-        trace.append(f"Thought: Length is outside range, calculating severity")
-        trace.append("Action: calculate_percentage")
-        threshold_10_percent = min_length * 0.1
-        diff_percentage = (length_diff / min_length) * 100 if min_length > 0 else 0
-        trace.append(f"Observation: Difference is {diff_percentage:.1f}% of minimum")
-
-        if length_diff <= threshold_10_percent:
-            severity = "warning"
-            reasoning = f"Text length ({raw_result}) is slightly below minimum ({min_length}). Difference: {length_diff} characters ({diff_percentage:.1f}%)."
-        else:
-            severity = "critical"
-            reasoning = f"Text length ({raw_result}) is significantly below minimum ({min_length}). Difference: {length_diff} characters ({diff_percentage:.1f}% > 10% threshold)."
-
-        trace.append(f"Thought: Severity determined as {severity}")
-        trace.append("Action: submit_judgment")
+        severity, diff_percentage = _length_severity(length_diff, min_length)
+        fields = {
+            "algorithm_name": "length_check",
+            "raw_result": raw_result,
+            "is_within_range": is_within_range,
+            "min_length": min_length,
+            "length_diff": length_diff,
+            "diff_percentage": diff_percentage,
+            "severity": severity,
+        }
 
         return JudgmentResult(
             algorithm_name="length_check",
             has_problem=True,
             severity=severity,
-            reasoning=reasoning + f"\n\n[ReAct Trace: 4 iterations]\n" + "\n".join(trace),
+            reasoning=(_LENGTH_PROBLEM_HEADLINES[severity] + _LENGTH_PROBLEM_TRACE).format(**fields),
             summary=f"Text length issue: {length_diff} characters {'below' if raw_result < min_length else 'above'} limit."
         )
 
-    def _evaluate_keyword_check(self, result: Dict[str, Any], trace: List[str]) -> JudgmentResult:
+    def _evaluate_keyword_check(self, result: Dict[str, Any]) -> JudgmentResult:
         """키워드 체크 결과 평가."""
         has_forbidden = result.get("has_forbidden_keywords", False)
         keyword_count = result.get("keyword_count", 0)
         found_keywords = result.get("raw_result", [])
 
-        # Step 2: Check for forbidden keywords
-        trace.append("Thought: Check if any forbidden keywords were found")
-        trace.append("Action: check_threshold")
-        trace.append(f"Observation: has_forbidden_keywords = {has_forbidden}, count = {keyword_count}")
-
         if not has_forbidden:
-            trace.append("Thought: No forbidden keywords, submitting clean judgment")
-            trace.append("Action: submit_judgment")
-
             return JudgmentResult(
                 algorithm_name="keyword_check",
                 has_problem=False,
                 severity="none",
-                reasoning="No forbidden keywords were found in the text.\n\n[ReAct Trace: 3 iterations]\n" + "\n".join(trace),
+                reasoning=_KEYWORD_OK_TEMPLATE.format(
+                    algorithm_name="keyword_check",
+                    has_forbidden=has_forbidden,
+                    keyword_count=keyword_count,
+                ),
                 summary="No forbidden keywords detected."
             )
 
-        # Step 3: Determine severity based on count
-        trace.append(f"Thought: Found {keyword_count} forbidden keywords, determining severity")
-
-        if keyword_count == 1:
-            severity = "warning"
-            reasoning = f"Found 1 forbidden keyword: '{found_keywords[0]}'. This may be a minor issue."
+        severity = _keyword_severity(keyword_count)
+        # 키워드 목록 문자열은 해당 분기에서만 생성
+        if severity == "warning":
+            headline = f"Found 1 forbidden keyword: '{found_keywords[0]}'. This may be a minor issue."
         else:
-            severity = "critical"
-            reasoning = f"Found {keyword_count} forbidden keywords: {', '.join(repr(k) for k in found_keywords)}. Multiple violations detected."
-
-        trace.append(f"Thought: Severity is {severity} based on keyword count")
-        trace.append("Action: submit_judgment")
+            headline = f"Found {keyword_count} forbidden keywords: {_keyword_preview(found_keywords)}. Multiple violations detected."
 
         return JudgmentResult(
             algorithm_name="keyword_check",
             has_problem=True,
             severity=severity,
-            reasoning=reasoning + f"\n\n[ReAct Trace: 4 iterations]\n" + "\n".join(trace),
+            reasoning=headline + _KEYWORD_PROBLEM_TRACE.format(
+                algorithm_name="keyword_check",
+                has_forbidden=has_forbidden,
+                keyword_count=keyword_count,
+                severity=severity,
+            ),
             summary=f"Found {keyword_count} forbidden keyword(s): {', '.join(found_keywords)}"
         )
+
+
+@lru_cache(maxsize=1)
+def _worker_mock_judge() -> MockReactJudge:
+    """워커 프로세스에서 재사용할 MockReactJudge (규칙 판단은 레지스트리를 쓰지 않음)."""
+    return MockReactJudge()
+
+
+def _evaluate_mock_item(item: Tuple[str, Dict[str, Any]]) -> JudgmentResult:
+    """프로세스 풀 워커에서 (algorithm_name, execution_result) 한 건을 평가."""
+    return _worker_mock_judge().evaluate(*item)
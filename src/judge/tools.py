@@ -1,16 +1,65 @@
 """ReAct Judge에서 사용하는 도구들."""
 
-import json
-from typing import Dict, Any, Callable
-from dataclasses import dataclass
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Mapping, NamedTuple, Optional, Tuple
 
+from ..json_utils import dumps_compact, loads_lenient
 
-@dataclass
-class Tool:
+
+# 도구 결과로 대화에 넣을 판단 기준 문서의 최대 길이
+MAX_TOOL_OUTPUT = 8192
+
+
+def cap_tool_output(text: str, limit: int = MAX_TOOL_OUTPUT) -> str:
+    """도구 결과 문자열을 최대 limit자로 제한.
+
+    Args:
+        text: 도구 결과 문자열
+        limit: 최대 길이
+
+    Returns:
+        limit 이하이면 그대로, 넘으면 잘린 문자열 뒤에 "...[truncated]"를 붙인 문자열
+    """
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "...[truncated]"
+
+
+# parallel 도구가 한 번에 실행할 최대 도구 호출 수
+MAX_PARALLEL_CALLS = 8
+
+# check_threshold 연산자 이름 -> (비교 함수, 표시 기호)
+_THRESHOLD_OPERATORS: Dict[str, Tuple[Callable[[float, float], bool], str]] = {
+    "gt": (operator.gt, ">"),
+    "gte": (operator.ge, ">="),
+    "lt": (operator.lt, "<"),
+    "lte": (operator.le, "<="),
+    "eq": (operator.eq, "=="),
+}
+
+
+# context 없이 호출될 때 쓰는 읽기 전용 빈 컨텍스트
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+# submit_judgment 도구가 반환하는 ReAct 루프 종료 신호
+JUDGMENT_SUBMITTED = "__JUDGMENT_SUBMITTED__"
+
+
+# 도구 입력 종류: 실행 방식과 입력 검증을 결정
+INPUT_ALGORITHM = "algorithm"  # context의 algorithm_name (없으면 입력값) 전달
+INPUT_JSON = "json"  # dict 입력만 허용
+INPUT_CALLS = "calls"  # 입력값과 context를 함께 전달
+INPUT_RAW = "raw"  # 입력값을 그대로 전달
+
+
+class Tool(NamedTuple):
     """도구 정의."""
     name: str
     description: str
     func: Callable
+    input_kind: str = INPUT_RAW
 
 
 class JudgeTools:
@@ -21,8 +70,19 @@ class JudgeTools:
         - check_threshold: 임계값 조건 확인
         - calculate_percentage: 백분율 계산
         - submit_judgment: 최종 판단 제출
+        - parallel: 서로 독립적인 여러 도구를 한 번에 실행
     """
 
+    # (도구 이름, 설명, 구현 메서드 이름, 입력 종류)
+    _TOOL_SPECS: Tuple[Tuple[str, str, str, str], ...] = (
+        ("get_criteria", "Load judgment criteria document for an algorithm", "_get_criteria", INPUT_ALGORITHM),
+        ("check_threshold", "Check if a value meets a threshold condition", "_check_threshold", INPUT_JSON),
+        ("calculate_percentage", "Calculate what percentage one value is of another",
+         "_calculate_percentage", INPUT_JSON),
+        ("submit_judgment", "Submit the final judgment", "_submit_judgment", INPUT_JSON),
+        ("parallel", "Run several independent tool calls at once", "_parallel", INPUT_CALLS),
+    )
+
     def __init__(self, registry):
         """
         Args:
@@ -35,26 +95,8 @@ class JudgeTools:
     def _setup_tools(self):
         """도구들을 설정."""
         self._tools = {
-            "get_criteria": Tool(
-                name="get_criteria",
-                description="Load judgment criteria document for an algorithm",
-                func=self._get_criteria
-            ),
-            "check_threshold": Tool(
-                name="check_threshold",
-                description="Check if a value meets a threshold condition",
-                func=self._check_threshold
-            ),
-            "calculate_percentage": Tool(
-                name="calculate_percentage",
-                description="Calculate what percentage one value is of another",
-                func=self._calculate_percentage
-            ),
-            "submit_judgment": Tool(
-                name="submit_judgment",
-                description="Submit the final judgment",
-                func=self._submit_judgment
-            ),
+            name: Tool(name, description, getattr(self, method_name), input_kind)
+            for name, description, method_name, input_kind in self._TOOL_SPECS
         }
 
     @property
@@ -78,7 +120,7 @@ class JudgeTools:
             raise KeyError(f"Unknown tool: {name}")
         return self._tools[name]
 
-    def execute(self, tool_name: str, input_data: Any, context: Dict[str, Any] = None) -> str:
+    def execute(self, tool_name: str, input_data: Any, context: Optional[Mapping[str, Any]] = None) -> str:
         """도구를 실행하고 결과를 반환.
 
         Args:
@@ -89,25 +131,26 @@ class JudgeTools:
         Returns:
             도구 실행 결과 문자열
         """
-        context = context or {}
+        if context is None:
+            context = _EMPTY_CONTEXT
 
-        if tool_name not in self._tools:
+        tool = self._tools.get(tool_name)
+        if tool is None:
             return f"Error: Unknown tool '{tool_name}'. Available tools: {list(self._tools.keys())}"
 
-        tool = self._tools[tool_name]
-
         try:
-            if tool_name == "get_criteria":
+            kind = tool.input_kind
+            if kind == INPUT_ALGORITHM:
                 # algorithm_name은 context에서 가져오거나 input_data 사용
-                algo_name = context.get("algorithm_name", input_data)
-                return tool.func(algo_name)
-            elif tool_name in ["check_threshold", "calculate_percentage", "submit_judgment"]:
-                if isinstance(input_data, dict):
-                    return tool.func(input_data)
-                else:
-                    return f"Error: {tool_name} requires JSON input"
-            else:
-                return tool.func(input_data)
+                return tool.func(context.get("algorithm_name", input_data))
+            if kind in (INPUT_JSON, INPUT_CALLS) and isinstance(input_data, str):
+                # 문자열로 남은 JSON은 한 번 더 보정해 LLM 재시도 왕복을 줄임
+                input_data = loads_lenient(input_data)
+            if kind == INPUT_CALLS:
+                return tool.func(input_data, context)
+            if kind == INPUT_JSON and not isinstance(input_data, dict):
+                return f"Error: {tool_name} requires JSON input"
+            return tool.func(input_data)
         except Exception as e:
             return f"Error executing {tool_name}: {e}"
 
@@ -124,17 +167,20 @@ class JudgeTools:
         """
         try:
             criteria = self.registry.get_criteria_document(algorithm_name)
-            return f"Criteria document loaded:\n\n{criteria}"
+            return f"Criteria document loaded:\n\n{cap_tool_output(criteria)}"
         except Exception as e:
             return f"Error loading criteria: {e}"
 
     def _check_threshold(self, input_data: Dict[str, Any]) -> str:
         """임계값 조건을 확인.
 
+        "values"를 주면 여러 값을 한 번에 비교합니다. 이때 threshold는 하나의
+        숫자(모든 값에 적용) 또는 values와 길이가 같은 목록입니다.
+
         Args:
             input_data: {
-                "value": number,
-                "threshold": number,
+                "value": number,  (또는 "values": [number, ...])
+                "threshold": number,  (values와 함께 쓰면 [number, ...]도 가능)
                 "operator": "gt"|"gte"|"lt"|"lte"|"eq"
             }
 
@@ -142,31 +188,54 @@ class JudgeTools:
             JSON 형식의 결과 또는 에러 메시지
         """
         try:
-            value = float(input_data.get("value", 0))
-            threshold = float(input_data.get("threshold", 0))
-            operator = input_data.get("operator", "gte")
-
-            operators = {
-                "gt": (lambda v, t: v > t, ">"),
-                "gte": (lambda v, t: v >= t, ">="),
-                "lt": (lambda v, t: v < t, "<"),
-                "lte": (lambda v, t: v <= t, "<="),
-                "eq": (lambda v, t: v == t, "=="),
-            }
+            operator_name = input_data.get("operator", "gte")
 
-            if operator not in operators:
-                return f"Error: Unknown operator '{operator}'. Use: gt, gte, lt, lte, eq"
+            entry = _THRESHOLD_OPERATORS.get(operator_name)
+            if entry is None:
+                return f"Error: Unknown operator '{operator_name}'. Use: gt, gte, lt, lte, eq"
 
-            func, symbol = operators[operator]
+            func, symbol = entry
+            if "values" in input_data:
+                return self._check_thresholds(input_data["values"], input_data.get("threshold", 0), func, symbol)
+
+            value = float(input_data.get("value", 0))
+            threshold = float(input_data.get("threshold", 0))
             result = func(value, threshold)
 
-            return json.dumps({
+            return dumps_compact({
                 "result": result,
                 "comparison": f"{value} {symbol} {threshold} = {result}"
             })
         except Exception as e:
             return f"Error checking threshold: {e}"
 
+    @staticmethod
+    def _check_thresholds(
+        values: Any,
+        threshold: Any,
+        func: Callable[[float, float], bool],
+        symbol: str
+    ) -> str:
+        """여러 값을 같은 연산자로 한 번에 비교 (check_threshold의 values 입력)."""
+        if not isinstance(values, list):
+            return "Error: values must be a list of numbers"
+        values = [float(value) for value in values]
+        if isinstance(threshold, list):
+            if len(threshold) != len(values):
+                return "Error: threshold list must have the same length as values"
+            thresholds = [float(t) for t in threshold]
+        else:
+            thresholds = [float(threshold)] * len(values)
+
+        results = list(map(func, values, thresholds))
+        return dumps_compact({
+            "results": results,
+            "all": all(results),
+            "any": any(results),
+            "count": sum(results),
+            "operator": symbol
+        })
+
     def _calculate_percentage(self, input_data: Dict[str, Any]) -> str:
         """백분율을 계산.
 
@@ -184,17 +253,46 @@ class JudgeTools:
             total = float(input_data.get("total", 1))
 
             if total == 0:
-                return json.dumps({"error": "Cannot divide by zero"})
+                return dumps_compact({"error": "Cannot divide by zero"})
 
             percentage = (value / total) * 100
 
-            return json.dumps({
+            return dumps_compact({
                 "percentage": round(percentage, 2),
                 "calculation": f"{value} / {total} * 100 = {percentage:.2f}%"
             })
         except Exception as e:
             return f"Error calculating percentage: {e}"
 
+    def _parallel(self, calls: Any, context: Mapping[str, Any]) -> str:
+        """서로 독립적인 여러 도구 호출을 동시에 실행.
+
+        Args:
+            calls: [{"tool": str, "input": Any}, ...]
+            context: 각 도구에 전달할 실행 컨텍스트
+
+        Returns:
+            호출 순서대로 번호를 붙여 합친 각 도구의 결과 또는 에러 메시지
+        """
+        if not isinstance(calls, list) or not calls or not all(isinstance(call, dict) for call in calls):
+            return 'Error: parallel requires a JSON list of {"tool": ..., "input": ...} objects'
+        if len(calls) > MAX_PARALLEL_CALLS:
+            return f"Error: parallel accepts at most {MAX_PARALLEL_CALLS} calls"
+        tool_names: List[Any] = [call.get("tool") for call in calls]
+        if any(name in ("parallel", "submit_judgment") for name in tool_names):
+            return "Error: parallel cannot include parallel or submit_judgment"
+
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            results = list(pool.map(
+                lambda call: self.execute(call.get("tool"), call.get("input"), context),
+                calls
+            ))
+
+        return "\n".join([
+            f"[{idx}] {name}: {result}"
+            for idx, (name, result) in enumerate(zip(tool_names, results), start=1)
+        ])
+
     def _submit_judgment(self, input_data: Dict[str, Any]) -> str:
         """최종 판단을 제출.
 
@@ -211,7 +309,11 @@ class JudgeTools:
         Returns:
             특별한 종료 신호 문자열
         """
-        return "__JUDGMENT_SUBMITTED__"
+        return JUDGMENT_SUBMITTED
+
+
+# 사용 가능한 도구 이름 (구조화된 출력 스키마용, _TOOL_SPECS 순서)
+TOOL_NAMES: Tuple[str, ...] = tuple(spec[0] for spec in JudgeTools._TOOL_SPECS)
 
 
 # 도구 설명 (시스템 프롬프트용)
@@ -223,6 +325,8 @@ TOOLS_DESCRIPTION = """
 2. **check_threshold** - Check if a value meets a threshold condition
    - Input: {"value": number, "threshold": number, "operator": "gt"|"gte"|"lt"|"lte"|"eq"}
    - Output: {"result": true/false, "comparison": "value operator threshold"}
+   - To compare many values at once use {"values": [number, ...], "threshold": number or [number, ...], "operator": ...}
+     and get {"results": [...], "all": ..., "any": ..., "count": ...}
 
 3. **calculate_percentage** - Calculate what percentage one value is of another
    - Input: {"value": number, "total": number}
@@ -231,4 +335,8 @@ TOOLS_DESCRIPTION = """
 4. **submit_judgment** - Submit your final judgment (use this when you've reached a conclusion)
    - Input: {"has_problem": true/false, "severity": "none"|"warning"|"critical", "reasoning": "...", "summary": "..."}
    - Output: Judgment recorded
+
+5. **parallel** - Run several independent tool calls in one step (e.g. multiple check_threshold calls)
+   - Input: [{"tool": "check_threshold", "input": {...}}, {"tool": "calculate_percentage", "input": {...}}]
+   - Output: Each result on its own line, numbered in call order
 """
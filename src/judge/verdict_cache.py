@@ -0,0 +1,116 @@
+"""Judge 판단 결과 캐시.
+
+같은 입력(모델, 프롬프트 버전, 알고리즘, 판단 기준, 실행 결과)에 대한 판단을
+sqlite3에 저장해 두고, 이후 동일한 입력이 들어오면 LLM 호출 없이 저장된 판단을
+반환합니다. 최근 조회한 판단은 메모리 LRU에도 보관해 DB 조회를 생략합니다.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Dict, Optional
+
+from ..json_utils import dumps_compact, loads as json_loads
+from ..models import JudgmentResult
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "react_judge", "verdicts.db")
+
+
+class JudgeCache:
+    """SHA-256 키 기반 판단 결과 캐시.
+
+    여러 Executor가 같은 DB를 동시에 사용할 수 있도록 WAL 모드로 엽니다.
+    """
+
+    DEFAULT_MEMORY_SIZE = 1024
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, memory_size: int = DEFAULT_MEMORY_SIZE):
+        """
+        Args:
+            path: sqlite3 DB 파일 경로 (":memory:"이면 프로세스 메모리에만 저장)
+            memory_size: 메모리 LRU에 보관할 최대 판단 수 (0이면 사용 안 함)
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, JudgmentResult]" = OrderedDict()
+        # 여러 스레드의 Judge가 같은 캐시를 공유하므로 연결과 LRU 접근을 직렬화
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts ("
+            "hash TEXT PRIMARY KEY, algorithm TEXT, verdict_json TEXT, created REAL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(namespace: str, algorithm_name: str, execution_result: Dict[str, Any]) -> str:
+        """캐시 키를 생성.
+
+        Args:
+            namespace: 판단에 영향을 주는 기타 설정 (모델, 판단 기준 등)
+            algorithm_name: 알고리즘 이름
+            execution_result: 알고리즘 실행 결과
+
+        Returns:
+            SHA-256 hex digest
+        """
+        canonical = dumps_compact(execution_result, sort_keys=True, default=str)
+        payload = f"{namespace}\0{algorithm_name}\0{canonical}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[JudgmentResult]:
+        """저장된 판단 결과를 조회. 없으면 None."""
+        with self._lock:
+            judgment = self._memory.get(key)
+            if judgment is not None:
+                self._memory.move_to_end(key)
+                return judgment
+            row = self._conn.execute(
+                "SELECT verdict_json FROM verdicts WHERE hash = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            judgment = JudgmentResult(**json_loads(row[0]))
+            self._remember(key, judgment)
+            return judgment
+
+    def put(self, key: str, judgment: JudgmentResult) -> None:
+        """판단 결과를 저장."""
+        verdict_json = dumps_compact(asdict(judgment), default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO verdicts (hash, algorithm, verdict_json, created) VALUES (?, ?, ?, ?)",
+                (key, judgment.algorithm_name, verdict_json, time.time()),
+            )
+            self._conn.commit()
+            self._remember(key, judgment)
+
+    def _remember(self, key: str, judgment: JudgmentResult) -> None:
+        """메모리 LRU에 판단을 보관하고 초과분을 제거 (lock을 잡은 상태에서 호출)."""
+        if self.memory_size <= 0:
+            return
+        self._memory[key] = judgment
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """저장된 판단 결과를 모두 삭제."""
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM verdicts")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """DB 연결을 닫음."""
+        self._conn.close()
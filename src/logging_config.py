@@ -26,13 +26,24 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",
     }
 
-    def format(self, record):
-        log_color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         reset = self.COLORS["RESET"]
+        # 레벨 이름 -> 색상이 적용된 레벨 이름 (레코드마다 문자열을 만들지 않도록 미리 구성)
+        self._colored_levelnames = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items()
+            if level != "RESET"
+        }
 
-        # 레벨 이름에 색상 적용
-        record.levelname = f"{log_color}{record.levelname}{reset}"
-        return super().format(record)
+    def format(self, record):
+        levelname = record.levelname
+        # 레벨 이름에 색상 적용 (같은 레코드를 받는 파일 핸들러에는 원래 이름이 남도록 복원)
+        record.levelname = self._colored_levelnames.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 class JudgeReasoningFilter(logging.Filter):
@@ -129,60 +140,57 @@ def get_logger(name: str = None) -> logging.Logger:
     return logging.getLogger(LOGGER_NAME)
 
 
+# 로그 헬퍼가 이벤트마다 getLogger를 호출하지 않도록 미리 가져온 로거
+# (setup_logging은 같은 로거 객체의 레벨과 핸들러를 바꾸므로 그대로 유효)
+_executor_logger = get_logger("executor")
+_judge_logger = get_logger("judge")
+
+
 def log_execution_start(text_length: int, algorithm_count: int):
     """실행 시작 로그."""
-    logger = get_logger("executor")
-    logger.info(
-        f"Analysis started: text_length={text_length}, algorithms={algorithm_count}"
+    _executor_logger.info(
+        "Analysis started: text_length=%s, algorithms=%s", text_length, algorithm_count
     )
 
 
 def log_execution_end(status: str, executed_steps: int, total_steps: int):
     """실행 종료 로그."""
-    logger = get_logger("executor")
-    logger.info(
-        f"Analysis completed: status={status}, executed={executed_steps}/{total_steps}"
+    _executor_logger.info(
+        "Analysis completed: status=%s, executed=%s/%s", status, executed_steps, total_steps
     )
 
 
 def log_step_start(step_id: int, algorithm_name: str):
     """스텝 시작 로그."""
-    logger = get_logger("executor")
-    logger.info(f"Step {step_id} started: {algorithm_name}")
+    _executor_logger.info("Step %s started: %s", step_id, algorithm_name)
 
 
 def log_step_end(step_id: int, algorithm_name: str, has_problem: bool, severity: str):
     """스텝 종료 로그."""
-    logger = get_logger("executor")
+    # 인자는 로그가 실제로 출력될 때만 포매팅됨
     if has_problem:
         if severity == "critical":
-            logger.warning(
-                f"Step {step_id} ({algorithm_name}): CRITICAL problem found"
-            )
+            _executor_logger.warning("Step %s (%s): CRITICAL problem found", step_id, algorithm_name)
         else:
-            logger.warning(
-                f"Step {step_id} ({algorithm_name}): {severity.upper()} - problem found"
-            )
+            _executor_logger.warning("Step %s (%s): %s - problem found", step_id, algorithm_name, severity.upper())
     else:
-        logger.info(f"Step {step_id} ({algorithm_name}): passed")
+        _executor_logger.info("Step %s (%s): passed", step_id, algorithm_name)
 
 
 def log_judge_reasoning(algorithm_name: str, reasoning: str, summary: str):
     """Judge reasoning 로그."""
-    logger = get_logger("judge")
-    logger.debug(
-        f"Judge reasoning for {algorithm_name}:\n"
-        f"  Reasoning: {reasoning}\n"
-        f"  Summary: {summary}"
+    # reasoning은 수 KB일 수 있으므로 DEBUG가 꺼져 있으면 문자열을 만들지 않음
+    if not _judge_logger.isEnabledFor(logging.DEBUG):
+        return
+    _judge_logger.debug(
+        "Judge reasoning for %s:\n  Reasoning: %s\n  Summary: %s",
+        algorithm_name, reasoning, summary
     )
 
 
 def log_early_exit(step_id: int, algorithm_name: str, reason: str):
     """조기 종료 로그."""
-    logger = get_logger("executor")
-    logger.warning(
-        f"Early exit at step {step_id} ({algorithm_name}): {reason}"
-    )
+    _executor_logger.warning("Early exit at step %s (%s): %s", step_id, algorithm_name, reason)
 
 
 def create_log_file_path(base_dir: str = "logs") -> str:
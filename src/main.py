@@ -32,11 +32,12 @@ class TextAnalyzer:
         auto_save_report: bool = False,
         report_output_path: str = "report.md",
         auto_save_reasoning_trace: bool = False,
-        reasoning_trace_path: str = "reasoning_trace.md"
+        reasoning_trace_path: str = "reasoning_trace.md",
+        default_input_specs: Optional[Dict[str, Dict[str, Any]]] = None
     ):
         """
         Args:
-            algorithm_order: 알고리즘 실행 순서
+            algorithm_order: 알고리즘 실행 순서 (None이면 cost_hint가 낮은 알고리즘부터)
             use_llm_judge: LLM 기반 Judge 사용 여부 (False면 Mock Judge 사용)
             llm_provider: LLM 제공자 ("openai" 또는 "anthropic")
             llm_model: 사용할 모델 이름
@@ -47,20 +48,24 @@ class TextAnalyzer:
             report_output_path: 리포트 저장 경로 (auto_save_report=True일 때)
             auto_save_reasoning_trace: 상세 추론 과정 자동 저장 여부
             reasoning_trace_path: 추론 과정 저장 경로 (auto_save_reasoning_trace=True일 때)
+            default_input_specs: 모든 분석에 공통으로 적용할 알고리즘별 입력 명세
+                (analyze의 input_specs가 알고리즘 단위로 우선 적용됨)
         """
-        # Registry 초기화 (싱글톤 리셋 후 새로 생성)
-        AlgorithmRegistry.reset()
+        # Registry 초기화
         self.registry = AlgorithmRegistry(criteria_path=criteria_path)
 
         # 기본 알고리즘 등록
         self._register_default_algorithms()
 
         # 컴포넌트 초기화
-        self.algorithm_order = algorithm_order or ["length_check", "keyword_check"]
+        self.algorithm_order = algorithm_order or self._default_algorithm_order()
 
         self.planner = Planner(
             registry=self.registry,
-            algorithm_order=self.algorithm_order
+            algorithm_order=self.algorithm_order,
+            default_input_specs=default_input_specs,
+            # 조기 종료하지 않으면 단계 간 순서가 필요 없으므로 동시에 실행되도록 연결하지 않음
+            chain_steps=early_exit_on_critical
         )
 
         if use_llm_judge:
@@ -92,6 +97,13 @@ class TextAnalyzer:
         self.registry.register(LengthCheckAlgorithm())
         self.registry.register(KeywordCheckAlgorithm())
 
+    def _default_algorithm_order(self) -> List[str]:
+        """등록된 알고리즘을 cost_hint가 낮은 순서로 정렬 (같으면 등록 순서)."""
+        return sorted(
+            self.registry.list_algorithms(),
+            key=lambda name: self.registry.get_algorithm(name).cost_hint
+        )
+
     def analyze(
         self,
         text: str,
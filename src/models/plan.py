@@ -30,17 +30,18 @@ class Plan:
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
+        # 시각 문자열은 비용이 있으므로 키가 없을 때만 생성
         if "created_at" not in self.metadata:
             self.metadata["created_at"] = datetime.now().isoformat()
-        if "total_steps" not in self.metadata:
-            self.metadata["total_steps"] = len(self.steps)
+        self.metadata.setdefault("total_steps", len(self.steps))
+        # step_id -> PlanStep (같은 step_id가 여러 개면 먼저 나온 단계)
+        self._step_index: Dict[int, PlanStep] = {}
+        for step in self.steps:
+            self._step_index.setdefault(step.step_id, step)
 
     def get_step(self, step_id: int) -> Optional[PlanStep]:
         """step_id로 PlanStep을 찾아 반환."""
-        for step in self.steps:
-            if step.step_id == step_id:
-                return step
-        return None
+        return self._step_index.get(step_id)
 
     def get_execution_order(self) -> List[PlanStep]:
         """의존성을 고려한 실행 순서 반환."""
@@ -12,6 +12,8 @@ class AnalysisReport:
     execution_result: ExecutionResult
     report_content: str                       # Markdown 형식 리포트 내용
     generated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # 리포트에 넣은 단계별 실행 결과 JSON (step_results 순서, 추론 과정 파일에서 재사용)
+    execution_result_json: List[str] = field(default_factory=list, repr=False)
 
     @property
     def status(self) -> str:
@@ -5,6 +5,13 @@ from datetime import datetime
 from .plan import Plan, PlanStep
 
 
+# 에러 메시지에 쓰는 순서를 유지한 허용값과 검증용 집합
+_SEVERITY_CHOICES = ["critical", "warning", "none"]
+_VALID_SEVERITIES = frozenset(_SEVERITY_CHOICES)
+_STATUS_CHOICES = ["problem_found", "all_passed"]
+_VALID_STATUSES = frozenset(_STATUS_CHOICES)
+
+
 @dataclass
 class JudgmentResult:
     """Judge의 판단 결과."""
@@ -17,9 +24,8 @@ class JudgmentResult:
     detailed_trace: Optional[List[Dict[str, Any]]] = None  # 상세 추론 과정 (ReAct 사이클)
 
     def __post_init__(self):
-        valid_severities = ["critical", "warning", "none"]
-        if self.severity not in valid_severities:
-            raise ValueError(f"severity must be one of {valid_severities}, got '{self.severity}'")
+        if self.severity not in _VALID_SEVERITIES:
+            raise ValueError(f"severity must be one of {_SEVERITY_CHOICES}, got '{self.severity}'")
 
 
 @dataclass
@@ -42,9 +48,8 @@ class ExecutionResult:
     stopped_at: Optional[PlanStep] = None     # 조기 종료 시 중단된 단계
 
     def __post_init__(self):
-        valid_statuses = ["problem_found", "all_passed"]
-        if self.status not in valid_statuses:
-            raise ValueError(f"status must be one of {valid_statuses}, got '{self.status}'")
+        if self.status not in _VALID_STATUSES:
+            raise ValueError(f"status must be one of {_STATUS_CHOICES}, got '{self.status}'")
 
     @property
     def has_problem(self) -> bool:
@@ -4,6 +4,10 @@ from ..models import PlanStep, Plan
 from ..registry import AlgorithmRegistry
 
 
+# 명세가 없는 알고리즘에 쓰는 공용 기본값 (읽기 전용으로만 사용)
+_EMPTY_SPEC: Dict[str, Any] = {}
+
+
 class Planner:
     """분석 실행 계획을 생성하는 Planner.
 
@@ -13,15 +17,25 @@ class Planner:
     def __init__(
         self,
         registry: AlgorithmRegistry,
-        algorithm_order: Optional[List[str]] = None
+        algorithm_order: Optional[List[str]] = None,
+        default_input_specs: Optional[Dict[str, Dict[str, Any]]] = None,
+        chain_steps: bool = True
     ):
         """
         Args:
             registry: 알고리즘 레지스트리
             algorithm_order: 알고리즘 실행 순서 (None이면 등록 순서 사용)
+            default_input_specs: 모든 계획에 공통으로 적용할 알고리즘별 입력 명세
+            chain_steps: 각 단계가 이전 단계에 의존하도록 연결할지 여부. 알고리즘은
+                서로의 결과를 쓰지 않으므로, 의존성은 조기 종료 판단 순서를 위한 것이며
+                조기 종료를 쓰지 않으면 False로 두어 단계들을 동시에 실행할 수 있음
         """
         self.registry = registry
         self.algorithm_order = algorithm_order or registry.list_algorithms()
+        self.default_input_specs = default_input_specs or {}
+        self.chain_steps = chain_steps
+        # 알고리즘 이름 -> 설명 (create_plan마다 레지스트리를 다시 조회하지 않도록 보관)
+        self._descriptions: Dict[str, str] = {}
 
     def create_plan(
         self,
@@ -34,26 +48,34 @@ class Planner:
             text: 분석할 텍스트
             input_specs: 각 알고리즘에 전달할 추가 입력 명세
                         예: {"length_check": {"min_length": 20}}
+                        default_input_specs보다 우선 적용됨
 
         Returns:
             Plan: 생성된 실행 계획
         """
         input_specs = input_specs or {}
+        default_input_specs = self.default_input_specs
         steps: List[PlanStep] = []
 
-        for idx, algorithm_name in enumerate(self.algorithm_order, start=1):
+        for algorithm_name in self.algorithm_order:
             if not self.registry.has_algorithm(algorithm_name):
                 continue
 
             description = self._get_description(algorithm_name)
-            spec = input_specs.get(algorithm_name, {})
-            spec["text"] = text
-
-            # 첫 번째 단계를 제외한 모든 단계는 이전 단계에 의존
-            depends_on = [idx - 1] if idx > 1 else []
+            # 호출자의 명세 dict를 변경하지 않도록 스텝마다 새 dict를 구성
+            spec = {
+                **default_input_specs.get(algorithm_name, _EMPTY_SPEC),
+                **input_specs.get(algorithm_name, _EMPTY_SPEC),
+                "text": text,
+            }
+
+            # step_id는 생성된 스텝 기준으로 매기고, chain_steps이면 첫 번째 단계를 제외한
+            # 모든 단계는 이전 단계에 의존 (등록되지 않아 건너뛴 알고리즘이 있어도 의존성이 끊기지 않음)
+            step_id = len(steps) + 1
+            depends_on = [step_id - 1] if self.chain_steps and step_id > 1 else []
 
             step = PlanStep(
-                step_id=idx,
+                step_id=step_id,
                 algorithm_name=algorithm_name,
                 description=description,
                 input_spec=spec,
@@ -61,9 +83,10 @@ class Planner:
             )
             steps.append(step)
 
+        text_length = len(text)
         metadata = {
-            "text_preview": text[:100] + "..." if len(text) > 100 else text,
-            "text_length": len(text),
+            "text_preview": text[:100] + "..." if text_length > 100 else text,
+            "text_length": text_length,
             "algorithm_count": len(steps)
         }
 
@@ -78,11 +101,20 @@ class Planner:
         Returns:
             알고리즘 설명 문자열
         """
+        description = self._descriptions.get(algorithm_name)
+        if description is not None:
+            return description
         try:
             algorithm = self.registry.get_algorithm(algorithm_name)
-            return algorithm.description
+            description = algorithm.description
         except KeyError:
             return f"Execute {algorithm_name} algorithm"
+        self._descriptions[algorithm_name] = description
+        return description
+
+    def invalidate_descriptions(self) -> None:
+        """보관한 알고리즘 설명을 비움 (알고리즘을 다시 등록한 경우 호출)."""
+        self._descriptions.clear()
 
     def validate_plan(self, plan: Plan) -> bool:
         """계획의 유효성을 검증.
@@ -96,16 +128,15 @@ class Planner:
         if not plan.steps:
             return False
 
-        step_ids = {step.step_id for step in plan.steps}
-
-        for step in plan.steps:
-            # 알고리즘 존재 여부 확인
-            if not self.registry.has_algorithm(step.algorithm_name):
-                return False
-
-            # 의존성 검증
-            for dep_id in step.depends_on:
-                if dep_id not in step_ids:
-                    return False
+        # 알고리즘 존재 여부 확인 (같은 알고리즘을 쓰는 스텝은 한 번만 조회)
+        algorithm_names = {step.algorithm_name for step in plan.steps}
+        if not all(self.registry.has_algorithm(name) for name in algorithm_names):
+            return False
 
-        return True
+        # 의존성 검증
+        step_ids = {step.step_id for step in plan.steps}
+        return all(
+            dep_id in step_ids
+            for step in plan.steps
+            for dep_id in step.depends_on
+        )
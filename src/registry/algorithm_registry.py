@@ -1,7 +1,10 @@
-from typing import Dict, List, Optional, Type
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 from pathlib import Path
 
 from ..algorithms.base import BaseAlgorithm
+from ..criteria_index import clear_cache as clear_criteria_index, get_criteria
 from ..exceptions import (
     AlgorithmNotFoundError,
     AlgorithmRegistrationError,
@@ -9,27 +12,25 @@ from ..exceptions import (
 )
 
 
+# 판단 기준 문서에 이 표시가 있으면 Judge 호출 없이 항상 문제 없음으로 처리 (명시적 opt-in)
+JUDGE_SKIP_MARKER = "<!-- judge: skip -->"
+
+
 class AlgorithmRegistry:
     """알고리즘을 등록하고 관리하는 레지스트리.
 
-    싱글톤 패턴을 사용하여 애플리케이션 전체에서 하나의 인스턴스만 사용합니다.
+    인스턴스마다 독립된 알고리즘 목록을 가지므로 여러 분석기를 동시에 사용할 수 있습니다.
     """
 
-    _instance: Optional["AlgorithmRegistry"] = None
-    _algorithms: Dict[str, BaseAlgorithm]
-    _criteria_path: Path
-
-    def __new__(cls, criteria_path: str = "src/criteria") -> "AlgorithmRegistry":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._algorithms = {}
-            cls._instance._criteria_path = Path(criteria_path)
-        return cls._instance
-
-    @classmethod
-    def reset(cls) -> None:
-        """레지스트리를 초기화합니다 (테스트용)."""
-        cls._instance = None
+    def __init__(self, criteria_path: str = "src/criteria"):
+        """
+        Args:
+            criteria_path: 판단 기준 문서 디렉토리
+        """
+        self._algorithms: Dict[str, BaseAlgorithm] = {}
+        # 알고리즘 메타데이터는 등록 후 바뀌지 않으므로 읽기 전용 정보를 등록 시점에 만들어 둠
+        self._info: Dict[str, Mapping[str, str]] = {}
+        self._criteria_path = Path(criteria_path)
 
     def register(self, algorithm: BaseAlgorithm) -> None:
         """알고리즘을 레지스트리에 등록.
@@ -40,10 +41,15 @@ class AlgorithmRegistry:
         Raises:
             AlgorithmRegistrationError: 이미 동일한 이름의 알고리즘이 등록되어 있는 경우
         """
-        name = algorithm.name
+        # 설정 등에서 런타임에 만든 이름도 interning해 조회 시 문자열 비교를 포인터 비교로 끝냄
+        name = sys.intern(algorithm.name)
         if name in self._algorithms:
             raise AlgorithmRegistrationError(name, "Algorithm is already registered")
         self._algorithms[name] = algorithm
+        self._info[name] = MappingProxyType({
+            "name": name,
+            "description": algorithm.description
+        })
 
     def get_algorithm(self, name: str) -> BaseAlgorithm:
         """이름으로 알고리즘을 조회.
@@ -57,13 +63,17 @@ class AlgorithmRegistry:
         Raises:
             AlgorithmNotFoundError: 등록되지 않은 알고리즘인 경우
         """
-        if name not in self._algorithms:
+        algorithm = self._algorithms.get(name)
+        if algorithm is None:
             raise AlgorithmNotFoundError(name)
-        return self._algorithms[name]
+        return algorithm
 
     def get_criteria_document(self, algorithm_name: str) -> str:
         """알고리즘에 대한 판단 기준 문서를 조회.
 
+        문서 내용은 criteria_index에서 mtime으로 재검증하며 캐싱하므로 ReAct
+        루프에서 반복 조회해도 파일을 다시 읽지 않습니다.
+
         Args:
             algorithm_name: 알고리즘 이름
 
@@ -73,10 +83,29 @@ class AlgorithmRegistry:
         Raises:
             CriteriaNotFoundError: 판단 기준 문서가 없는 경우
         """
-        criteria_file = self._criteria_path / f"{algorithm_name}.md"
-        if not criteria_file.exists():
-            raise CriteriaNotFoundError(algorithm_name, str(criteria_file))
-        return criteria_file.read_text(encoding="utf-8")
+        return get_criteria(algorithm_name, str(self._criteria_path))
+
+    def clear_criteria_cache(self) -> None:
+        """캐시된 판단 기준 문서를 모두 제거합니다 (테스트용)."""
+        clear_criteria_index()
+
+    def is_judge_trivial(self, name: str) -> bool:
+        """판단 기준 문서가 Judge 생략을 명시했는지 확인.
+
+        문서에 JUDGE_SKIP_MARKER가 있을 때만 True입니다. 문서는 criteria_index가
+        mtime으로 재검증하므로 문서를 수정하면 다음 조회부터 반영됩니다.
+
+        Args:
+            name: 알고리즘 이름
+
+        Returns:
+            Judge 호출 없이 문제 없음으로 처리해도 되는지 여부 (문서가 없으면 False)
+        """
+        try:
+            document = self.get_criteria_document(name)
+        except CriteriaNotFoundError:
+            return False
+        return JUDGE_SKIP_MARKER in document
 
     def list_algorithms(self) -> List[str]:
         """등록된 모든 알고리즘 이름 목록을 반환.
@@ -109,18 +138,21 @@ class AlgorithmRegistry:
         if name not in self._algorithms:
             raise AlgorithmNotFoundError(name)
         del self._algorithms[name]
+        self._info.pop(name, None)
 
-    def get_algorithm_info(self, name: str) -> Dict[str, str]:
+    def get_algorithm_info(self, name: str) -> Mapping[str, str]:
         """알고리즘의 상세 정보를 반환.
 
         Args:
             name: 알고리즘 이름
 
         Returns:
-            알고리즘 정보 딕셔너리 (name, description)
+            알고리즘 정보 (name, description). 읽기 전용
+
+        Raises:
+            AlgorithmNotFoundError: 등록되지 않은 알고리즘인 경우
         """
-        algorithm = self.get_algorithm(name)
-        return {
-            "name": algorithm.name,
-            "description": algorithm.description
-        }
+        info = self._info.get(name)
+        if info is None:
+            raise AlgorithmNotFoundError(name)
+        return info
@@ -1,10 +1,68 @@
-import json
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, List
 
+from ..json_utils import dumps_pretty
 from ..models import ExecutionResult, AnalysisReport, StepResult
 
 
+# 심각도 -> 표시 아이콘
+_SEVERITY_ICONS = {
+    "none": "✅",
+    "warning": "⚠️",
+    "critical": "🚨"
+}
+
+# 실행 상태 -> 표시 문구
+_STATUS_LABELS = {
+    "all_passed": "✅ 모두 통과",
+    "problem_found": "🚨 문제 발견"
+}
+
+# 리포트 전체 구조 (헤더, 요약, 실행 정보, 단계별 결과, 결론)
+# early_exit와 steps는 비어 있거나 각 항목 뒤에 줄바꿈을 포함한 문자열
+_REPORT_TEMPLATE = (
+    "# 텍스트 분석 리포트\n"
+    "\n"
+    "**생성 시각**: {generated_at}\n"
+    "\n"
+    "## 요약\n"
+    "\n"
+    "{summary}\n"
+    "\n"
+    "## 실행 정보\n"
+    "\n"
+    "- **전체 단계 수**: {total_steps}\n"
+    "- **실행된 단계 수**: {executed_steps}\n"
+    "- **상태**: {status}\n"
+    "{early_exit}"
+    "\n"
+    "## 단계별 분석 결과\n"
+    "\n"
+    "{steps}"
+    "## 결론\n"
+    "\n"
+    "{conclusion}"
+)
+
+# 추론 과정 파일을 줄 단위로 기록할 때 쓰는 쓰기 버퍼 크기 (write 시스템 콜 수를 줄임)
+TRACE_WRITE_BUFFER = 256 * 1024
+
+# 리포트 헤더의 생성 시각 표시 형식
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _format_generated_at(generated_at: str) -> str:
+    """AnalysisReport.generated_at(ISO 형식)을 헤더 표시 형식으로 변환.
+
+    ISO 형식이 아니면 원래 문자열을 그대로 사용합니다.
+    """
+    try:
+        return datetime.fromisoformat(generated_at).strftime(TIMESTAMP_FORMAT)
+    except ValueError:
+        return generated_at
+
+
 class Reporter:
     """분석 결과를 Markdown 리포트로 생성하는 Reporter."""
 
@@ -17,76 +75,75 @@ class Reporter:
         Returns:
             AnalysisReport: 생성된 분석 리포트
         """
-        report_content = self._build_markdown_report(execution_result)
+        # 리포트와 추론 과정 파일이 같은 생성 시각을 표시하도록 한 번만 구함
+        generated = datetime.now()
+        # 실행 결과는 한 번만 직렬화해 리포트와 추론 과정 파일이 함께 사용
+        execution_json = [
+            dumps_pretty(step_result.execution_result)
+            for step_result in execution_result.step_results
+        ]
+        report_content = self._build_markdown_report(
+            execution_result, generated.strftime(TIMESTAMP_FORMAT), execution_json
+        )
 
         return AnalysisReport(
             execution_result=execution_result,
-            report_content=report_content
+            report_content=report_content,
+            generated_at=generated.isoformat(),
+            execution_result_json=execution_json
         )
 
-    def _build_markdown_report(self, result: ExecutionResult) -> str:
+    def _build_markdown_report(
+        self,
+        result: ExecutionResult,
+        generated_at: str,
+        execution_json: List[str]
+    ) -> str:
         """Markdown 형식의 리포트를 생성.
 
         Args:
             result: 실행 결과
+            generated_at: 헤더에 표시할 생성 시각
+            execution_json: 단계별 실행 결과 JSON (step_results 순서)
 
         Returns:
             Markdown 문자열
         """
-        lines = []
-
-        # 헤더
-        lines.append("# 텍스트 분석 리포트")
-        lines.append("")
-        lines.append(f"**생성 시각**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
-
-        # 요약
-        lines.append("## 요약")
-        lines.append("")
-        lines.append(self._get_summary_section(result))
-        lines.append("")
-
-        # 실행 정보
-        lines.append("## 실행 정보")
-        lines.append("")
-        lines.append(f"- **전체 단계 수**: {result.total_step_count}")
-        lines.append(f"- **실행된 단계 수**: {result.executed_step_count}")
-        lines.append(f"- **상태**: {self._format_status(result.status)}")
-
-        if result.stopped_at:
-            lines.append(f"- **조기 종료**: Step {result.stopped_at.step_id} ({result.stopped_at.algorithm_name})에서 중단됨")
-        lines.append("")
-
-        # 단계별 결과
-        lines.append("## 단계별 분석 결과")
-        lines.append("")
-
-        for step_result in result.step_results:
-            lines.append(self._format_step_result(step_result))
-            lines.append("")
-
-        # 결론
-        lines.append("## 결론")
-        lines.append("")
-        lines.append(self._get_conclusion(result))
+        stopped_at = result.stopped_at
+        early_exit = (
+            f"- **조기 종료**: Step {stopped_at.step_id} ({stopped_at.algorithm_name})에서 중단됨\n"
+            if stopped_at else ""
+        )
 
-        return "\n".join(lines)
+        return _REPORT_TEMPLATE.format_map({
+            "generated_at": generated_at,
+            "summary": self._get_summary_section(result),
+            "total_steps": result.total_step_count,
+            "executed_steps": result.executed_step_count,
+            "status": self._format_status(result.status),
+            "early_exit": early_exit,
+            # join은 제너레이터를 리스트로 바꾼 뒤 연결하므로 처음부터 리스트로 전달
+            "steps": "".join([
+                f"{self._format_step_result(step_result, result_json)}\n\n"
+                for step_result, result_json in zip(result.step_results, execution_json)
+            ]),
+            "conclusion": self._get_conclusion(result),
+        })
 
     def _get_summary_section(self, result: ExecutionResult) -> str:
         """요약 섹션 생성."""
         if result.has_problem:
-            problem_count = sum(
-                1 for sr in result.step_results if sr.judgment.has_problem
-            )
-            critical_count = sum(
-                1 for sr in result.step_results
-                if sr.judgment.severity == "critical"
-            )
-            warning_count = sum(
-                1 for sr in result.step_results
-                if sr.judgment.severity == "warning"
-            )
+            # 한 번의 순회로 문제 수와 심각도별 개수를 함께 집계
+            problem_count = critical_count = warning_count = 0
+            for sr in result.step_results:
+                judgment = sr.judgment
+                if judgment.has_problem:
+                    problem_count += 1
+                severity = judgment.severity
+                if severity == "critical":
+                    critical_count += 1
+                elif severity == "warning":
+                    warning_count += 1
 
             summary = f"🚨 **{problem_count}개의 문제가 발견되었습니다.**\n"
             if critical_count > 0:
@@ -100,47 +157,30 @@ class Reporter:
 
     def _format_status(self, status: str) -> str:
         """상태 포맷팅."""
-        status_map = {
-            "all_passed": "✅ 모두 통과",
-            "problem_found": "🚨 문제 발견"
-        }
-        return status_map.get(status, status)
-
-    def _format_step_result(self, step_result: StepResult) -> str:
-        """단일 스텝 결과 포맷팅."""
+        return _STATUS_LABELS.get(status, status)
+
+    def _format_step_result(self, step_result: StepResult, result_json: str) -> str:
+        """단일 스텝 결과 포맷팅 (result_json은 직렬화된 실행 결과)."""
         step = step_result.step
         judgment = step_result.judgment
 
-        severity_icon = {
-            "none": "✅",
-            "warning": "⚠️",
-            "critical": "🚨"
-        }.get(judgment.severity, "❓")
-
-        lines = [
-            f"### Step {step.step_id}: {step.algorithm_name}",
-            "",
-            f"**설명**: {step.description}",
-            "",
-            f"**판단 결과**: {severity_icon} {judgment.severity.upper()}",
-            "",
-            "**상세 분석**:",
-            "",
-            f"> {judgment.reasoning}",
-            "",
-            f"**요약**: {judgment.summary}",
-            "",
-            "<details>",
-            "<summary>실행 결과 상세</summary>",
-            "",
-            "```json",
-            json.dumps(step_result.execution_result, ensure_ascii=False, indent=2),
-            "```",
-            "",
+        severity_icon = _SEVERITY_ICONS.get(judgment.severity, "❓")
+
+        # 조각 수가 고정되어 있으므로 리스트 없이 한 번에 연결
+        return (
+            f"### Step {step.step_id}: {step.algorithm_name}\n\n"
+            f"**설명**: {step.description}\n\n"
+            f"**판단 결과**: {severity_icon} {judgment.severity.upper()}\n\n"
+            "**상세 분석**:\n\n"
+            f"> {judgment.reasoning}\n\n"
+            f"**요약**: {judgment.summary}\n\n"
+            "<details>\n"
+            "<summary>실행 결과 상세</summary>\n\n"
+            "```json\n"
+            f"{result_json}\n"
+            "```\n\n"
             "</details>"
-        ]
-
-        return "\n".join(lines)
+        )
 
     def _get_conclusion(self, result: ExecutionResult) -> str:
         """결론 섹션 생성."""
@@ -161,11 +201,11 @@ class Reporter:
             )
 
         # 문제가 있는 단계들의 요약 추출
-        for sr in result.step_results:
-            if sr.judgment.has_problem:
-                conclusions.append(
-                    f"- **{sr.step.algorithm_name}**: {sr.judgment.summary}"
-                )
+        conclusions.extend([
+            f"- **{sr.step.algorithm_name}**: {sr.judgment.summary}"
+            for sr in result.step_results
+            if sr.judgment.has_problem
+        ])
 
         conclusions.append("\n**권장 조치**: 위에서 발견된 문제들을 검토하고 수정하시기 바랍니다.")
 
@@ -182,8 +222,7 @@ class Reporter:
             report: 저장할 리포트
             filepath: 저장 경로
         """
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(report.report_content)
+        Path(filepath).write_text(report.report_content, encoding="utf-8")
 
     def save_reasoning_trace(
         self,
@@ -196,136 +235,145 @@ class Reporter:
             report: 분석 리포트
             filepath: 저장 경로
         """
-        content = self._build_reasoning_trace_markdown(report.execution_result)
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
-
-    def _build_reasoning_trace_markdown(self, result: ExecutionResult) -> str:
-        """상세 추론 과정을 Markdown으로 생성.
+        execution_json = report.execution_result_json
+        if len(execution_json) != len(report.step_results):
+            # Reporter.generate로 만들지 않은 리포트는 여기서 직렬화
+            execution_json = [dumps_pretty(sr.execution_result) for sr in report.step_results]
+        lines = self._iter_reasoning_trace_lines(
+            report.execution_result, _format_generated_at(report.generated_at), execution_json
+        )
+        # 추론 과정은 LLM 응답 전체를 포함해 클 수 있으므로 문자열 전체를 만들지 않고 줄 단위로 기록
+        with open(filepath, "w", encoding="utf-8", buffering=TRACE_WRITE_BUFFER) as f:
+            f.write(next(lines, ""))
+            for line in lines:
+                f.write("\n")
+                f.write(line)
+
+    def _iter_reasoning_trace_lines(
+        self,
+        result: ExecutionResult,
+        generated_at: str,
+        execution_json: List[str]
+    ) -> Iterator[str]:
+        """상세 추론 과정 Markdown을 한 줄씩 생성.
 
         Args:
             result: 실행 결과
+            generated_at: 헤더에 표시할 생성 시각
+            execution_json: 단계별 실행 결과 JSON (step_results 순서)
 
-        Returns:
-            Markdown 문자열
+        Yields:
+            Markdown 줄 (줄바꿈 제외)
         """
-        lines = []
-
         # 헤더
-        lines.append("# ReAct Judge 상세 추론 과정")
-        lines.append("")
-        lines.append(f"**생성 시각**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
-        lines.append("이 파일은 ReAct Judge Agent가 각 알고리즘 결과를 평가하는 과정을 상세히 보여줍니다.")
-        lines.append("")
+        yield "# ReAct Judge 상세 추론 과정"
+        yield ""
+        yield f"**생성 시각**: {generated_at}"
+        yield ""
+        yield "이 파일은 ReAct Judge Agent가 각 알고리즘 결과를 평가하는 과정을 상세히 보여줍니다."
+        yield ""
 
         # 각 단계별 추론 과정
-        for step_result in result.step_results:
-            lines.append("")
-            lines.append("=" * 80)
-            lines.append("")
-            lines.append(f"## Step {step_result.step.step_id}: {step_result.step.algorithm_name}")
-            lines.append("")
-            lines.append(f"**알고리즘**: {step_result.step.algorithm_name}")
-            lines.append(f"**설명**: {step_result.step.description}")
-            lines.append("")
+        for step_result, result_json in zip(result.step_results, execution_json):
+            yield ""
+            yield "=" * 80
+            yield ""
+            yield f"## Step {step_result.step.step_id}: {step_result.step.algorithm_name}"
+            yield ""
+            yield f"**알고리즘**: {step_result.step.algorithm_name}"
+            yield f"**설명**: {step_result.step.description}"
+            yield ""
 
             # 실행 결과
-            lines.append("### 알고리즘 실행 결과")
-            lines.append("")
-            lines.append("```json")
-            lines.append(json.dumps(step_result.execution_result, ensure_ascii=False, indent=2))
-            lines.append("```")
-            lines.append("")
+            yield "### 알고리즘 실행 결과"
+            yield ""
+            yield "```json"
+            yield result_json
+            yield "```"
+            yield ""
 
             # 상세 추론 과정
             if step_result.judgment.detailed_trace:
-                lines.append("### ReAct 추론 과정")
-                lines.append("")
+                yield "### ReAct 추론 과정"
+                yield ""
 
                 for trace_item in step_result.judgment.detailed_trace:
                     iteration = trace_item["iteration"]
-                    lines.append(f"#### 🔄 Iteration {iteration}")
-                    lines.append("")
+                    yield f"#### 🔄 Iteration {iteration}"
+                    yield ""
 
                     # Thought
                     if trace_item["thought"]:
-                        lines.append(f"**💭 Thought:**")
-                        lines.append("")
-                        lines.append(f"> {trace_item['thought']}")
-                        lines.append("")
+                        yield f"**💭 Thought:**"
+                        yield ""
+                        yield f"> {trace_item['thought']}"
+                        yield ""
 
                     # Action
                     if trace_item["action"]:
-                        lines.append(f"**🔧 Action:** `{trace_item['action']}`")
-                        lines.append("")
+                        yield f"**🔧 Action:** `{trace_item['action']}`"
+                        yield ""
 
                         # Action Input
                         if trace_item["action_input"]:
-                            lines.append("**📥 Action Input:**")
-                            lines.append("")
+                            yield "**📥 Action Input:**"
+                            yield ""
                             if isinstance(trace_item["action_input"], (dict, list)):
-                                lines.append("```json")
-                                lines.append(json.dumps(trace_item["action_input"], ensure_ascii=False, indent=2))
-                                lines.append("```")
+                                yield "```json"
+                                yield dumps_pretty(trace_item["action_input"])
+                                yield "```"
                             else:
-                                lines.append(f"```\n{trace_item['action_input']}\n```")
-                            lines.append("")
+                                yield f"```\n{trace_item['action_input']}\n```"
+                            yield ""
 
                     # Observation
                     if trace_item["observation"]:
-                        lines.append("**👁️ Observation:**")
-                        lines.append("")
+                        yield "**👁️ Observation:**"
+                        yield ""
                         obs_text = trace_item["observation"]
                         # 긴 observation은 요약
                         if len(obs_text) > 500:
-                            lines.append("<details>")
-                            lines.append("<summary>결과 보기 (긴 내용)</summary>")
-                            lines.append("")
-                            lines.append("```")
-                            lines.append(obs_text)
-                            lines.append("```")
-                            lines.append("")
-                            lines.append("</details>")
+                            yield "<details>"
+                            yield "<summary>결과 보기 (긴 내용)</summary>"
+                            yield ""
+                            yield "```"
+                            yield obs_text
+                            yield "```"
+                            yield ""
+                            yield "</details>"
                         else:
-                            lines.append("```")
-                            lines.append(obs_text)
-                            lines.append("```")
-                        lines.append("")
+                            yield "```"
+                            yield obs_text
+                            yield "```"
+                        yield ""
 
                     # Full LLM Response - 긴 경우만 접기
                     if trace_item["llm_response"]:
                         llm_resp = trace_item["llm_response"]
                         if len(llm_resp) > 300:
-                            lines.append("<details>")
-                            lines.append("<summary>📝 전체 LLM 응답 보기</summary>")
-                            lines.append("")
-                            lines.append("```")
-                            lines.append(llm_resp)
-                            lines.append("```")
-                            lines.append("")
-                            lines.append("</details>")
-                        lines.append("")
-
-                    lines.append("")
+                            yield "<details>"
+                            yield "<summary>📝 전체 LLM 응답 보기</summary>"
+                            yield ""
+                            yield "```"
+                            yield llm_resp
+                            yield "```"
+                            yield ""
+                            yield "</details>"
+                        yield ""
+
+                    yield ""
 
             # 최종 판단
-            lines.append("### ✅ 최종 판단")
-            lines.append("")
-            severity_icon = {
-                "none": "✅",
-                "warning": "⚠️",
-                "critical": "🚨"
-            }.get(step_result.judgment.severity, "❓")
-            lines.append(f"**판단**: {severity_icon} {step_result.judgment.severity.upper()}")
-            lines.append(f"**문제 발견**: {'예' if step_result.judgment.has_problem else '아니오'}")
-            lines.append("")
-            lines.append(f"**추론**:")
-            lines.append("")
-            lines.append(f"> {step_result.judgment.reasoning}")
-            lines.append("")
-            lines.append(f"**요약**: {step_result.judgment.summary}")
-            lines.append("")
-            lines.append("")
-
-        return "\n".join(lines)
+            yield "### ✅ 최종 판단"
+            yield ""
+            severity_icon = _SEVERITY_ICONS.get(step_result.judgment.severity, "❓")
+            yield f"**판단**: {severity_icon} {step_result.judgment.severity.upper()}"
+            yield f"**문제 발견**: {'예' if step_result.judgment.has_problem else '아니오'}"
+            yield ""
+            yield f"**추론**:"
+            yield ""
+            yield f"> {step_result.judgment.reasoning}"
+            yield ""
+            yield f"**요약**: {step_result.judgment.summary}"
+            yield ""
+            yield ""
@@ -40,6 +40,22 @@ class TestLengthCheckAlgorithm:
         assert result["raw_result"] == 0
         assert result["is_within_range"] is False
 
+    def test_kwargs_override_range(self):
+        """kwargs로 전달한 범위가 인스턴스 설정보다 우선."""
+        algo = LengthCheckAlgorithm(min_length=10, max_length=100)
+        result = algo.execute("짧은 텍스트", min_length=3)
+
+        assert result["is_within_range"] is True
+        assert result["min_length"] == 3
+        assert result["max_length"] == 100
+
+    def test_bytes_input_counts_characters(self):
+        """UTF-8 bytes 입력은 바이트 수가 아닌 문자 수로 검사."""
+        algo = LengthCheckAlgorithm(min_length=10, max_length=100)
+        text = "이것은 테스트 텍스트입니다."
+
+        assert algo.execute(text.encode("utf-8")) == algo.execute(text)
+
     def test_name_property(self):
         """name 프로퍼티 확인."""
         algo = LengthCheckAlgorithm()
@@ -58,6 +74,20 @@ class TestKeywordCheckAlgorithm:
         assert result["keyword_count"] == 0
         assert result["raw_result"] == []
 
+    def test_no_forbidden_keywords_returns_new_dict(self):
+        """키워드가 없는 결과도 호출마다 중첩 컨테이너까지 별도로 반환."""
+        algo = KeywordCheckAlgorithm(forbidden_keywords=["금지"])
+        first = algo.execute("정상 텍스트")
+        first["note"] = "modified"
+        first["raw_result"].append("변경")
+        first["keyword_positions"]["변경"] = [0]
+
+        second = algo.execute("정상 텍스트")
+        assert "note" not in second
+        assert second["raw_result"] == []
+        assert second["keyword_positions"] == {}
+        assert first["checked_keywords"] == ("금지",)
+
     def test_one_forbidden_keyword(self):
         """금지 키워드가 1개 있을 때."""
         algo = KeywordCheckAlgorithm(forbidden_keywords=["금지", "위험"])
@@ -104,6 +134,40 @@ class TestKeywordCheckAlgorithm:
         positions = result["keyword_positions"]["금지"]
         assert len(positions) == 2  # 2번 출현
 
+    def test_keyword_positions_overlapping(self):
+        """겹치는 출현 위치도 모두 추적."""
+        algo = KeywordCheckAlgorithm(forbidden_keywords=["aa"])
+        result = algo.execute("aaaa")
+
+        assert result["keyword_positions"]["aa"] == [0, 1, 2]
+
+    def test_keyword_positions_refer_to_original_text(self):
+        """lower()로 길이가 바뀌는 문자가 있어도 위치는 원문 기준."""
+        algo = KeywordCheckAlgorithm(forbidden_keywords=["SPAM"])
+        text = "İ SPAM İ spam"
+        result = algo.execute(text)
+
+        assert result["keyword_positions"]["SPAM"] == [2, 9]
+        assert all(text[pos:pos + 4].lower() == "spam" for pos in result["keyword_positions"]["SPAM"])
+
+    def test_keyword_positions_shared_prefix(self):
+        """접두사 관계인 키워드가 같은 위치에서 모두 발견."""
+        algo = KeywordCheckAlgorithm(forbidden_keywords=["금지", "금지어"])
+        result = algo.execute("금지어와 금지")
+
+        assert result["raw_result"] == ["금지", "금지어"]
+        assert result["keyword_positions"]["금지"] == [0, 5]
+        assert result["keyword_positions"]["금지어"] == [0]
+
+    def test_same_keywords_share_search_state(self):
+        """같은 키워드 구성의 인스턴스는 전처리 결과를 공유."""
+        first = KeywordCheckAlgorithm(forbidden_keywords=["금지", "SPAM"])
+        second = KeywordCheckAlgorithm(forbidden_keywords=["금지", "SPAM"])
+        other = KeywordCheckAlgorithm(forbidden_keywords=["금지", "SPAM"], case_sensitive=True)
+
+        assert first._search_keywords is second._search_keywords
+        assert first._search_keywords is not other._search_keywords
+
     def test_name_property(self):
         """name 프로퍼티 확인."""
         algo = KeywordCheckAlgorithm()
@@ -0,0 +1,49 @@
+"""판단 기준 문서 인덱스 테스트."""
+
+import os
+
+import pytest
+from src.criteria_index import get_criteria, list_criteria, clear_cache
+from src.exceptions import CriteriaNotFoundError
+
+
+@pytest.fixture
+def criteria_dir(tmp_path):
+    """판단 기준 문서가 있는 임시 디렉토리."""
+    clear_cache()
+    (tmp_path / "length_check.md").write_text("# 길이 체크", encoding="utf-8")
+    (tmp_path / "keyword_check.md").write_text("# 키워드 체크", encoding="utf-8")
+    yield tmp_path
+    clear_cache()
+
+
+class TestCriteriaIndex:
+    """criteria_index 테스트."""
+
+    def test_list_criteria(self, criteria_dir):
+        """문서 목록 조회."""
+        assert list_criteria(str(criteria_dir)) == ["keyword_check", "length_check"]
+
+    def test_list_criteria_missing_directory(self, tmp_path):
+        """존재하지 않는 디렉토리."""
+        assert list_criteria(str(tmp_path / "missing")) == []
+
+    def test_get_criteria(self, criteria_dir):
+        """문서 내용 조회."""
+        assert get_criteria("length_check", str(criteria_dir)) == "# 길이 체크"
+
+    def test_get_criteria_revalidates_on_change(self, criteria_dir):
+        """문서가 수정되면 새 내용 반환."""
+        path = criteria_dir / "length_check.md"
+        get_criteria("length_check", str(criteria_dir))
+
+        path.write_text("# 수정됨", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert get_criteria("length_check", str(criteria_dir)) == "# 수정됨"
+
+    def test_get_nonexistent_criteria_raises_error(self, criteria_dir):
+        """존재하지 않는 문서 조회 시 에러."""
+        with pytest.raises(CriteriaNotFoundError):
+            get_criteria("nonexistent", str(criteria_dir))
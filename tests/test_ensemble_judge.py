@@ -0,0 +1,58 @@
+"""EnsembleJudge 테스트."""
+
+import pytest
+from src.judge import EnsembleJudge
+from src.models import JudgmentResult
+
+
+class _FixedJudge:
+    """항상 같은 판단을 반환하는 Judge."""
+
+    def __init__(self, has_problem: bool, severity: str):
+        self.has_problem = has_problem
+        self.severity = severity
+
+    def evaluate(self, algorithm_name, execution_result):
+        return JudgmentResult(
+            algorithm_name=algorithm_name,
+            has_problem=self.has_problem,
+            severity=self.severity,
+            reasoning=f"{self.severity} reasoning",
+            summary=f"{self.severity} summary"
+        )
+
+
+class TestEnsembleJudge:
+    """EnsembleJudge 테스트."""
+
+    def test_majority_problem(self):
+        """과반수가 문제라고 판단하면 가장 높은 심각도 사용."""
+        judge = EnsembleJudge([
+            _FixedJudge(True, "warning"),
+            _FixedJudge(True, "critical"),
+            _FixedJudge(False, "none"),
+        ])
+
+        result = judge.evaluate("length_check", {"raw_result": 3})
+
+        assert result.has_problem is True
+        assert result.severity == "critical"
+        assert result.summary == "critical summary"
+
+    def test_majority_no_problem(self):
+        """과반수가 문제 없음이면 severity none."""
+        judge = EnsembleJudge([
+            _FixedJudge(False, "none"),
+            _FixedJudge(False, "none"),
+            _FixedJudge(True, "critical"),
+        ])
+
+        result = judge.evaluate("keyword_check", {"raw_result": []})
+
+        assert result.has_problem is False
+        assert result.severity == "none"
+
+    def test_requires_judges(self):
+        """Judge가 없으면 ValueError."""
+        with pytest.raises(ValueError):
+            EnsembleJudge([])
@@ -1,5 +1,7 @@
 """Executor 테스트."""
 
+import threading
+
 import pytest
 from src.algorithms import LengthCheckAlgorithm, KeywordCheckAlgorithm
 from src.registry import AlgorithmRegistry
@@ -11,7 +13,6 @@ from src.executor import Executor
 @pytest.fixture
 def registry():
     """알고리즘이 등록된 레지스트리."""
-    AlgorithmRegistry.reset()
     reg = AlgorithmRegistry(criteria_path="src/criteria")
     reg.register(LengthCheckAlgorithm())
     reg.register(KeywordCheckAlgorithm())
@@ -98,6 +99,45 @@ class TestExecutor:
         assert result.executed_step_count == 2
         assert result.stopped_at is None
 
+    def test_execute_no_early_exit_runs_independent_steps_concurrently(self, registry, judge, planner):
+        """조기 종료 비활성화 시 의존성 없는 스텝은 동시에 실행하고 결과는 실행 순서대로 정리."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class _BarrierJudge:
+            def evaluate(self, algorithm_name, execution_result):
+                barrier.wait()  # 두 스텝이 동시에 실행되지 않으면 시간 초과
+                return judge.evaluate(algorithm_name, execution_result)
+
+        executor = Executor(registry=registry, judge=_BarrierJudge(), early_exit_on_critical=False)
+        unchained = Planner(
+            registry=registry,
+            algorithm_order=["length_check", "keyword_check"],
+            chain_steps=False
+        )
+
+        result = executor.execute(unchained.create_plan("짧"))
+
+        assert [r.step.algorithm_name for r in result.step_results] == ["length_check", "keyword_check"]
+        assert result.status == "problem_found"
+        assert result.stopped_at is None
+
+    def test_execute_no_early_exit_respects_dependencies(self, registry, judge, planner):
+        """조기 종료 비활성화 시에도 의존하는 스텝은 선행 스텝이 끝난 뒤 실행."""
+        finished = []
+
+        class _RecordingJudge:
+            def evaluate(self, algorithm_name, execution_result):
+                judgment = judge.evaluate(algorithm_name, execution_result)
+                finished.append(algorithm_name)
+                return judgment
+
+        executor = Executor(registry=registry, judge=_RecordingJudge(), early_exit_on_critical=False)
+
+        result = executor.execute(planner.create_plan("짧"))
+
+        assert finished == ["length_check", "keyword_check"]
+        assert [r.step.algorithm_name for r in result.step_results] == finished
+
     def test_execute_keyword_problem(self, executor, planner):
         """키워드 문제 발견."""
         text = "이것은 충분히 긴 텍스트이지만 광고와 스팸이 포함되어 있습니다."
@@ -131,3 +171,68 @@ class TestExecutor:
             assert hasattr(step_result.judgment, "has_problem")
             assert hasattr(step_result.judgment, "severity")
             assert hasattr(step_result.judgment, "reasoning")
+
+    async def test_execute_async_matches_sync(self, executor, planner):
+        """비동기 실행 결과가 순차 실행과 동일."""
+        plan = planner.create_plan("짧")
+
+        result = await executor.execute_async(plan)
+
+        assert result.status == "problem_found"
+        assert result.stopped_at.algorithm_name == "length_check"
+        assert result.executed_step_count == 1
+
+    async def test_execute_async_independent_steps(self, executor, planner):
+        """의존성이 없는 스텝은 한 단계에서 모두 실행."""
+        plan = planner.create_plan("이것은 충분히 긴 정상적인 텍스트입니다.")
+        for step in plan.steps:
+            step.depends_on = []
+
+        assert len(Executor._layer_steps(plan.get_execution_order())) == 1
+
+        result = await executor.execute_async(plan)
+
+        assert result.status == "all_passed"
+        assert [r.step.step_id for r in result.step_results] == [1, 2]
+
+    def test_trivial_criteria_skips_judge(self, tmp_path):
+        """판단 기준 문서가 Judge 생략을 명시하면 Judge를 호출하지 않음."""
+        (tmp_path / "length_check.md").write_text(
+            "# 길이 검사\n\n<!-- judge: skip -->\n항상 통과합니다.\n", encoding="utf-8"
+        )
+        registry = AlgorithmRegistry(criteria_path=str(tmp_path))
+        registry.register(LengthCheckAlgorithm())
+
+        class _FailingJudge:
+            def evaluate(self, algorithm_name, execution_result):
+                raise AssertionError("judge should not be called")
+
+        assert registry.is_judge_trivial("length_check") is True
+        result = Executor(registry=registry, judge=_FailingJudge()).execute_single_algorithm(
+            algorithm_name="length_check",
+            text="짧"
+        )
+
+        assert result.judgment.has_problem is False
+        assert result.judgment.severity == "none"
+
+    def test_algorithm_error_sent_as_first_line(self, registry, judge):
+        """알고리즘 오류는 첫 줄만 최대 200자로 Judge에 전달."""
+        class _BrokenAlgorithm(LengthCheckAlgorithm):
+            __slots__ = ()
+
+            @property
+            def name(self) -> str:
+                return "broken_check"
+
+            def execute(self, text, **kwargs):
+                raise RuntimeError("x" * 300 + "\nTraceback line")
+
+        registry.register(_BrokenAlgorithm())
+        result = Executor(registry=registry, judge=judge).execute_single_algorithm(
+            algorithm_name="broken_check",
+            text="텍스트"
+        )
+
+        assert result.execution_result["error"] == "x" * 200
+        assert result.execution_result["error_type"] == "RuntimeError"
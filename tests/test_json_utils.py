@@ -0,0 +1,64 @@
+"""JSON 헬퍼 테스트."""
+
+import pytest
+from src import json_utils
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """orjson 사용 / 표준 json 사용 두 경로."""
+    if request.param == "orjson":
+        if json_utils.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    return request.param
+
+
+class TestJsonUtils:
+    """JSON 헬퍼 테스트."""
+
+    def test_dumps_compact(self, backend):
+        """공백 없는 구분자와 UTF-8 문자 그대로 출력."""
+        data = {"b": [1, 2], "a": "금지어", "t": ("x",)}
+
+        assert json_utils.dumps_compact(data) == '{"b":[1,2],"a":"금지어","t":["x"]}'
+        assert json_utils.dumps_compact(data, sort_keys=True) == '{"a":"금지어","b":[1,2],"t":["x"]}'
+
+    def test_dumps_non_string_keys(self, backend):
+        """문자열이 아닌 키도 직렬화."""
+        assert json_utils.dumps_compact({1: "a"}) == '{"1":"a"}'
+
+    def test_dumps_pretty_matches_indented_json(self, backend):
+        """들여쓰기 출력은 두 경로 모두 표준 json의 indent=2 형식."""
+        data = {"raw_result": ["금지"], "positions": {"금지": [0, 5]}, "empty": [], "t": ("x",)}
+
+        assert json_utils.dumps_pretty(data) == (
+            '{\n  "raw_result": [\n    "금지"\n  ],\n  "positions": {\n    "금지": [\n      0,\n      5\n    ]\n  },'
+            '\n  "empty": [],\n  "t": [\n    "x"\n  ]\n}'
+        )
+        assert json_utils.dumps_pretty({1: "a"}) == '{\n  "1": "a"\n}'
+
+    def test_loads_invalid(self, backend):
+        """유효하지 않은 JSON은 JSONDecodeError."""
+        assert json_utils.loads('{"has_problem": true}') == {"has_problem": True}
+        with pytest.raises(json_utils.JSONDecodeError):
+            json_utils.loads("length_check")
+
+    def test_loads_lenient_repairs_common_mistakes(self, backend):
+        """코드 펜스, 닫는 괄호 앞 쉼표, 작은따옴표를 보정."""
+        assert json_utils.loads_lenient('```json\n{"a": 1,}\n```') == {"a": 1}
+        assert json_utils.loads_lenient("Action Input: {'a': True}") == {"a": True}
+        assert json_utils.loads_lenient("[1, 2,]") == [1, 2]
+
+    def test_loads_lenient_keeps_commas_inside_strings(self, backend):
+        """문자열 안의 ", ]" 같은 내용은 쉼표 보정 대상이 아님."""
+        result = json_utils.loads_lenient('{"reasoning": "list [a, b,] ok", }')
+        assert result == {"reasoning": "list [a, b,] ok"}
+        assert json_utils.loads_lenient('{"q": "say \\"x,}\\"",}') == {"q": 'say "x,}"'}
+        assert json_utils.loads_lenient("{'a': 'b, }',}") == {"a": "b, }"}
+
+    def test_loads_lenient_rejects_scalars(self, backend):
+        """객체/배열이 아니면 None."""
+        assert json_utils.loads_lenient("length_check") is None
+        assert json_utils.loads_lenient("5") is None
@@ -4,12 +4,12 @@ import pytest
 from src.algorithms import LengthCheckAlgorithm, KeywordCheckAlgorithm
 from src.registry import AlgorithmRegistry
 from src.planner import Planner
+from src.models import Plan, PlanStep
 
 
 @pytest.fixture
 def registry():
     """알고리즘이 등록된 레지스트리."""
-    AlgorithmRegistry.reset()
     reg = AlgorithmRegistry(criteria_path="src/criteria")
     reg.register(LengthCheckAlgorithm())
     reg.register(KeywordCheckAlgorithm())
@@ -62,6 +62,17 @@ class TestPlanner:
             assert "text" in step.input_spec
             assert step.input_spec["text"] == text
 
+    def test_descriptions_are_cached_until_invalidated(self, planner):
+        """알고리즘 설명은 invalidate_descriptions 전까지 보관한 값을 사용."""
+        planner.create_plan("테스트 텍스트입니다.")
+        planner._descriptions["length_check"] = "stale"
+
+        assert planner.create_plan("텍스트").steps[0].description == "stale"
+
+        planner.invalidate_descriptions()
+
+        assert planner.create_plan("텍스트").steps[0].description == LengthCheckAlgorithm().description
+
     def test_plan_with_custom_input_specs(self, planner):
         """커스텀 입력 명세."""
         text = "테스트 텍스트입니다."
@@ -73,6 +84,27 @@ class TestPlanner:
 
         assert plan.steps[0].input_spec["min_length"] == 5
 
+    def test_custom_input_specs_not_mutated(self, planner):
+        """호출자의 입력 명세는 변경되지 않음."""
+        input_specs = {"length_check": {"min_length": 5}}
+
+        planner.create_plan("테스트 텍스트입니다.", input_specs)
+
+        assert input_specs == {"length_check": {"min_length": 5}}
+
+    def test_default_input_specs_merged(self, registry):
+        """기본 입력 명세와 호출별 입력 명세 병합."""
+        planner = Planner(
+            registry=registry,
+            algorithm_order=["length_check"],
+            default_input_specs={"length_check": {"min_length": 5, "max_length": 50}}
+        )
+
+        plan = planner.create_plan("테스트 텍스트입니다.", {"length_check": {"min_length": 8}})
+
+        assert plan.steps[0].input_spec["min_length"] == 8
+        assert plan.steps[0].input_spec["max_length"] == 50
+
     def test_plan_metadata(self, planner):
         """Plan 메타데이터."""
         text = "테스트 텍스트입니다."
@@ -89,6 +121,18 @@ class TestPlanner:
 
         assert planner.validate_plan(plan) is True
 
+    def test_unregistered_algorithm_keeps_dependency_chain(self, registry):
+        """등록되지 않은 알고리즘을 건너뛰어도 스텝 번호와 의존성이 이어짐."""
+        planner = Planner(
+            registry=registry,
+            algorithm_order=["length_check", "missing", "keyword_check"]
+        )
+        plan = planner.create_plan("테스트 텍스트입니다.")
+
+        assert [step.step_id for step in plan.steps] == [1, 2]
+        assert plan.steps[1].depends_on == [1]
+        assert planner.validate_plan(plan) is True
+
     def test_get_execution_order(self, planner):
         """실행 순서 조회."""
         text = "테스트 텍스트입니다."
@@ -109,6 +153,14 @@ class TestPlanner:
         assert step is not None
         assert step.algorithm_name == "length_check"
 
+    def test_get_step_duplicate_id_returns_first(self):
+        """같은 step_id가 여러 개면 먼저 나온 단계를 반환."""
+        first = PlanStep(step_id=1, algorithm_name="length_check", description="first")
+        second = PlanStep(step_id=1, algorithm_name="keyword_check", description="second")
+        plan = Plan(steps=[first, second])
+
+        assert plan.get_step(1) is first
+
     def test_get_nonexistent_step(self, planner):
         """존재하지 않는 스텝 조회."""
         text = "테스트 텍스트입니다."
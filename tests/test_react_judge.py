@@ -0,0 +1,699 @@
+"""ReactJudge 테스트 (LLM 호출 없이 확인 가능한 부분)."""
+
+import pytest
+from src.algorithms import LengthCheckAlgorithm
+from src.judge import JudgeTools, MockReactJudge, ReactJudge
+from src.judge.react_judge import (
+    ReActStep,
+    _ReActHistory,
+    _block_hashes,
+    _action_input_end,
+    _flatten_result,
+    _keyword_preview,
+    _keyword_severity,
+    _length_severity,
+    _truncate_for_prompt,
+)
+from src.models import JudgmentResult
+from src.registry import AlgorithmRegistry
+
+
+@pytest.fixture
+def judge():
+    """증분 프롬프트를 사용하는 ReactJudge."""
+    registry = AlgorithmRegistry(criteria_path="src/criteria")
+    registry.register(LengthCheckAlgorithm())
+    return ReactJudge(registry=registry, api_key="test-key", delta_prompting=True)
+
+
+def _remember(judge, algorithm_name, result):
+    flat = _flatten_result(result)
+    judge._sessions[algorithm_name] = {
+        "blocks": _block_hashes(flat),
+        "fields": flat,
+        "verdict": JudgmentResult(
+            algorithm_name=algorithm_name,
+            has_problem=False,
+            severity="none",
+            reasoning="ok",
+            summary="Text length is acceptable."
+        ),
+        "criteria_hash": judge._criteria_hash(algorithm_name),
+    }
+
+
+class TestDeltaPrompt:
+    """증분 프롬프트 테스트."""
+
+    BASE = {
+        "raw_result": 120,
+        "is_within_range": True,
+        "min_length": 10,
+        "max_length": 10000,
+        "length_diff": 0,
+        "meta": {"source": "cli", "lang": "ko", "version": 1, "mode": "fast", "trace": False},
+    }
+
+    def _prompt(self, judge, result):
+        flat = _flatten_result(result)
+        return judge._build_delta_prompt(
+            "length_check", flat, _block_hashes(flat), judge._criteria_hash("length_check")
+        )
+
+    def test_no_previous_evaluation(self, judge):
+        """직전 평가가 없으면 전체 프롬프트 사용."""
+        assert self._prompt(judge, self.BASE) is None
+
+    def test_similar_result_separates_changed_fields(self, judge):
+        """중복률이 높으면 바뀐 필드를 따로 보여 주고 나머지 필드도 함께 전달."""
+        _remember(judge, "length_check", self.BASE)
+
+        prompt = self._prompt(judge, {**self.BASE, "raw_result": 121})
+
+        assert prompt is not None
+        changed, unchanged = prompt.split("## Unchanged Fields:")
+        assert '"raw_result":121' in changed
+        assert "min_length" not in changed
+        assert '"min_length":10' in unchanged
+        assert "Text length is acceptable." in prompt
+        assert "get_result_field" not in prompt
+
+    def test_changed_criteria_uses_full_prompt(self, judge):
+        """판단 기준 문서가 바뀌면 직전 판단을 이어 쓰지 않음."""
+        _remember(judge, "length_check", self.BASE)
+        judge._sessions["length_check"]["criteria_hash"] = "outdated"
+
+        assert self._prompt(judge, {**self.BASE, "raw_result": 121}) is None
+
+    def test_different_result_uses_full_prompt(self, judge):
+        """중복률이 낮으면 전체 프롬프트 사용."""
+        _remember(judge, "length_check", self.BASE)
+
+        assert self._prompt(judge, {"raw_result": 3, "is_within_range": False}) is None
+
+
+class TestSharedMessages:
+    """공유 메시지 접두부 테스트."""
+
+    def test_shared_prefix_is_reused(self, judge):
+        """시스템 메시지는 한 번만 생성되어 재사용."""
+        first = judge._get_shared_messages()
+
+        assert judge._get_shared_messages() is first
+        assert len(first) == 1
+
+    def test_system_prompt_allows_preloaded_criteria(self):
+        """시스템 프롬프트는 판단 기준이 미리 제공된 경우 get_criteria를 강제하지 않음."""
+        from src.judge.prompts import get_react_system_prompt
+
+        prompt = get_react_system_prompt("tools")
+
+        assert "Always start by getting the criteria document" not in prompt
+        assert "unless it is already provided in the prompt" in prompt
+
+    def test_llm_client_shared_across_judges(self, judge):
+        """같은 설정의 Judge는 LLM 클라이언트를 공유."""
+        other = ReactJudge(registry=judge.registry, api_key="test-key")
+        different = ReactJudge(registry=judge.registry, api_key="test-key", model_name="gpt-4o")
+
+        assert other._create_llm("test-key") is judge._create_llm("test-key")
+        assert different._create_llm("test-key") is not judge._create_llm("test-key")
+
+class TestCallLLMErrors:
+    """LLM 호출 예외 변환 테스트."""
+
+    def test_timeout_mapped_to_llm_timeout_error(self, judge):
+        """provider 타임아웃은 LLMTimeoutError로 변환."""
+        import httpx
+        import openai
+        from src.exceptions import LLMTimeoutError
+
+        class _TimeoutLLM:
+            def invoke(self, messages):
+                raise openai.APITimeoutError(request=httpx.Request("POST", "https://example.invalid"))
+
+        judge.llm = _TimeoutLLM()
+
+        with pytest.raises(LLMTimeoutError):
+            judge._call_llm([])
+
+
+class TestParseActionText:
+    """텍스트 fallback 파싱 테스트."""
+
+    def test_parse_full_response(self, judge):
+        """Thought, Action, JSON Action Input 파싱."""
+        response = (
+            "Thought: I have enough information.\n"
+            "Action: submit_judgment\n"
+            'Action Input: {"has_problem": false, "severity": "none"}'
+        )
+
+        thought, action, action_input = judge._parse_action_text(response)
+
+        assert thought == "I have enough information."
+        assert action == "submit_judgment"
+        assert action_input == {"has_problem": False, "severity": "none"}
+
+    def test_parse_plain_string_input(self, judge):
+        """JSON이 아닌 Action Input은 문자열로 유지."""
+        response = "Thought: Need criteria\nAction: get_criteria\nAction Input: length_check"
+
+        assert judge._parse_action_text(response) == ("Need criteria", "get_criteria", "length_check")
+
+    def test_parse_without_action(self, judge):
+        """Action이 없는 응답."""
+        assert judge._parse_action_text("Thought: still thinking") == ("still thinking", None, None)
+
+    def test_parse_multiline_input(self, judge):
+        """여러 줄 JSON Action Input과 이후 Observation 무시."""
+        response = (
+            "Thought: Ready\n"
+            "  spanning two lines\n"
+            "Action: submit_judgment\n"
+            "Action Input: {\n"
+            '  "has_problem": true\n'
+            "}\n"
+            "Observation: ignored"
+        )
+
+        thought, action, action_input = judge._parse_action_text(response)
+
+        assert thought == "Ready\n  spanning two lines"
+        assert action == "submit_judgment"
+        assert action_input == {"has_problem": True}
+
+
+    def test_trailing_commentary_after_json(self, judge):
+        """JSON 객체 뒤에 덧붙은 설명은 무시."""
+        _, action, action_input = judge._parse_action_text(
+            'Action: submit_judgment\nAction Input: {"has_problem": false, "note": "a } b"}\n\n'
+            "I hope this judgment {helps}."
+        )
+
+        assert action == "submit_judgment"
+        assert action_input == {"has_problem": False, "note": "a } b"}
+
+    def test_fenced_input_is_coerced(self, judge):
+        """코드 펜스로 감싼 입력도 dict로 파싱."""
+        _, action, action_input = judge._parse_action_text(
+            "Action: check_threshold\nAction Input: ```json\n{'value': 5, 'threshold': 3,}\n```"
+        )
+
+        assert action == "check_threshold"
+        assert action_input == {"value": 5, "threshold": 3}
+
+class TestSeverityRules:
+    """Mock Judge 심각도 규칙 테스트."""
+
+    def test_length_severity_boundary(self):
+        """최소 길이의 10% 이하 차이는 warning."""
+        assert _length_severity(2, 20) == ("warning", 10.0)
+        assert _length_severity(3, 20) == ("critical", 15.0)
+        assert _length_severity(5, 0) == ("critical", 0)
+
+    def test_keyword_severity(self):
+        """키워드 1개는 warning, 여러 개는 critical."""
+        assert _keyword_severity(1) == "warning"
+        assert _keyword_severity(3) == "critical"
+
+    def test_keyword_preview_truncates(self):
+        """키워드 나열은 중복을 제거하고 최대 개수 이후는 생략."""
+        assert _keyword_preview(["a", "b", "a"]) == "'a', 'b'"
+        assert _keyword_preview([str(i) for i in range(12)], limit=2) == "'0', '1', ... (+10 more)"
+
+
+class TestTruncateForPrompt:
+    """프롬프트용 실행 결과 축약 테스트."""
+
+    def test_truncates_long_values(self):
+        """긴 문자열과 리스트는 잘리고 원본은 유지."""
+        result = {"error": "e" * 10, "raw_result": [1, 2, 3], "nested": {"s": "abc"}, "n": 5}
+
+        truncated = _truncate_for_prompt(result, max_chars=4, max_items=2)
+
+        assert truncated == {
+            "error": "eeee...[truncated]",
+            "raw_result": [1, 2, "...truncated..."],
+            "nested": {"s": "abc"},
+            "n": 5,
+        }
+        assert result["raw_result"] == [1, 2, 3]
+
+
+    def test_criteria_tool_output_is_capped(self, tmp_path):
+        """get_criteria 결과는 최대 길이로 제한."""
+        from src.judge.tools import MAX_TOOL_OUTPUT
+
+        (tmp_path / "length_check.md").write_text("x" * (MAX_TOOL_OUTPUT + 100), encoding="utf-8")
+        registry = AlgorithmRegistry(criteria_path=str(tmp_path))
+
+        observation = JudgeTools(registry).execute("get_criteria", None, {"algorithm_name": "length_check"})
+
+        assert observation.endswith("x" * 10 + "...[truncated]")
+        assert observation.count("x") == MAX_TOOL_OUTPUT
+
+
+class TestParallelTool:
+    """여러 도구 동시 실행 테스트."""
+
+    def test_results_in_call_order(self):
+        """각 도구 결과를 호출 순서대로 합침."""
+        tools = JudgeTools(AlgorithmRegistry(criteria_path="src/criteria"))
+
+        observation = tools.execute("parallel", [
+            {"tool": "check_threshold", "input": {"value": 5, "threshold": 3, "operator": "gt"}},
+            {"tool": "calculate_percentage", "input": {"value": 1, "total": 4}},
+        ])
+
+        lines = observation.splitlines()
+        assert lines[0].startswith('[1] check_threshold: {"result":true')
+        assert lines[1].startswith('[2] calculate_percentage: {"percentage":25.0')
+
+    def test_rejects_invalid_calls(self):
+        """리스트가 아니거나 submit_judgment를 포함하면 에러."""
+        tools = JudgeTools(AlgorithmRegistry(criteria_path="src/criteria"))
+
+        assert tools.execute("parallel", {"tool": "check_threshold"}).startswith("Error")
+        assert tools.execute("parallel", [{"tool": "submit_judgment", "input": {}}]).startswith("Error")
+
+    def test_nested_calls_use_tool_input_rules(self):
+        """묶인 호출도 도구별 입력 검증을 거침."""
+        tools = JudgeTools(AlgorithmRegistry(criteria_path="src/criteria"))
+
+        observation = tools.execute("parallel", [
+            {"tool": "check_threshold", "input": "5 > 3"},
+            {"tool": "unknown", "input": {}},
+        ])
+
+        lines = observation.splitlines()
+        assert lines[0] == "[1] check_threshold: Error: check_threshold requires JSON input"
+        assert lines[1].startswith("[2] unknown: Error: Unknown tool 'unknown'")
+
+    def test_string_calls_are_parsed_leniently(self):
+        """문자열로 전달된 호출 목록도 JSON 입력과 같이 보정해 파싱."""
+        tools = JudgeTools(AlgorithmRegistry(criteria_path="src/criteria"))
+
+        observation = tools.execute(
+            "parallel",
+            "```json\n[{'tool': 'calculate_percentage', 'input': {'value': 1, 'total': 4}},]\n```"
+        )
+
+        assert observation.startswith('[1] calculate_percentage: {"percentage":25.0')
+
+    def test_structured_output_lists_every_tool(self):
+        """구조화된 출력의 action 설명은 실제 도구 목록을 따름."""
+        description = ReActStep.model_fields["action"].description
+
+        assert "parallel" in description
+        assert "get_result_field" not in description
+        assert all(spec[0] in description for spec in JudgeTools._TOOL_SPECS)
+
+class TestCheckThresholdValues:
+    """check_threshold의 values(여러 값) 입력 테스트."""
+
+    def test_scalar_threshold_applies_to_all_values(self):
+        """하나의 임계값을 모든 값에 적용."""
+        tools = JudgeTools(AlgorithmRegistry(criteria_path="src/criteria"))
+
+        observation = tools.execute("check_threshold", {"values": [1, 5, 10], "threshold": 5, "operator": "gte"})
+
+        assert observation == '{"results":[false,true,true],"all":false,"any":true,"count":2,"operator":">="}'
+
+    def test_threshold_list_must_match_values(self):
+        """임계값 목록은 values와 길이가 같아야 함."""
+        tools = JudgeTools(AlgorithmRegistry(criteria_path="src/criteria"))
+
+        paired = tools.execute("check_threshold", {"values": [1, 5], "threshold": [2, 4], "operator": "lt"})
+        mismatched = tools.execute("check_threshold", {"values": [1, 5], "threshold": [2], "operator": "lt"})
+
+        assert '"results":[true,false]' in paired
+        assert mismatched.startswith("Error")
+
+
+class TestEvaluateBinary:
+    """단일 호출 이진 판단 테스트."""
+
+    class _FixedLLM:
+        def __init__(self, content):
+            self.content = content
+            self.calls = 0
+
+        def invoke(self, messages):
+            from langchain_core.messages import AIMessage
+
+            self.calls += 1
+            return AIMessage(content=self.content)
+
+    def test_reject_is_critical(self, judge):
+        """REJECT는 critical 문제로 판단."""
+        judge._binary_llm = self._FixedLLM("REJECT")
+
+        result = judge.evaluate_binary("length_check", {"raw_result": 2, "is_within_range": False})
+
+        assert result.has_problem is True
+        assert result.severity == "critical"
+        assert judge._binary_llm.calls == 1
+
+    def test_approve(self, judge):
+        """APPROVE는 문제 없음."""
+        judge._binary_llm = self._FixedLLM(" approve")
+
+        result = judge.evaluate_binary("length_check", {"raw_result": 50, "is_within_range": True})
+
+        assert result.has_problem is False
+        assert result.severity == "none"
+
+    @pytest.mark.parametrize("content", [
+        "**REJECT**",
+        "Reject.",
+        "I reject this result",
+        [{"type": "text", "text": "REJECT"}],
+    ])
+    def test_reject_variants(self, judge, content):
+        """마크다운, 구두점, 문장, 블록 리스트 형태의 REJECT도 인식."""
+        judge._binary_llm = self._FixedLLM(content)
+
+        result = judge.evaluate_binary("length_check", {"raw_result": 2, "is_within_range": False})
+
+        assert result.has_problem is True
+        assert result.severity == "critical"
+
+    def test_unrecognised_verdict_falls_back_to_evaluate(self, judge, monkeypatch):
+        """판정 단어가 없으면 통과로 처리하지 않고 ReAct 평가로 전환."""
+        judge._binary_llm = self._FixedLLM("I am not sure.")
+        fallback = JudgmentResult(
+            algorithm_name="length_check",
+            has_problem=True,
+            severity="critical",
+            reasoning="full evaluation",
+            summary="Too short"
+        )
+        monkeypatch.setattr(judge, "evaluate", lambda algorithm_name, execution_result: fallback)
+
+        result = judge.evaluate_binary("length_check", {"raw_result": 2, "is_within_range": False})
+
+        assert result is fallback
+
+
+class TestReActHistory:
+    """ReAct 대화 기록 테스트."""
+
+    def test_unbounded_history_keeps_all_turns(self):
+        """window가 없으면 모든 턴을 순서대로 유지."""
+        history = _ReActHistory([], "start")
+        for idx in range(5):
+            history.add_turn(f"Action: step{idx}", f"Observation: {idx}")
+
+        assert len(history.messages()) == 1 + 5 * 2
+
+    def test_window_folds_old_turns_into_summary(self):
+        """window를 넘는 오래된 턴은 초기 프롬프트 뒤의 요약으로 접힘."""
+        history = _ReActHistory([], "start", window=2)
+        history.add_turn("Thought: t\nAction: get_criteria", "Observation: criteria", pinned=True)
+        for idx in range(4):
+            history.add_turn(f"Action: step{idx}", f"Observation: {idx}")
+
+        messages = history.messages()
+
+        # 초기 프롬프트 + 고정 턴 1개 + 최근 턴 2개
+        assert len(messages) == 1 + 2 + 2 * 2
+        assert "- Action: step0 -> Observation: 0" in messages[0].content
+        assert "- Action: step1 -> Observation: 1" in messages[0].content
+        assert messages[2].content == "Observation: criteria"
+        assert messages[-1].content == "Observation: 3"
+
+    def test_pinned_turn_keeps_chronological_order(self):
+        """나중에 고정된 턴도 이전 턴보다 앞으로 옮겨지지 않음."""
+        history = _ReActHistory([], "start", window=2)
+        history.add_turn("Action: get_result_field", "Observation: field")
+        history.add_turn("Action: get_criteria", "Observation: criteria", pinned=True)
+
+        contents = [message.content for message in history.messages()[1:]]
+
+        assert contents == [
+            "Action: get_result_field", "Observation: field",
+            "Action: get_criteria", "Observation: criteria",
+        ]
+
+    def test_cache_control_marks_pinned_observation(self):
+        """cache_control이면 고정 턴의 관찰에만 캐시 지점을 표시."""
+        history = _ReActHistory([], "start", window=2, cache_control=True)
+        history.add_turn("Action: get_criteria", "Observation: criteria", pinned=True)
+        history.add_turn("Action: check_threshold", "Observation: ok")
+
+        messages = history.messages()
+
+        assert messages[2].content[0]["cache_control"] == {"type": "ephemeral"}
+        assert messages[2].content[0]["text"] == "Observation: criteria"
+        assert messages[-1].content == "Observation: ok"
+
+    def test_cache_control_marks_only_newest_pinned_turn(self):
+        """고정 턴이 여러 개여도 캐시 지점은 가장 최근 턴 하나에만 표시."""
+        history = _ReActHistory([], "start", window=2, cache_control=True)
+        for idx in range(5):
+            history.add_turn("Action: get_criteria", f"Observation: criteria {idx}", pinned=True)
+
+        marked = [
+            message.content[0]["text"] for message in history.messages()
+            if isinstance(message.content, list) and "cache_control" in message.content[0]
+        ]
+
+        assert marked == ["Observation: criteria 4"]
+
+class TestEvaluateLoop:
+    """스크립트된 LLM 응답으로 ReAct 루프 전체 확인."""
+
+    class _ScriptedLLM:
+        def __init__(self, responses):
+            self.responses = list(responses)
+            self.sent = []
+
+        def invoke(self, messages):
+            from langchain_core.messages import AIMessage
+
+            self.sent.append(messages)
+            return AIMessage(content=self.responses.pop(0))
+
+    def test_text_mode_loop(self):
+        """get_criteria 후 submit_judgment로 판단 완료."""
+        registry = AlgorithmRegistry(criteria_path="src/criteria")
+        registry.register(LengthCheckAlgorithm())
+        judge = ReactJudge(registry=registry, api_key="test-key", use_structured_output=False)
+        judge.llm = self._ScriptedLLM([
+            "Thought: Need criteria\nAction: get_criteria\nAction Input: length_check",
+            "Thought: Too short\nAction: submit_judgment\n"
+            'Action Input: {"has_problem": true, "severity": "critical", '
+            '"reasoning": "2 chars", "summary": "Too short"}',
+        ])
+
+        result = judge.evaluate("length_check", {"raw_result": 2, "is_within_range": False})
+
+        assert result.has_problem is True
+        assert result.severity == "critical"
+        assert result.summary == "Too short"
+        assert len(result.detailed_trace) == 2
+        # 두 번째 호출에는 get_criteria 관찰 결과가 포함됨
+        assert "Observation:" in judge.llm.sent[1][-1].content
+
+    def test_default_history_window_bounds_messages(self):
+        """기본 설정에서는 오래된 턴을 요약해 전송 메시지 수가 일정."""
+        registry = AlgorithmRegistry(criteria_path="src/criteria")
+        registry.register(LengthCheckAlgorithm())
+        judge = ReactJudge(registry=registry, api_key="test-key", use_structured_output=False)
+        judge.llm = self._ScriptedLLM(
+            ["Thought: thinking"] * 5
+            + ['Action: submit_judgment\nAction Input: {"has_problem": false, "severity": "none"}']
+        )
+
+        judge.evaluate("length_check", {"raw_result": 50, "is_within_range": True})
+
+        assert [len(sent) for sent in judge.llm.sent] == [2, 4, 6, 6, 6, 6]
+        assert "Earlier Steps (summarized)" in judge.llm.sent[-1][1].content
+
+    def test_default_history_window_keeps_turn_order(self):
+        """기본 설정에서도 나중에 호출한 get_criteria가 이전 턴보다 앞서 전송되지 않음."""
+        registry = AlgorithmRegistry(criteria_path="src/criteria")
+        registry.register(LengthCheckAlgorithm())
+        judge = ReactJudge(registry=registry, api_key="test-key", use_structured_output=False)
+        judge.llm = self._ScriptedLLM([
+            'Action: check_threshold\nAction Input: {"value": 50, "threshold": 10}',
+            "Action: get_criteria\nAction Input: length_check",
+            'Action: submit_judgment\nAction Input: {"has_problem": false, "severity": "none"}',
+        ])
+
+        judge.evaluate("length_check", {"raw_result": 50, "is_within_range": True})
+
+        actions = [message.content for message in judge.llm.sent[-1][2::2]]
+        assert actions == [
+            'Action: check_threshold\nAction Input: {"value": 50, "threshold": 10}',
+            "Action: get_criteria\nAction Input: length_check",
+        ]
+
+    def test_incomplete_loop_reports_recent_trace(self):
+        """최대 반복을 넘기면 최근 추론 기록만 reasoning에 포함."""
+        registry = AlgorithmRegistry(criteria_path="src/criteria")
+        registry.register(LengthCheckAlgorithm())
+        judge = ReactJudge(
+            registry=registry, api_key="test-key", use_structured_output=False, max_iterations=12
+        )
+        judge.llm = self._ScriptedLLM([f"Thought: step {n}" for n in range(12)])
+
+        result = judge.evaluate("length_check", {"raw_result": 50, "is_within_range": True})
+
+        assert result.summary == "Evaluation incomplete - max iterations reached"
+        assert "Thought: step 1\n" not in result.reasoning
+        assert result.reasoning.endswith("Thought: step 11")
+        assert result.reasoning.count("Thought:") == ReactJudge.INCOMPLETE_TRACE_LINES
+
+    def test_preloaded_criteria_in_initial_prompt(self):
+        """판단 기준 문서를 미리 포함하면 첫 응답에서 바로 판단 가능."""
+        registry = AlgorithmRegistry(criteria_path="src/criteria")
+        registry.register(LengthCheckAlgorithm())
+        judge = ReactJudge(
+            registry=registry, api_key="test-key", use_structured_output=False, preload_criteria=True
+        )
+        judge.llm = self._ScriptedLLM([
+            "Thought: Criteria given\nAction: submit_judgment\n"
+            'Action Input: {"has_problem": false, "severity": "none", "reasoning": "ok", "summary": "ok"}',
+        ])
+
+        result = judge.evaluate("length_check", {"raw_result": 50, "is_within_range": True})
+
+        assert len(result.detailed_trace) == 1
+        first_prompt = judge.llm.sent[0][-1].content
+        assert registry.get_criteria_document("length_check") in first_prompt
+        assert "do not call get_criteria" in first_prompt
+
+    def test_stream_closes_after_judgment_json(self):
+        """판단 JSON이 완성되면 나머지 스트림을 읽지 않음."""
+        from langchain_core.messages import AIMessageChunk
+
+        consumed = []
+
+        class _StreamingLLM:
+            def stream(self, messages):
+                for piece in [
+                    "Thought: Too short\nAction: submit_judgment\nAction Input: ",
+                    '{"has_problem": true, "severity": "critical", ',
+                    '"reasoning": "2 chars {min}", "summary": "Too short"}',
+                    "\n\nLet me explain further...",
+                ]:
+                    consumed.append(piece)
+                    yield AIMessageChunk(content=piece)
+
+        registry = AlgorithmRegistry(criteria_path="src/criteria")
+        registry.register(LengthCheckAlgorithm())
+        judge = ReactJudge(
+            registry=registry, api_key="test-key", use_structured_output=False, stream_responses=True
+        )
+        judge.llm = _StreamingLLM()
+
+        result = judge.evaluate("length_check", {"raw_result": 2, "is_within_range": False})
+
+        assert result.severity == "critical"
+        assert len(consumed) == 3
+        assert result.detailed_trace[0]["llm_response"].endswith('"summary": "Too short"}')
+
+
+class TestActionInputEnd:
+    """스트리밍 중 Action Input 완성 감지 테스트."""
+
+    def test_detects_balanced_object(self):
+        """문자열 안의 중괄호는 무시하고 객체 끝을 찾음."""
+        text = 'Action: submit_judgment\nAction Input: {"reasoning": "a } b", "x": {"y": 1}} trailing'
+
+        assert text[:_action_input_end(text)].endswith('{"y": 1}}')
+
+    def test_scalar_input_ends_at_newline(self):
+        """JSON이 아닌 값은 줄바꿈에서 끝남."""
+        text = "Action: get_criteria\nAction Input: length_check\nObservation: made up"
+
+        assert text[:_action_input_end(text)].endswith("Action Input: length_check")
+        assert _action_input_end("Action: get_criteria\nAction Input: length_ch") is None
+
+    def test_incomplete_object(self):
+        """객체가 닫히지 않았으면 None."""
+        assert _action_input_end('Action: submit_judgment\nAction Input: {"a": "}') is None
+        assert _action_input_end("Action: submit_judgment\nAction Input:\n") is None
+
+class TestEvaluateMany:
+    """여러 결과의 동시 평가 테스트."""
+
+    class _SlowLLM:
+        def __init__(self):
+            import threading
+
+            self.lock = threading.Lock()
+            self.active = 0
+            self.peak = 0
+
+        def invoke(self, messages):
+            import re
+            import time
+            from langchain_core.messages import AIMessage
+
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.05)
+            with self.lock:
+                self.active -= 1
+            raw = re.search(r'"raw_result":(\d+)', messages[-1].content).group(1)
+            return AIMessage(
+                content="Action: submit_judgment\nAction Input: "
+                f'{{"has_problem": false, "severity": "none", "reasoning": "ok", "summary": "{raw}"}}'
+            )
+
+    async def test_results_keep_order_and_respect_limit(self):
+        """입력 순서대로 반환하고 동시 평가 수를 제한."""
+        registry = AlgorithmRegistry(criteria_path="src/criteria")
+        registry.register(LengthCheckAlgorithm())
+        judge = ReactJudge(registry=registry, api_key="test-key", use_structured_output=False)
+        judge.llm = self._SlowLLM()
+        items = [("length_check", {"raw_result": n, "is_within_range": True}) for n in range(6)]
+
+        results = await judge.evaluate_many(items, max_concurrency=3)
+
+        assert [r.summary for r in results] == [str(n) for n in range(6)]
+        assert 1 < judge.llm.peak <= 3
+
+
+class TestDeterministicFastPath:
+    """규칙 기반 판단 경로 테스트."""
+
+    def test_rule_algorithms_skip_llm(self):
+        """규칙으로 판단 가능한 알고리즘은 LLM을 호출하지 않음."""
+        registry = AlgorithmRegistry(criteria_path="src/criteria")
+        registry.register(LengthCheckAlgorithm())
+        judge = ReactJudge(registry=registry, api_key="test-key", enable_deterministic_fastpath=True)
+        judge._call_llm = lambda messages, llm=None: pytest.fail("LLM should not be called")
+        execution_result = {"raw_result": 2, "is_within_range": False, "length_diff": 8, "min_length": 10}
+
+        result = judge.evaluate("length_check", execution_result)
+
+        assert result == MockReactJudge(registry).evaluate("length_check", execution_result)
+        assert result.severity == "critical"
+
+
+class TestMockEvaluateBatch:
+    """Mock Judge 배치 평가 테스트."""
+
+    def test_process_pool_matches_sequential(self, monkeypatch):
+        """프로세스 풀 평가 결과가 순차 평가와 동일."""
+        judge = MockReactJudge(None)
+        items = [
+            ("length_check", {"raw_result": n, "is_within_range": n >= 10, "length_diff": max(0, 10 - n), "min_length": 10})
+            for n in range(12)
+        ] + [("keyword_check", {"has_forbidden_keywords": True, "keyword_count": 1, "raw_result": ["금지"]})]
+        sequential = judge.evaluate_batch(items)
+        monkeypatch.setattr(MockReactJudge, "PARALLEL_BATCH_MIN", 1)
+
+        assert judge.evaluate_batch(items, max_workers=2) == sequential
+
+    def test_rules_only_judge_has_no_tools(self):
+        """레지스트리 없이 만든 Mock Judge는 도구 없이 규칙으로만 판단."""
+        judge = MockReactJudge()
+
+        assert judge.tools is None
+        assert judge.evaluate("length_check", {"raw_result": 3, "is_within_range": False}).has_problem is True
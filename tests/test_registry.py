@@ -1,5 +1,7 @@
 """AlgorithmRegistry 테스트."""
 
+import os
+
 import pytest
 from src.algorithms import LengthCheckAlgorithm, KeywordCheckAlgorithm
 from src.registry import AlgorithmRegistry
@@ -9,7 +11,6 @@ from src.exceptions import AlgorithmNotFoundError, AlgorithmRegistrationError, C
 @pytest.fixture
 def registry():
     """각 테스트마다 새로운 레지스트리 생성."""
-    AlgorithmRegistry.reset()
     return AlgorithmRegistry(criteria_path="src/criteria")
 
 
@@ -33,6 +34,14 @@ class TestAlgorithmRegistry:
         with pytest.raises(AlgorithmRegistrationError):
             registry.register(algo2)
 
+    def test_instances_are_independent(self, registry):
+        """레지스트리 인스턴스마다 별도의 알고리즘 목록을 가짐."""
+        registry.register(LengthCheckAlgorithm())
+        other = AlgorithmRegistry(criteria_path="src/criteria")
+
+        assert other is not registry
+        assert other.list_algorithms() == []
+
     def test_get_algorithm(self, registry):
         """알고리즘 조회."""
         algo = LengthCheckAlgorithm()
@@ -63,6 +72,21 @@ class TestAlgorithmRegistry:
         assert "길이 체크" in document
         assert "판단 기준" in document
 
+    def test_criteria_document_is_cached(self, registry):
+        """같은 문서를 반복 조회하면 캐시된 내용을 반환."""
+        first = registry.get_criteria_document("length_check")
+
+        assert registry.get_criteria_document("length_check") is first
+
+    def test_clear_criteria_cache_rereads_document(self, registry):
+        """캐시를 비우면 문서를 다시 읽음."""
+        first = registry.get_criteria_document("length_check")
+        registry.clear_criteria_cache()
+        second = registry.get_criteria_document("length_check")
+
+        assert second == first
+        assert second is not first
+
     def test_get_nonexistent_criteria_raises_error(self, registry):
         """존재하지 않는 판단 기준 문서 조회 시 에러."""
         with pytest.raises(CriteriaNotFoundError):
@@ -93,3 +117,39 @@ class TestAlgorithmRegistry:
 
         assert info["name"] == "length_check"
         assert "description" in info
+
+    def test_get_algorithm_info_is_cached_until_unregister(self, registry):
+        """알고리즘 정보는 등록 시점에 한 번 만들어 읽기 전용으로 공유."""
+        registry.register(LengthCheckAlgorithm())
+
+        info = registry.get_algorithm_info("length_check")
+        assert registry.get_algorithm_info("length_check") is info
+        with pytest.raises(TypeError):
+            info["name"] = "changed"
+
+        registry.unregister("length_check")
+        with pytest.raises(AlgorithmNotFoundError):
+            registry.get_algorithm_info("length_check")
+
+    def test_criteria_without_marker_is_not_trivial(self, registry):
+        """Judge 생략 표시가 없는 판단 기준은 Judge 호출 대상."""
+        registry.register(LengthCheckAlgorithm())
+
+        assert registry.is_judge_trivial("length_check") is False
+        assert registry.is_judge_trivial("unknown") is False
+
+    def test_judge_skip_requires_marker_and_follows_edits(self, tmp_path):
+        """Judge 생략은 명시적 표시가 있을 때만, 문서 수정 후에는 새 내용 기준."""
+        criteria_file = tmp_path / "length_check.md"
+        criteria_file.write_text("# 길이 검사\n\n항상 통과합니다.\n", encoding="utf-8")
+        registry = AlgorithmRegistry(criteria_path=str(tmp_path))
+        registry.register(LengthCheckAlgorithm())
+
+        # 영어 키워드가 없는 한국어 문서도 표시가 없으면 Judge 호출 대상
+        assert registry.is_judge_trivial("length_check") is False
+
+        criteria_file.write_text("<!-- judge: skip -->\n항상 통과합니다.\n", encoding="utf-8")
+        stat = criteria_file.stat()
+        os.utime(criteria_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert registry.is_judge_trivial("length_check") is True
@@ -1,17 +1,20 @@
 """TextAnalyzer 통합 테스트."""
 
 import pytest
-import os
-import tempfile
 from src import TextAnalyzer
 
 
+@pytest.fixture(scope="module")
+def analyzer():
+    """기본 설정의 TextAnalyzer (설정을 바꾸지 않는 테스트끼리 공유)."""
+    return TextAnalyzer()
+
+
 class TestTextAnalyzer:
     """TextAnalyzer 통합 테스트."""
 
-    def test_analyze_normal_text(self):
+    def test_analyze_normal_text(self, analyzer):
         """정상 텍스트 분석."""
-        analyzer = TextAnalyzer()
         text = "이것은 충분히 긴 정상적인 텍스트입니다. 특별한 문제가 없습니다."
 
         report = analyzer.analyze(text)
@@ -19,9 +22,8 @@ class TestTextAnalyzer:
         assert report.status == "all_passed"
         assert report.has_problem is False
 
-    def test_analyze_short_text(self):
+    def test_analyze_short_text(self, analyzer):
         """짧은 텍스트 분석."""
-        analyzer = TextAnalyzer()
         text = "짧"
 
         report = analyzer.analyze(text)
@@ -29,18 +31,16 @@ class TestTextAnalyzer:
         assert report.has_problem is True
         assert report.stopped_at_algorithm == "length_check"
 
-    def test_analyze_with_forbidden_keywords(self):
+    def test_analyze_with_forbidden_keywords(self, analyzer):
         """금지 키워드 포함 텍스트."""
-        analyzer = TextAnalyzer()
         text = "이 텍스트는 충분히 길지만 광고와 스팸 키워드가 있습니다."
 
         report = analyzer.analyze(text)
 
         assert report.has_problem is True
 
-    def test_report_content_is_markdown(self):
+    def test_report_content_is_markdown(self, analyzer):
         """리포트 내용이 Markdown 형식."""
-        analyzer = TextAnalyzer()
         text = "이것은 테스트 텍스트입니다. 충분히 긴 내용입니다."
 
         report = analyzer.analyze(text)
@@ -48,36 +48,79 @@ class TestTextAnalyzer:
         assert "# 텍스트 분석 리포트" in report.report_content
         assert "## 요약" in report.report_content
 
-    def test_analyze_and_save(self):
+    def test_analyze_and_save(self, tmp_path):
         """리포트 파일 저장."""
         analyzer = TextAnalyzer()
         text = "이것은 테스트 텍스트입니다. 충분히 긴 내용입니다."
+        output_path = tmp_path / "report.md"
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            output_path = f.name
+        analyzer.analyze_and_save(text, str(output_path))
 
-        try:
-            report = analyzer.analyze_and_save(text, output_path)
+        assert output_path.exists()
+        assert "# 텍스트 분석 리포트" in output_path.read_text(encoding="utf-8")
 
-            assert os.path.exists(output_path)
+    def test_reasoning_trace_uses_report_timestamp(self, tmp_path):
+        """추론 과정 파일은 리포트와 같은 생성 시각을 표시."""
+        analyzer = TextAnalyzer()
+        report = analyzer.analyze("이것은 테스트 텍스트입니다. 충분히 긴 내용입니다.")
+        trace_path = tmp_path / "trace.md"
 
-            with open(output_path, "r", encoding="utf-8") as f:
-                content = f.read()
+        analyzer.reporter.save_reasoning_trace(report, str(trace_path))
 
-            assert "# 텍스트 분석 리포트" in content
-        finally:
-            if os.path.exists(output_path):
-                os.unlink(output_path)
+        header = next(line for line in report.report_content.splitlines() if line.startswith("**생성 시각**"))
+        assert header in trace_path.read_text(encoding="utf-8")
+
+    def test_reasoning_trace_reuses_execution_result_json(self, tmp_path, monkeypatch):
+        """리포트에서 직렬화한 실행 결과를 추론 과정 파일에서 재사용."""
+        from src.reporter import reporter as reporter_module
 
-    def test_get_registered_algorithms(self):
-        """등록된 알고리즘 목록."""
         analyzer = TextAnalyzer()
+        report = analyzer.analyze("이것은 테스트 텍스트입니다. 충분히 긴 내용입니다.")
+        calls = []
+        monkeypatch.setattr(reporter_module, "dumps_pretty", lambda obj: calls.append(obj) or "{}")
+
+        analyzer.reporter.save_reasoning_trace(report, str(tmp_path / "trace.md"))
+
+        execution_results = [sr.execution_result for sr in report.step_results]
+        assert not any(obj is result for obj in calls for result in execution_results)
+
+    def test_reasoning_trace_for_report_without_json(self, tmp_path):
+        """Reporter.generate로 만들지 않은 리포트도 실행 결과를 직렬화해 저장."""
+        from src.models import AnalysisReport
+
+        analyzer = TextAnalyzer()
+        generated = analyzer.analyze("이것은 테스트 텍스트입니다. 충분히 긴 내용입니다.")
+        report = AnalysisReport(execution_result=generated.execution_result, report_content="")
+        trace_path = tmp_path / "trace.md"
+
+        analyzer.reporter.save_reasoning_trace(report, str(trace_path))
+
+        trace = trace_path.read_text(encoding="utf-8")
+        assert all(block in trace for block in generated.execution_result_json)
+
+    def test_get_registered_algorithms(self, analyzer):
+        """등록된 알고리즘 목록."""
 
         algorithms = analyzer.get_registered_algorithms()
 
         assert "length_check" in algorithms
         assert "keyword_check" in algorithms
 
+    def test_default_order_runs_cheapest_first(self, analyzer):
+        """순서를 지정하지 않으면 cost_hint가 낮은 알고리즘부터 실행."""
+
+        assert analyzer.algorithm_order == ["length_check", "keyword_check"]
+
+    def test_no_early_exit_plans_independent_steps(self, analyzer):
+        """조기 종료를 끄면 단계 간 의존성 없이 계획해 모든 단계가 동시에 실행 가능."""
+        from src.executor import Executor
+
+        text = "이것은 테스트 텍스트입니다. 충분히 긴 내용입니다."
+        concurrent = TextAnalyzer(early_exit_on_critical=False)
+
+        assert len(Executor._layer_steps(concurrent.planner.create_plan(text).steps)) == 1
+        assert len(Executor._layer_steps(analyzer.planner.create_plan(text).steps)) == 2
+
     def test_custom_algorithm_order(self):
         """커스텀 알고리즘 순서."""
         analyzer = TextAnalyzer(algorithm_order=["keyword_check", "length_check"])
@@ -99,9 +142,8 @@ class TestTextAnalyzer:
         # 조기 종료 없이 모든 알고리즘 실행
         assert report.execution_result.executed_step_count == 2
 
-    def test_step_results_available(self):
+    def test_step_results_available(self, analyzer):
         """단계별 결과 접근."""
-        analyzer = TextAnalyzer()
         text = "이것은 충분히 긴 정상적인 텍스트입니다."
 
         report = analyzer.analyze(text)
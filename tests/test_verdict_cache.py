@@ -0,0 +1,95 @@
+"""JudgeCache 테스트."""
+
+import pytest
+from src.algorithms import LengthCheckAlgorithm
+from src.judge import JudgeCache, ReactJudge
+from src.models import JudgmentResult
+from src.registry import AlgorithmRegistry
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """임시 디렉토리의 판단 결과 캐시."""
+    cache = JudgeCache(str(tmp_path / "cache" / "verdicts.db"))
+    yield cache
+    cache.close()
+
+
+def _judgment() -> JudgmentResult:
+    return JudgmentResult(
+        algorithm_name="length_check",
+        has_problem=True,
+        severity="warning",
+        reasoning="too short",
+        summary="Text length issue.",
+        detailed_trace=[{"iteration": 1, "action": "submit_judgment"}]
+    )
+
+
+class TestJudgeCache:
+    """JudgeCache 테스트."""
+
+    def test_put_and_get(self, cache):
+        """저장한 판단 결과 조회."""
+        key = JudgeCache.make_key("openai/gpt-4", "length_check", {"raw_result": 5})
+        cache.put(key, _judgment())
+
+        assert cache.get(key) == _judgment()
+
+    def test_missing_key(self, cache):
+        """저장되지 않은 키는 None."""
+        assert cache.get("missing") is None
+
+    def test_key_ignores_dict_order(self):
+        """실행 결과의 키 순서와 무관한 캐시 키."""
+        first = JudgeCache.make_key("ns", "length_check", {"a": 1, "b": 2})
+        second = JudgeCache.make_key("ns", "length_check", {"b": 2, "a": 1})
+        other = JudgeCache.make_key("other", "length_check", {"a": 1, "b": 2})
+
+        assert first == second
+        assert first != other
+
+    def test_memory_lru_serves_recent_keys(self, tmp_path):
+        """최근 판단은 메모리에서 조회하고 크기를 넘으면 오래된 것부터 제거."""
+        cache = JudgeCache(str(tmp_path / "verdicts.db"), memory_size=1)
+        cache.put("first", _judgment())
+        cache.put("second", _judgment())
+        cache._conn.execute("DELETE FROM verdicts")
+
+        assert cache.get("second") == _judgment()
+        assert cache.get("first") is None
+        cache.close()
+
+    def test_key_includes_prompt_version(self, cache, monkeypatch):
+        """프롬프트 버전이 바뀌면 다른 캐시 키."""
+        registry = AlgorithmRegistry(criteria_path="src/criteria")
+        registry.register(LengthCheckAlgorithm())
+        judge = ReactJudge(registry=registry, api_key="test-key", verdict_cache=cache)
+        before = judge._verdict_cache_key("length_check", {"raw_result": 5})
+        monkeypatch.setattr("src.judge.react_judge.PROMPT_VERSION", "v-next")
+
+        assert judge._verdict_cache_key("length_check", {"raw_result": 5}) != before
+
+    def test_react_judge_uses_cached_judgment(self, cache):
+        """캐시에 판단이 있으면 LLM 호출 없이 반환."""
+        registry = AlgorithmRegistry(criteria_path="src/criteria")
+        registry.register(LengthCheckAlgorithm())
+        judge = ReactJudge(registry=registry, api_key="test-key", verdict_cache=cache)
+        execution_result = {"raw_result": 5, "is_within_range": False}
+        cache.put(judge._verdict_cache_key("length_check", execution_result), _judgment())
+
+        assert judge.evaluate("length_check", execution_result) == _judgment()
+
+    def test_nonzero_temperature_skips_cache(self, cache):
+        """temperature가 0이 아니면 캐시된 판단을 사용하지 않음."""
+        registry = AlgorithmRegistry(criteria_path="src/criteria")
+        registry.register(LengthCheckAlgorithm())
+        judge = ReactJudge(registry=registry, api_key="test-key", temperature=0.7, verdict_cache=cache)
+        execution_result = {"raw_result": 5, "is_within_range": False}
+        cache.put(judge._verdict_cache_key("length_check", execution_result), _judgment())
+        calls = []
+        judge._call_llm = lambda messages, llm=None: calls.append(messages)
+        judge.max_iterations = 1
+
+        assert judge.evaluate("length_check", execution_result) != _judgment()
+        assert calls